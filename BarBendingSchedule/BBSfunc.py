@@ -33,7 +33,6 @@ from typing import (
     Tuple,
     Union,
 )
-from xml.dom import minidom
 from xml.etree import ElementTree
 
 import FreeCAD
@@ -46,16 +45,23 @@ from BillOfMaterial.BOMfunc import (
     fixColumnUnits,
 )
 from BillOfMaterial.BillOfMaterial_SVG import makeBillOfMaterialSVG
+from RebarProfiling import profiled
 from RebarShapeCutList.RebarShapeCutListfunc import (
     getBaseRebarsList,
     getRebarShapeCutList,
 )
-from SVGfunc import getSVGRootElement, getSVGRectangle, getSVGDataCell
+from SVGfunc import (
+    getSVGRootElement,
+    getSVGRectangle,
+    getSVGDataCell,
+    writeSVG,
+)
 
 
 # TODO: Use(Uncomment) typing.Literal for minimum python3.8
 
 
+@profiled
 def getBarBendingSchedule(
     rebar_objects: Optional[List] = None,
     # column_headers: Optional[
@@ -105,6 +111,7 @@ def getBarBendingSchedule(
     ] = (45, 90, 180),
     helical_rebar_dimension_label_format: str = "%L,r=%R,pitch=%P",
     output_file: Optional[str] = None,
+    pretty_print: bool = True,
 ) -> ElementTree.Element:
     """Generate Bar Bending Schedule svg.
 
@@ -218,6 +225,9 @@ def getBarBendingSchedule(
         Default is "%L,r=%R,pitch=%P".
     output_file: str, optional
         The output file to write generated svg.
+    pretty_print: bool, optional
+        If True, then svg written to output_file will be pretty printed.
+        Default is True.
 
     Returns
     -------
@@ -334,15 +344,12 @@ def getBarBendingSchedule(
     svg.set("viewBox", "0 0 {} {}".format(svg_width, bom_height))
 
     if output_file:
-        svg_sheet = minidom.parseString(
-            ElementTree.tostring(svg, encoding="unicode")
-        ).toprettyxml(indent="  ")
         try:
             with open(output_file, "w", encoding="utf-8") as svg_output_file:
-                svg_output_file.write(svg_sheet)
+                writeSVG(svg, svg_output_file, pretty_print)
         except OSError:
             FreeCAD.Console.PrintError(
-                "Error writing svg to file " + str(svg_output_file) + "\n"
+                "Error writing svg to file " + str(output_file) + "\n"
             )
 
     return svg
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Reinforcement Workbench contributors             *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Headless batch export of Bill Of Material, Bar Bending Schedule, Rebar
+Shape Cut List and Reinforcement Drawings from FreeCAD documents.
+
+Usage with FreeCAD console:
+    freecadcmd -c "import BatchExport; BatchExport.main(['a.FCStd',
+        'b.FCStd', '--output-dir', 'schedules', '--jobs', '4'])"
+
+Or with python, having FreeCAD lib directory in PYTHONPATH:
+    python BatchExport.py a.FCStd b.FCStd --output-dir schedules --jobs 4
+"""
+
+__title__ = "Batch Export"
+__author__ = "Reinforcement Workbench contributors"
+__url__ = "https://www.freecadweb.org"
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import FreeCAD
+
+OUTPUTS = ("BOM", "BBS", "RebarShapeCutList", "ReinforcementDrawing")
+DRAWING_VIEWS = ("Front", "Rear", "Left", "Right", "Top", "Bottom")
+REPORT_FILE = "BatchExportReport.json"
+
+
+def exportBOM(output_dir, font_filename=None):
+    """exportBOM(OutputDir, [FontFilename]):
+    Export Bill Of Material svg of active document to OutputDir and return
+    list of written files."""
+    from BillOfMaterial.BillOfMaterial_SVG import makeBillOfMaterialSVG
+
+    output_file = str(Path(output_dir) / "BillOfMaterial.svg")
+    if (
+        makeBillOfMaterialSVG(
+            font_filename=font_filename, output_file=output_file
+        )
+        is None
+    ):
+        return []
+    return [output_file]
+
+
+def exportBBS(output_dir):
+    """exportBBS(OutputDir):
+    Export Bar Bending Schedule svg of active document to OutputDir and return
+    list of written files."""
+    from BarBendingSchedule.BBSfunc import getBarBendingSchedule
+
+    output_file = str(Path(output_dir) / "BarBendingSchedule.svg")
+    if getBarBendingSchedule(output_file=output_file) is None:
+        return []
+    return [output_file]
+
+
+def exportRebarShapeCutList(output_dir):
+    """exportRebarShapeCutList(OutputDir):
+    Export Rebar Shape Cut List svg of active document to OutputDir and return
+    list of written files."""
+    from RebarShapeCutList.RebarShapeCutListfunc import getRebarShapeCutList
+
+    output_file = str(Path(output_dir) / "RebarShapeCutList.svg")
+    if getRebarShapeCutList(output_file=output_file) is None:
+        return []
+    return [output_file]
+
+
+def exportReinforcementDrawings(output_dir, views=("Front",)):
+    """exportReinforcementDrawings(OutputDir, [Views]):
+    Export reinforcement drawing svg of each structure of active document for
+    each view in Views to OutputDir and return list of written files."""
+    from ReinforcementDrawing.make_reinforcement_drawing import (
+        makeStructuresReinforcementDrawings,
+    )
+
+    output_files = []
+    view_drawing_pages_dict = makeStructuresReinforcementDrawings(views=views)
+    if not view_drawing_pages_dict:
+        return output_files
+    for view, struct_drawing_page_dict in view_drawing_pages_dict.items():
+        for structure, drawing_page in struct_drawing_page_dict.items():
+            output_file = str(
+                Path(output_dir)
+                / "ReinforcementDrawing_{}_{}.svg".format(structure.Name, view)
+            )
+            with open(output_file, "w", encoding="utf-8") as svg_output_file:
+                svg_output_file.write(drawing_page.Views[0].Symbol)
+            output_files.append(output_file)
+    return output_files
+
+
+def exportDocument(
+    file_path,
+    output_dir,
+    outputs=OUTPUTS,
+    views=("Front",),
+    font_filename=None,
+):
+    """exportDocument(FilePath, OutputDir, [Outputs, Views, FontFilename]):
+    Open FreeCAD document FilePath, export outputs to sub directory of
+    OutputDir named after document file and close document without saving.
+
+    outputs is the list of outputs to export from OUTPUTS.
+
+    views is the list of reinforcement drawing views from DRAWING_VIEWS.
+
+    font_filename is the font file used by Bill Of Material to calculate
+    width of text in console mode.
+
+    Returns report dictionary with format:
+    {
+        "File": file_path,
+        "OutputFiles": [output_file_1, output_file_2, ...],
+        "Timings": {"Open": time, output: time, ..., "Total": time},
+        "Errors": {output: error_message, ...},
+    }
+    """
+    report = {
+        "File": str(file_path),
+        "OutputFiles": [],
+        "Timings": {},
+        "Errors": {},
+    }
+    document_output_dir = Path(output_dir) / Path(file_path).stem
+    document_output_dir.mkdir(parents=True, exist_ok=True)
+
+    start_time = time.perf_counter()
+    try:
+        document = FreeCAD.openDocument(str(file_path))
+    except Exception:
+        report["Errors"]["Open"] = traceback.format_exc()
+        FreeCAD.Console.PrintError(
+            "Error opening document " + str(file_path) + "\n"
+        )
+        return report
+    FreeCAD.setActiveDocument(document.Name)
+    report["Timings"]["Open"] = time.perf_counter() - start_time
+
+    export_functions = {
+        "BOM": lambda: exportBOM(document_output_dir, font_filename),
+        "BBS": lambda: exportBBS(document_output_dir),
+        "RebarShapeCutList": lambda: exportRebarShapeCutList(
+            document_output_dir
+        ),
+        "ReinforcementDrawing": lambda: exportReinforcementDrawings(
+            document_output_dir, views
+        ),
+    }
+    try:
+        for output in outputs:
+            output_start_time = time.perf_counter()
+            try:
+                report["OutputFiles"].extend(export_functions[output]())
+            except Exception:
+                report["Errors"][output] = traceback.format_exc()
+                FreeCAD.Console.PrintError(
+                    "Error exporting {} of document {}\n".format(
+                        output, file_path
+                    )
+                )
+            report["Timings"][output] = time.perf_counter() - output_start_time
+    finally:
+        FreeCAD.closeDocument(document.Name)
+    report["Timings"]["Total"] = time.perf_counter() - start_time
+    return report
+
+
+def _exportDocument(args):
+    return exportDocument(*args)
+
+
+def batchExport(
+    file_paths,
+    output_dir,
+    outputs=OUTPUTS,
+    views=("Front",),
+    font_filename=None,
+    jobs=1,
+):
+    """batchExport(FilePaths, OutputDir, [Outputs, Views, FontFilename,
+    Jobs]):
+    Export outputs of each FreeCAD document in FilePaths to OutputDir, using
+    exportDocument(), and write timing report of all documents to
+    REPORT_FILE in OutputDir.
+
+    jobs is the number of worker processes to export documents in parallel.
+    Worker processes are forked from current process, so they are only used
+    in console mode and where fork is supported. If a worker process fails,
+    e.g. it crashes, the error is recorded under "Worker" key of report of
+    each affected document.
+
+    Returns list of report dictionaries, in order of file_paths.
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    jobs = min(jobs, len(file_paths))
+    if jobs > 1 and FreeCAD.GuiUp:
+        FreeCAD.Console.PrintWarning(
+            "Worker processes are not supported in gui mode. Exporting "
+            "documents in current process.\n"
+        )
+        jobs = 1
+    elif jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        FreeCAD.Console.PrintWarning(
+            "Worker processes are not supported on this platform. Exporting "
+            "documents in current process.\n"
+        )
+        jobs = 1
+
+    args_list = [
+        (file_path, output_dir, outputs, views, font_filename)
+        for file_path in file_paths
+    ]
+    start_time = time.perf_counter()
+    if jobs <= 1:
+        reports = [_exportDocument(args) for args in args_list]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = [
+                executor.submit(_exportDocument, args) for args in args_list
+            ]
+            reports = []
+            for file_path, future in zip(file_paths, futures):
+                try:
+                    reports.append(future.result())
+                except Exception:
+                    reports.append(
+                        {
+                            "File": str(file_path),
+                            "OutputFiles": [],
+                            "Timings": {},
+                            "Errors": {"Worker": traceback.format_exc()},
+                        }
+                    )
+                    FreeCAD.Console.PrintError(
+                        "Error in worker process exporting document "
+                        + str(file_path)
+                        + "\n"
+                    )
+    total_time = time.perf_counter() - start_time
+
+    report_file = Path(output_dir) / REPORT_FILE
+    with open(report_file, "w", encoding="utf-8") as report_output_file:
+        json.dump(
+            {"Jobs": jobs, "TotalTime": total_time, "Documents": reports},
+            report_output_file,
+            indent=2,
+        )
+
+    for report in reports:
+        FreeCAD.Console.PrintMessage(
+            "{}: {:.3f}s{}\n".format(
+                report["File"],
+                report["Timings"].get("Total", 0),
+                (
+                    ", failed: " + ", ".join(report["Errors"])
+                    if report["Errors"]
+                    else ""
+                ),
+            )
+        )
+    FreeCAD.Console.PrintMessage(
+        "Exported {} document(s) in {:.3f}s, report written to {}\n".format(
+            len(reports), total_time, report_file
+        )
+    )
+    return reports
+
+
+def main(argv=None):
+    """main([Argv]): Command line entry point of batch export. Returns exit
+    status, which is non zero if export of any document failed."""
+    parser = argparse.ArgumentParser(
+        prog="BatchExport",
+        description="Export BOM, BBS, rebar shape cut list and reinforcement "
+        "drawings from FreeCAD documents.",
+    )
+    parser.add_argument("files", nargs="+", help="FreeCAD .FCStd files")
+    parser.add_argument(
+        "-o", "--output-dir", default="RebarExport", help="Output directory"
+    )
+    parser.add_argument(
+        "--outputs",
+        nargs="+",
+        choices=OUTPUTS,
+        default=list(OUTPUTS),
+        help="Outputs to export",
+    )
+    parser.add_argument(
+        "--views",
+        nargs="+",
+        choices=DRAWING_VIEWS,
+        default=["Front"],
+        help="Reinforcement drawing views",
+    )
+    parser.add_argument(
+        "--font-file", help="Font file used by BOM to measure text width"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of documents to export in parallel",
+    )
+    args = parser.parse_args(argv)
+
+    reports = batchExport(
+        args.files,
+        args.output_dir,
+        args.outputs,
+        args.views,
+        args.font_file,
+        args.jobs,
+    )
+    return 1 if any(report["Errors"] for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
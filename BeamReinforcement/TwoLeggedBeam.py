@@ -38,7 +38,11 @@ from Rebarfunc import (
     _BeamReinforcementGroup,
     _ViewProviderBeamReinforcementGroup,
     setGroupProperties,
+    batch_recompute,
+    recompute,
+    makeReinforcementOfStructures,
 )
+from RebarProfiling import profiled
 from Stirrup import makeStirrup, editStirrup
 from StraightRebar import makeStraightRebar, editStraightRebar
 
@@ -362,6 +366,8 @@ def getHookOrientationListofShearRebars(
     return hook_orientation_list
 
 
+@profiled
+@batch_recompute()
 def makeReinforcement(
     l_cover_of_stirrup,
     r_cover_of_stirrup,
@@ -515,6 +521,19 @@ def makeReinforcement(
         )
     )
 
+    # Parse number_diameter_offset strings once here, top/bottom/left/right
+    # reinforcement functions take parsed form along with strings
+    left_rebars_number_diameter_offset_tuple = (
+        gettupleOfNumberDiameterOffset(left_rebars_number_diameter_offset)
+        if left_rebars_number_diameter_offset
+        else ()
+    )
+    right_rebars_number_diameter_offset_tuple = (
+        gettupleOfNumberDiameterOffset(right_rebars_number_diameter_offset)
+        if right_rebars_number_diameter_offset
+        else ()
+    )
+
     max_dia_of_main_rebars = max(
         top_reinforcement_number_diameter_offset_dict["layer1"][0][1],
         top_reinforcement_number_diameter_offset_dict["layer1"][-1][1],
@@ -570,6 +589,7 @@ def makeReinforcement(
         offset_of_stirrup,
         dia_of_stirrup,
         top_reinforcement_number_diameter_offset,
+        top_reinforcement_number_diameter_offset_dict,
         top_reinforcement_rebar_type,
         top_reinforcement_layer_spacing,
         top_reinforcement_l_rebar_rounding,
@@ -589,6 +609,7 @@ def makeReinforcement(
         offset_of_stirrup,
         dia_of_stirrup,
         bottom_reinforcement_number_diameter_offset,
+        bottom_reinforcement_number_diameter_offset_dict,
         bottom_reinforcement_rebar_type,
         bottom_reinforcement_layer_spacing,
         bottom_reinforcement_l_rebar_rounding,
@@ -604,6 +625,7 @@ def makeReinforcement(
         l_cover_of_stirrup,
         dia_of_stirrup,
         left_rebars_number_diameter_offset,
+        left_rebars_number_diameter_offset_tuple,
         left_rebars_type,
         left_rebars_spacing,
         left_l_rebar_rounding,
@@ -619,6 +641,7 @@ def makeReinforcement(
         r_cover_of_stirrup,
         dia_of_stirrup,
         right_rebars_number_diameter_offset,
+        right_rebars_number_diameter_offset_tuple,
         right_rebars_type,
         right_rebars_spacing,
         right_l_rebar_rounding,
@@ -633,10 +656,27 @@ def makeReinforcement(
             TwoLeggedBeam.shear_reinforcement_group.Name
         )
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return TwoLeggedBeam.Object
 
 
+def makeReinforcements(structure_facename_list, **config):
+    """makeReinforcements(StructureFacenameList, **Config):
+    Adds the Two Legged Stirrup reinforcement to each (structure, facename) in
+    structure_facename_list, with keyword arguments of makeReinforcement()
+    from config shared by all structures. Each structure must appear only once
+    in structure_facename_list. Document is recomputed only once, after all
+    structures are reinforced.
+
+    Returns dictionary with structure as key and created reinforcement group
+    (None on error) as value.
+    """
+    return makeReinforcementOfStructures(
+        makeReinforcement, structure_facename_list, config
+    )
+
+
+@batch_recompute()
 def makeTopReinforcement(
     obj,
     l_cover_of_stirrup,
@@ -646,6 +686,7 @@ def makeTopReinforcement(
     offset_of_stirrup,
     dia_of_stirrup,
     top_reinforcement_number_diameter_offset,
+    top_reinforcement_number_diameter_offset_dict,
     top_reinforcement_rebar_type,
     top_reinforcement_layer_spacing,
     top_reinforcement_l_rebar_rounding,
@@ -660,10 +701,6 @@ def makeTopReinforcement(
 
     top_reinforcement_layers = len(top_reinforcement_number_diameter_offset)
 
-    top_reinforcement_number_diameter_offset_dict = (
-        getdictofNumberDiameterOffset(top_reinforcement_number_diameter_offset)
-    )
-
     top_reinforcement_layer_spacing = getLayerSpacing(
         top_reinforcement_layers, top_reinforcement_layer_spacing
     )
@@ -825,7 +862,7 @@ def makeTopReinforcement(
                 + number * spacing_in_top_reinforcement[layer - 1]
             )
         layer += 1
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     obj.addObjects(top_reinforcement_rebars)
     prev_top_reinforcement_rebars = obj.TopRebars
@@ -841,6 +878,7 @@ def makeTopReinforcement(
     return top_reinforcement_rebars
 
 
+@batch_recompute()
 def makeBottomReinforcement(
     obj,
     l_cover_of_stirrup,
@@ -850,6 +888,7 @@ def makeBottomReinforcement(
     offset_of_stirrup,
     dia_of_stirrup,
     bottom_reinforcement_number_diameter_offset,
+    bottom_reinforcement_number_diameter_offset_dict,
     bottom_reinforcement_rebar_type,
     bottom_reinforcement_layer_spacing,
     bottom_reinforcement_l_rebar_rounding,
@@ -866,12 +905,6 @@ def makeBottomReinforcement(
         bottom_reinforcement_number_diameter_offset
     )
 
-    bottom_reinforcement_number_diameter_offset_dict = (
-        getdictofNumberDiameterOffset(
-            bottom_reinforcement_number_diameter_offset
-        )
-    )
-
     bottom_reinforcement_layer_spacing = getLayerSpacing(
         bottom_reinforcement_layers, bottom_reinforcement_layer_spacing
     )
@@ -1048,7 +1081,7 @@ def makeBottomReinforcement(
                 + number * spacing_in_bottom_reinforcement[layer - 1]
             )
         layer += 1
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     obj.addObjects(bottom_reinforcement_rebars)
     prev_bottom_reinforcement_rebars = obj.BottomRebars
@@ -1064,11 +1097,13 @@ def makeBottomReinforcement(
     return bottom_reinforcement_rebars
 
 
+@batch_recompute()
 def makeLeftReinforcement(
     obj,
     l_cover_of_stirrup,
     dia_of_stirrup,
     left_rebars_number_diameter_offset,
+    left_rebars_number_diameter_offset_tuple,
     left_rebars_type,
     left_rebars_spacing,
     left_l_rebar_rounding,
@@ -1090,10 +1125,6 @@ def makeLeftReinforcement(
     face_length = FacePRM[0][0]
     face_width = FacePRM[0][1]
 
-    left_rebars_number_diameter_offset_tuple = gettupleOfNumberDiameterOffset(
-        left_rebars_number_diameter_offset
-    )
-
     left_rebars_type_list = getRebarTypeListofShearRebars(
         left_rebars_number_diameter_offset_tuple, left_rebars_type
     )
@@ -1218,7 +1249,7 @@ def makeLeftReinforcement(
             )
         left_reinforcement_rebars[-1].OffsetEnd = rear_cover + diameter / 2
         left_rebars_f_cover += number * diameter + number * left_rebars_spacing
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     obj.addObjects(left_reinforcement_rebars)
     prev_left_reinforcement_rebars = obj.LeftRebars
@@ -1231,15 +1262,17 @@ def makeLeftReinforcement(
     obj.HookExtension = left_rebars_hook_extension_list
     obj.HookOrientation = left_rebars_hook_orientation_list
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return left_reinforcement_rebars
 
 
+@batch_recompute()
 def makeRightReinforcement(
     obj,
     r_cover_of_stirrup,
     dia_of_stirrup,
     right_rebars_number_diameter_offset,
+    right_rebars_number_diameter_offset_tuple,
     right_rebars_type,
     right_rebars_spacing,
     right_l_rebar_rounding,
@@ -1261,10 +1294,6 @@ def makeRightReinforcement(
     face_length = FacePRM[0][0]
     face_width = FacePRM[0][1]
 
-    right_rebars_number_diameter_offset_tuple = gettupleOfNumberDiameterOffset(
-        right_rebars_number_diameter_offset
-    )
-
     right_rebars_type_list = getRebarTypeListofShearRebars(
         right_rebars_number_diameter_offset_tuple, right_rebars_type
     )
@@ -1391,7 +1420,7 @@ def makeRightReinforcement(
         right_rebars_f_cover += (
             number * diameter + number * right_rebars_spacing
         )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     obj.addObjects(right_reinforcement_rebars)
     prev_right_reinforcement_rebars = obj.RightRebars
@@ -1404,10 +1433,12 @@ def makeRightReinforcement(
     obj.HookExtension = right_rebars_hook_extension_list
     obj.HookOrientation = right_rebars_hook_orientation_list
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return right_reinforcement_rebars
 
 
+@profiled
+@batch_recompute()
 def editReinforcement(
     rebar_group,
     l_cover_of_stirrup,
@@ -1563,6 +1594,19 @@ def editReinforcement(
         )
     )
 
+    # Parse number_diameter_offset strings once here, top/bottom/left/right
+    # reinforcement functions take parsed form along with strings
+    left_rebars_number_diameter_offset_tuple = (
+        gettupleOfNumberDiameterOffset(left_rebars_number_diameter_offset)
+        if left_rebars_number_diameter_offset
+        else ()
+    )
+    right_rebars_number_diameter_offset_tuple = (
+        gettupleOfNumberDiameterOffset(right_rebars_number_diameter_offset)
+        if right_rebars_number_diameter_offset
+        else ()
+    )
+
     max_dia_of_main_rebars = max(
         top_reinforcement_number_diameter_offset_dict["layer1"][0][1],
         top_reinforcement_number_diameter_offset_dict["layer1"][-1][1],
@@ -1646,7 +1690,7 @@ def editReinforcement(
             base_name = Rebar.Base.Name
             FreeCAD.ActiveDocument.removeObject(Rebar.Name)
             FreeCAD.ActiveDocument.removeObject(base_name)
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
 
         makeTopReinforcement(
             top_reinforcement_group,
@@ -1657,6 +1701,7 @@ def editReinforcement(
             offset_of_stirrup,
             dia_of_stirrup,
             top_reinforcement_number_diameter_offset,
+            top_reinforcement_number_diameter_offset_dict,
             top_reinforcement_rebar_type,
             top_reinforcement_layer_spacing,
             top_reinforcement_l_rebar_rounding,
@@ -1675,6 +1720,7 @@ def editReinforcement(
             offset_of_stirrup,
             dia_of_stirrup,
             top_reinforcement_number_diameter_offset,
+            top_reinforcement_number_diameter_offset_dict,
             top_reinforcement_rebar_type,
             top_reinforcement_layer_spacing,
             top_reinforcement_l_rebar_rounding,
@@ -1689,7 +1735,7 @@ def editReinforcement(
             base_name = Rebar.Base.Name
             FreeCAD.ActiveDocument.removeObject(Rebar.Name)
             FreeCAD.ActiveDocument.removeObject(base_name)
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
 
         makeBottomReinforcement(
             bottom_reinforcement_group,
@@ -1700,6 +1746,7 @@ def editReinforcement(
             offset_of_stirrup,
             dia_of_stirrup,
             bottom_reinforcement_number_diameter_offset,
+            bottom_reinforcement_number_diameter_offset_dict,
             bottom_reinforcement_rebar_type,
             bottom_reinforcement_layer_spacing,
             bottom_reinforcement_l_rebar_rounding,
@@ -1718,6 +1765,7 @@ def editReinforcement(
             offset_of_stirrup,
             dia_of_stirrup,
             bottom_reinforcement_number_diameter_offset,
+            bottom_reinforcement_number_diameter_offset_dict,
             bottom_reinforcement_rebar_type,
             bottom_reinforcement_layer_spacing,
             bottom_reinforcement_l_rebar_rounding,
@@ -1752,11 +1800,8 @@ def editReinforcement(
             ),
         ]
         setGroupProperties(properties, shear_reinforcement_group)
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
     if left_rebars_group and left_rebars_number_diameter_offset:
-        left_rebars_number_diameter_offset_tuple = (
-            gettupleOfNumberDiameterOffset(left_rebars_number_diameter_offset)
-        )
         prev_left_rebars_type = left_rebars_group.RebarType
         if prev_left_rebars_type != getRebarTypeListofShearRebars(
             left_rebars_number_diameter_offset_tuple, left_rebars_type
@@ -1773,7 +1818,7 @@ def editReinforcement(
                 base_name = Rebar.Base.Name
                 FreeCAD.ActiveDocument.removeObject(Rebar.Name)
                 FreeCAD.ActiveDocument.removeObject(base_name)
-            FreeCAD.ActiveDocument.recompute()
+            recompute()
         elif left_rebars_number_diameter_offset:
             left_rebars_group = shear_reinforcement_group.newObject(
                 "App::DocumentObjectGroupPython", "LeftRebars"
@@ -1801,6 +1846,7 @@ def editReinforcement(
             l_cover_of_stirrup,
             dia_of_stirrup,
             left_rebars_number_diameter_offset,
+            left_rebars_number_diameter_offset_tuple,
             left_rebars_type,
             left_rebars_spacing,
             left_l_rebar_rounding,
@@ -1815,6 +1861,7 @@ def editReinforcement(
             l_cover_of_stirrup,
             dia_of_stirrup,
             left_rebars_number_diameter_offset,
+            left_rebars_number_diameter_offset_tuple,
             left_rebars_type,
             left_rebars_spacing,
             left_l_rebar_rounding,
@@ -1825,9 +1872,6 @@ def editReinforcement(
         )
 
     if right_rebars_group and right_rebars_number_diameter_offset:
-        right_rebars_number_diameter_offset_tuple = (
-            gettupleOfNumberDiameterOffset(right_rebars_number_diameter_offset)
-        )
         prev_right_rebars_type = right_rebars_group.RebarType
         if prev_right_rebars_type != getRebarTypeListofShearRebars(
             right_rebars_number_diameter_offset_tuple, right_rebars_type
@@ -1844,7 +1888,7 @@ def editReinforcement(
                 base_name = Rebar.Base.Name
                 FreeCAD.ActiveDocument.removeObject(Rebar.Name)
                 FreeCAD.ActiveDocument.removeObject(base_name)
-            FreeCAD.ActiveDocument.recompute()
+            recompute()
         elif right_rebars_number_diameter_offset:
             right_rebars_group = shear_reinforcement_group.newObject(
                 "App::DocumentObjectGroupPython", "RightRebars"
@@ -1872,6 +1916,7 @@ def editReinforcement(
             l_cover_of_stirrup,
             dia_of_stirrup,
             right_rebars_number_diameter_offset,
+            right_rebars_number_diameter_offset_tuple,
             right_rebars_type,
             right_rebars_spacing,
             right_l_rebar_rounding,
@@ -1886,6 +1931,7 @@ def editReinforcement(
             l_cover_of_stirrup,
             dia_of_stirrup,
             right_rebars_number_diameter_offset,
+            right_rebars_number_diameter_offset_tuple,
             right_rebars_type,
             right_rebars_spacing,
             right_l_rebar_rounding,
@@ -1904,10 +1950,11 @@ def editReinforcement(
                 FreeCAD.ActiveDocument.removeObject(tmp_rebar_group.Name)
                 break
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar_group
 
 
+@batch_recompute()
 def editTopReinforcement(
     top_reinforcement_group,
     l_cover_of_stirrup,
@@ -1917,6 +1964,7 @@ def editTopReinforcement(
     offset_of_stirrup,
     dia_of_stirrup,
     top_reinforcement_number_diameter_offset,
+    top_reinforcement_number_diameter_offset_dict,
     top_reinforcement_rebar_type,
     top_reinforcement_layer_spacing,
     top_reinforcement_l_rebar_rounding,
@@ -1931,10 +1979,6 @@ def editTopReinforcement(
 
     top_reinforcement_layers = len(top_reinforcement_number_diameter_offset)
 
-    top_reinforcement_number_diameter_offset_dict = (
-        getdictofNumberDiameterOffset(top_reinforcement_number_diameter_offset)
-    )
-
     top_reinforcement_layer_spacing = getLayerSpacing(
         top_reinforcement_layers, top_reinforcement_layer_spacing
     )
@@ -2096,7 +2140,7 @@ def editTopReinforcement(
             )
             index += 1
         layer += 1
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     top_reinforcement_group.NumberDiameterOffset = (
         top_reinforcement_number_diameter_offset
@@ -2110,9 +2154,10 @@ def editTopReinforcement(
         top_reinforcement_hook_orientation_list
     )
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
 
+@batch_recompute()
 def editBottomReinforcement(
     bottom_reinforcement_group,
     l_cover_of_stirrup,
@@ -2122,6 +2167,7 @@ def editBottomReinforcement(
     offset_of_stirrup,
     dia_of_stirrup,
     bottom_reinforcement_number_diameter_offset,
+    bottom_reinforcement_number_diameter_offset_dict,
     bottom_reinforcement_rebar_type,
     bottom_reinforcement_layer_spacing,
     bottom_reinforcement_l_rebar_rounding,
@@ -2138,12 +2184,6 @@ def editBottomReinforcement(
         bottom_reinforcement_number_diameter_offset
     )
 
-    bottom_reinforcement_number_diameter_offset_dict = (
-        getdictofNumberDiameterOffset(
-            bottom_reinforcement_number_diameter_offset
-        )
-    )
-
     bottom_reinforcement_layer_spacing = getLayerSpacing(
         bottom_reinforcement_layers, bottom_reinforcement_layer_spacing
     )
@@ -2318,7 +2358,7 @@ def editBottomReinforcement(
             )
             index += 1
         layer += 1
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     bottom_reinforcement_group.NumberDiameterOffset = (
         bottom_reinforcement_number_diameter_offset
@@ -2334,14 +2374,16 @@ def editBottomReinforcement(
         bottom_reinforcement_hook_orientation_list
     )
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
 
+@batch_recompute()
 def editLeftReinforcement(
     left_rebars_group,
     l_cover_of_stirrup,
     dia_of_stirrup,
     left_rebars_number_diameter_offset,
+    left_rebars_number_diameter_offset_tuple,
     left_rebars_type,
     left_rebars_spacing,
     left_l_rebar_rounding,
@@ -2362,10 +2404,6 @@ def editLeftReinforcement(
     face_length = FacePRM[0][0]
     face_width = FacePRM[0][1]
 
-    left_rebars_number_diameter_offset_tuple = gettupleOfNumberDiameterOffset(
-        left_rebars_number_diameter_offset
-    )
-
     left_rebars_type_list = getRebarTypeListofShearRebars(
         left_rebars_number_diameter_offset_tuple, left_rebars_type
     )
@@ -2488,7 +2526,7 @@ def editLeftReinforcement(
             )
         left_reinforcement_rebars[i].OffsetEnd = rear_cover + diameter / 2
         left_rebars_f_cover += number * diameter + number * left_rebars_spacing
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     left_rebars_group.NumberDiameterOffset = left_rebars_number_diameter_offset
     left_rebars_group.RebarType = left_rebars_type_list
@@ -2496,14 +2534,16 @@ def editLeftReinforcement(
     left_rebars_group.HookExtension = left_rebars_hook_extension_list
     left_rebars_group.HookOrientation = left_rebars_hook_orientation_list
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
 
+@batch_recompute()
 def editRightReinforcement(
     right_rebars_group,
     r_cover_of_stirrup,
     dia_of_stirrup,
     right_rebars_number_diameter_offset,
+    right_rebars_number_diameter_offset_tuple,
     right_rebars_type,
     right_rebars_spacing,
     right_l_rebar_rounding,
@@ -2524,10 +2564,6 @@ def editRightReinforcement(
     face_length = FacePRM[0][0]
     face_width = FacePRM[0][1]
 
-    right_rebars_number_diameter_offset_tuple = gettupleOfNumberDiameterOffset(
-        right_rebars_number_diameter_offset
-    )
-
     right_rebars_type_list = getRebarTypeListofShearRebars(
         right_rebars_number_diameter_offset_tuple, right_rebars_type
     )
@@ -2652,7 +2688,7 @@ def editRightReinforcement(
         right_rebars_f_cover += (
             number * diameter + number * right_rebars_spacing
         )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     right_rebars_group.NumberDiameterOffset = (
         right_rebars_number_diameter_offset
@@ -2662,7 +2698,7 @@ def editRightReinforcement(
     right_rebars_group.HookExtension = right_rebars_hook_extension_list
     right_rebars_group.HookOrientation = right_rebars_hook_orientation_list
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
 
 class _TwoLeggedBeam(_BeamReinforcementGroup):
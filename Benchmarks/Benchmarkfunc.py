@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Reinforcement Workbench contributors             *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Benchmarks of reinforcement creation, edit and detailing on synthetic
+models at several scales.
+
+Usage with FreeCAD console:
+    freecadcmd -c "from Benchmarks import Benchmarkfunc;
+        Benchmarkfunc.main(['--scales', '1', '4', '16'])"
+"""
+
+__title__ = "Reinforcement Benchmarks"
+__author__ = "Reinforcement Workbench contributors"
+__url__ = "https://www.freecadweb.org"
+
+import argparse
+import json
+import platform
+import time
+import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import FreeCAD
+
+from . import SyntheticModels
+
+BENCHMARK_SCALES = (1, 4, 16)
+BENCHMARK_RESULTS_FILE = "RebarBenchmarkResults.json"
+
+
+@contextmanager
+def measure(timings, errors, name):
+    """measure(Timings, Errors, Name):
+    Context manager to store time taken by its block in timings[name]. If
+    block raises exception, then it is stored in errors[name] and benchmark
+    continues with next block."""
+    start_time = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        errors[name] = traceback.format_exc()
+        FreeCAD.Console.PrintError("Error in benchmark " + name + "\n")
+    timings[name] = time.perf_counter() - start_time
+
+
+def benchmarkHelicalRebarPoints(repeat=5, height=30000, pitch=50, edges=32):
+    """benchmarkHelicalRebarPoints([Repeat, Height, Pitch, Edges]):
+    Returns best of repeat timings of getpointsOfHelicalRebar() for a tall
+    pile with numpy and with python loop, as dictionary with keys "Points",
+    "Numpy" and "Loop"."""
+    import HelicalRebar
+
+    FacePRM = [(900, 900), FreeCAD.Vector(0, 0, height)]
+    args = (FacePRM, 40, 30, 25, pitch, edges, 12, height)
+    args += (FreeCAD.Vector(0, 0, 1),)
+    result = OrderedDict()
+    numpy = HelicalRebar.numpy
+    try:
+        for key, module in (("Numpy", numpy), ("Loop", None)):
+            if key == "Numpy" and module is None:
+                continue
+            HelicalRebar.numpy = module
+            timings = []
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                points = HelicalRebar.getpointsOfHelicalRebar(*args)
+                timings.append(time.perf_counter() - start_time)
+            result["Points"] = len(points)
+            result[key] = min(timings)
+    finally:
+        HelicalRebar.numpy = numpy
+    return result
+
+
+def runBenchmark(
+    scale,
+    footing_grid=2,
+    compact_columns=False,
+    font_filename=None,
+    drawing_views=("Front",),
+):
+    """runBenchmark(Scale, [FootingGrid, CompactColumns, FontFilename,
+    DrawingViews]):
+    Creates new document with scale number of each of slabs, footings (with
+    footing_grid x footing_grid columns), two legged beams and circular
+    columns and measure time taken to create, edit and detail their
+    reinforcement. The document is closed at the end.
+
+    Returns dictionary with format:
+    {
+        "Scale": scale,
+        "Rebars": number_of_rebar_objects,
+        "Objects": number_of_document_objects,
+        "Timings": {phase: time, ...},
+        "Errors": {phase: error_message, ...},
+    }
+    """
+    from BarBendingSchedule.BBSfunc import getBarBendingSchedule
+    from BillOfMaterial.BillOfMaterial_SVG import makeBillOfMaterialSVG
+    from RebarShapeCutList.RebarShapeCutListfunc import getRebarShapeCutList
+    from ReinforcementDrawing.make_reinforcement_drawing import (
+        makeStructuresReinforcementDrawing,
+    )
+
+    timings = OrderedDict()
+    errors = OrderedDict()
+    document = FreeCAD.newDocument("RebarBenchmark")
+    FreeCAD.setActiveDocument(document.Name)
+    try:
+        slabs = SyntheticModels.makeSlabStructures(scale)
+        footings = SyntheticModels.makeFootingStructures(scale, footing_grid)
+        beams = SyntheticModels.makeBeamStructures(scale)
+        columns = SyntheticModels.makeCircularColumnStructures(scale)
+
+        slab_groups = footing_groups = beam_groups = column_groups = []
+        with measure(timings, errors, "SlabCreate"):
+            slab_groups = SyntheticModels.reinforceSlabs(slabs)
+        with measure(timings, errors, "FootingCreate"):
+            footing_groups = SyntheticModels.reinforceFootings(
+                footings, footing_grid
+            )
+        with measure(timings, errors, "BeamCreate"):
+            beam_groups = SyntheticModels.reinforceBeams(beams)
+        with measure(timings, errors, "CircularColumnCreate"):
+            column_groups = SyntheticModels.reinforceCircularColumns(
+                columns, compact_columns
+            )
+
+        with measure(timings, errors, "SlabEdit"):
+            SyntheticModels.editSlabs(slab_groups)
+        with measure(timings, errors, "FootingEdit"):
+            SyntheticModels.editFootings(footing_groups, footing_grid)
+        with measure(timings, errors, "BeamEdit"):
+            SyntheticModels.editBeams(beam_groups)
+        with measure(timings, errors, "CircularColumnEdit"):
+            SyntheticModels.editCircularColumns(column_groups)
+
+        SyntheticModels.assignRebarMarks(document)
+        document.recompute()
+        with measure(timings, errors, "BOM"):
+            makeBillOfMaterialSVG(
+                font_filename=font_filename, return_svg_only=True
+            )
+        with measure(timings, errors, "BBS"):
+            getBarBendingSchedule()
+        with measure(timings, errors, "RebarShapeCutList"):
+            getRebarShapeCutList()
+        for view in drawing_views:
+            with measure(timings, errors, "ReinforcementDrawing" + view):
+                makeStructuresReinforcementDrawing(view=view)
+                document.recompute()
+
+        rebars_count = len(
+            [
+                obj
+                for obj in document.Objects
+                if hasattr(obj, "Amount") and hasattr(obj, "Host")
+            ]
+        )
+        objects_count = len(document.Objects)
+    finally:
+        FreeCAD.closeDocument(document.Name)
+    return OrderedDict(
+        [
+            ("Scale", scale),
+            ("Rebars", rebars_count),
+            ("Objects", objects_count),
+            ("Timings", timings),
+            ("Errors", errors),
+        ]
+    )
+
+
+def runBenchmarks(
+    scales=BENCHMARK_SCALES,
+    output_file=BENCHMARK_RESULTS_FILE,
+    footing_grid=2,
+    compact_columns=False,
+    font_filename=None,
+    drawing_views=("Front",),
+):
+    """runBenchmarks([Scales, OutputFile, FootingGrid, CompactColumns,
+    FontFilename, DrawingViews]):
+    Run runBenchmark() for each scale in scales and
+    benchmarkHelicalRebarPoints() and write results as json to output_file.
+
+    Returns dictionary of results, as written to output_file.
+    """
+    results = OrderedDict(
+        [
+            ("FreeCADVersion", ".".join(FreeCAD.Version()[:3])),
+            ("Python", platform.python_version()),
+            ("Platform", platform.platform()),
+            ("Date", time.strftime("%Y-%m-%dT%H:%M:%S")),
+            ("HelicalRebarPoints", benchmarkHelicalRebarPoints()),
+            ("Scales", []),
+        ]
+    )
+    for scale in scales:
+        FreeCAD.Console.PrintMessage(
+            "Running reinforcement benchmark at scale {}\n".format(scale)
+        )
+        results["Scales"].append(
+            runBenchmark(
+                scale,
+                footing_grid,
+                compact_columns,
+                font_filename,
+                drawing_views,
+            )
+        )
+        for phase, phase_time in results["Scales"][-1]["Timings"].items():
+            FreeCAD.Console.PrintMessage(
+                "    {}: {:.3f}s\n".format(phase, phase_time)
+            )
+
+    if output_file:
+        with open(output_file, "w", encoding="utf-8") as results_file:
+            json.dump(results, results_file, indent=2)
+        FreeCAD.Console.PrintMessage(
+            "Benchmark results written to " + str(output_file) + "\n"
+        )
+    return results
+
+
+def main(argv=None):
+    """main([Argv]): Command line entry point of benchmarks."""
+    parser = argparse.ArgumentParser(
+        prog="Benchmarkfunc",
+        description="Benchmark reinforcement creation, edit and detailing on "
+        "synthetic models.",
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        type=int,
+        default=list(BENCHMARK_SCALES),
+        help="Number of structures of each type to benchmark",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=BENCHMARK_RESULTS_FILE,
+        help="Output json file",
+    )
+    parser.add_argument(
+        "--footing-grid",
+        type=int,
+        default=2,
+        help="Number of columns along each direction of footing",
+    )
+    parser.add_argument(
+        "--compact-columns",
+        action="store_true",
+        help="Create main rebars of circular columns as polar array",
+    )
+    parser.add_argument(
+        "--font-file", help="Font file used by BOM to measure text width"
+    )
+    parser.add_argument(
+        "--views",
+        nargs="+",
+        default=["Front"],
+        help="Reinforcement drawing views",
+    )
+    args = parser.parse_args(argv)
+    runBenchmarks(
+        args.scales,
+        args.output,
+        args.footing_grid,
+        args.compact_columns,
+        args.font_file,
+        args.views,
+    )
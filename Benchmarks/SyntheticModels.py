@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Reinforcement Workbench contributors             *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Synthetic Reinforced Structures"
+__author__ = "Reinforcement Workbench contributors"
+__url__ = "https://www.freecadweb.org"
+
+import FreeCAD
+
+# Gap between consecutive synthetic structures along x-axis
+STRUCTURES_GAP = 1000
+
+SLAB_REINFORCEMENT_CONFIG = {
+    "parallel_rebar_type": "StraightRebar",
+    "parallel_front_cover": 20,
+    "parallel_rear_cover": 20,
+    "parallel_left_cover": 20,
+    "parallel_right_cover": 20,
+    "parallel_top_cover": 20,
+    "parallel_bottom_cover": 20,
+    "parallel_diameter": 10,
+    "parallel_amount_spacing_check": False,
+    "parallel_amount_spacing_value": 150,
+    "cross_rebar_type": "StraightRebar",
+    "cross_front_cover": 20,
+    "cross_rear_cover": 20,
+    "cross_left_cover": 20,
+    "cross_right_cover": 20,
+    "cross_top_cover": 20,
+    "cross_bottom_cover": 20,
+    "cross_diameter": 10,
+    "cross_amount_spacing_check": False,
+    "cross_amount_spacing_value": 150,
+}
+
+FOOTING_REINFORCEMENT_CONFIG = {
+    "parallel_rebar_type": "LShapeRebar",
+    "parallel_front_cover": 40,
+    "parallel_rear_cover": 40,
+    "parallel_left_cover": 40,
+    "parallel_right_cover": 40,
+    "parallel_top_cover": 40,
+    "parallel_bottom_cover": 40,
+    "parallel_diameter": 12,
+    "parallel_amount_spacing_check": False,
+    "parallel_amount_spacing_value": 150,
+    "cross_rebar_type": "LShapeRebar",
+    "cross_front_cover": 40,
+    "cross_rear_cover": 40,
+    "cross_left_cover": 40,
+    "cross_right_cover": 40,
+    "cross_top_cover": 40,
+    "cross_bottom_cover": 40,
+    "cross_diameter": 12,
+    "cross_amount_spacing_check": False,
+    "cross_amount_spacing_value": 150,
+    "column_front_spacing": 400,
+    "column_left_spacing": 400,
+    "column_right_spacing": 400,
+    "column_rear_spacing": 400,
+    "tie_top_cover": 40,
+    "tie_bottom_cover": 40,
+    "tie_bent_angle": 135,
+    "tie_extension_factor": 2,
+    "tie_diameter": 8,
+    "tie_number_spacing_check": False,
+    "tie_number_spacing_value": 150,
+    "column_main_rebar_diameter": 16,
+    "column_main_rebars_t_offset": 400,
+    "column_width": 400,
+    "column_length": 400,
+}
+
+BEAM_REINFORCEMENT_CONFIG = {
+    "l_cover_of_stirrup": 20,
+    "r_cover_of_stirrup": 20,
+    "t_cover_of_stirrup": 20,
+    "b_cover_of_stirrup": 20,
+    "offset_of_stirrup": 100,
+    "bent_angle": 135,
+    "extension_factor": 4,
+    "dia_of_stirrup": 8,
+    "number_spacing_check": False,
+    "number_spacing_value": 100,
+    "top_reinforcement_number_diameter_offset": (
+        "1#20@-60+2#16@-60+1#20@-60",
+        "3#16@-100",
+    ),
+    "top_reinforcement_rebar_type": "StraightRebar",
+    "top_reinforcement_layer_spacing": 30,
+    "bottom_reinforcement_number_diameter_offset": (
+        "1#20@-60+2#16@-60+1#20@-60",
+        "3#16@-100",
+    ),
+    "bottom_reinforcement_rebar_type": "StraightRebar",
+    "bottom_reinforcement_layer_spacing": 30,
+    "left_rebars_number_diameter_offset": "1#16@-100+1#16@-100+1#16@-100",
+    "left_rebars_type": "StraightRebar",
+    "left_rebars_spacing": 30,
+    "right_rebars_number_diameter_offset": "1#16@-100+1#16@-100+1#16@-100",
+    "right_rebars_type": "StraightRebar",
+    "right_rebars_spacing": 30,
+}
+
+CIRCULAR_COLUMN_REINFORCEMENT_CONFIG = {
+    "s_cover": 40,
+    "helical_rebar_t_offset": 40,
+    "helical_rebar_b_offset": 40,
+    "pitch": 100,
+    "dia_of_helical_rebar": 8,
+    "main_rebars_t_offset": 40,
+    "main_rebars_b_offset": 40,
+    "dia_of_main_rebars": 16,
+    "number_angle_check": True,
+    "number_angle_value": 12,
+}
+
+
+def getFaceNameByNormal(structure, normal):
+    """getFaceNameByNormal(Structure, Normal):
+    Returns name of first planar face of structure having outward normal
+    along normal vector, or None if no such face exists."""
+    for i, face in enumerate(structure.Shape.Faces):
+        if face.Surface.TypeId != "Part::GeomPlane":
+            continue
+        if face.normalAt(0, 0).getAngle(normal) < 1e-6:
+            return "Face" + str(i + 1)
+    return None
+
+
+def makeBoxStructures(count, length, width, height, normal, name):
+    """makeBoxStructures(Count, Length, Width, Height, Normal, Name):
+    Creates count cuboid structures placed side by side along x-axis and
+    returns list of tuples (structure, facename), where facename is the name
+    of face of structure having outward normal along normal vector."""
+    import Arch
+
+    structures = []
+    for i in range(count):
+        structure = Arch.makeStructure(
+            length=length, width=width, height=height, name=name
+        )
+        structure.Placement.Base = FreeCAD.Vector(
+            i * (length + STRUCTURES_GAP), 0, 0
+        )
+        structures.append(structure)
+    FreeCAD.ActiveDocument.recompute()
+    return [
+        (structure, getFaceNameByNormal(structure, normal))
+        for structure in structures
+    ]
+
+
+def makeSlabStructures(count, length=5000, width=4000, height=200):
+    """makeSlabStructures(Count, [Length, Width, Height]):
+    Creates count slabs and returns list of tuples (structure, facename)."""
+    return makeBoxStructures(
+        count, length, width, height, FreeCAD.Vector(0, -1, 0), "Slab"
+    )
+
+
+def makeFootingStructures(count, grid=2, column_pitch=1500, height=600):
+    """makeFootingStructures(Count, [Grid, ColumnPitch, Height]):
+    Creates count square footings, each sized for grid x grid columns, and
+    returns list of tuples (structure, facename)."""
+    size = grid * column_pitch
+    return makeBoxStructures(
+        count, size, size, height, FreeCAD.Vector(0, -1, 0), "Footing"
+    )
+
+
+def makeBeamStructures(count, length=4000, width=300, height=500):
+    """makeBeamStructures(Count, [Length, Width, Height]):
+    Creates count beams along x-axis and returns list of tuples (structure,
+    facename)."""
+    return makeBoxStructures(
+        count, length, width, height, FreeCAD.Vector(-1, 0, 0), "Beam"
+    )
+
+
+def makeCircularColumnStructures(count, radius=300, height=3000):
+    """makeCircularColumnStructures(Count, [Radius, Height]):
+    Creates count circular columns and returns list of tuples (structure,
+    facename)."""
+    import Arch
+    import Draft
+
+    structures = []
+    for i in range(count):
+        placement = FreeCAD.Placement()
+        placement.Base = FreeCAD.Vector(i * (2 * radius + STRUCTURES_GAP), 0, 0)
+        circle = Draft.makeCircle(radius, placement=placement, face=True)
+        structures.append(
+            Arch.makeStructure(circle, height=height, name="Column")
+        )
+    FreeCAD.ActiveDocument.recompute()
+    return [
+        (structure, getFaceNameByNormal(structure, FreeCAD.Vector(0, 0, 1)))
+        for structure in structures
+    ]
+
+
+def reinforceSlabs(structures, config=None):
+    """reinforceSlabs(Structures, [Config]):
+    Reinforce each (structure, facename) in structures using
+    makeSlabReinforcements() with keyword arguments from config and returns
+    list of created reinforcement groups."""
+    from SlabReinforcement.SlabReinforcement import makeSlabReinforcements
+
+    config = config or SLAB_REINFORCEMENT_CONFIG
+    return list(makeSlabReinforcements(structures, **config).values())
+
+
+def editSlabs(groups, config=None):
+    """editSlabs(Groups, [Config]):
+    Edit each slab reinforcement group in groups using editSlabReinforcement()
+    with keyword arguments from config."""
+    from SlabReinforcement.SlabReinforcement import editSlabReinforcement
+
+    config = config or SLAB_REINFORCEMENT_CONFIG
+    for group in groups:
+        editSlabReinforcement(
+            group,
+            structure=group.Structure,
+            facename=group.Facename,
+            **config,
+        )
+
+
+def reinforceFootings(structures, grid=2, config=None):
+    """reinforceFootings(Structures, [Grid, Config]):
+    Reinforce each (structure, facename) in structures with grid x grid
+    columns using makeFootingReinforcements() with keyword arguments from
+    config and returns list of created reinforcement groups."""
+    from FootingReinforcement.FootingReinforcement import (
+        makeFootingReinforcements,
+    )
+
+    config = config or FOOTING_REINFORCEMENT_CONFIG
+    return list(
+        makeFootingReinforcements(
+            structures,
+            xdir_column_amount_spacing_value=grid,
+            ydir_column_amount_spacing_value=grid,
+            **config,
+        ).values()
+    )
+
+
+def editFootings(groups, grid=2, config=None):
+    """editFootings(Groups, [Grid, Config]):
+    Edit each footing reinforcement group in groups using
+    editFootingReinforcement() with keyword arguments from config."""
+    from FootingReinforcement.FootingReinforcement import (
+        editFootingReinforcement,
+    )
+
+    config = config or FOOTING_REINFORCEMENT_CONFIG
+    for group in groups:
+        editFootingReinforcement(
+            group,
+            xdir_column_amount_spacing_value=grid,
+            ydir_column_amount_spacing_value=grid,
+            structure=group.Structure,
+            facename=group.Facename,
+            **config,
+        )
+
+
+def reinforceBeams(structures, config=None):
+    """reinforceBeams(Structures, [Config]):
+    Reinforce each (structure, facename) in structures using
+    TwoLeggedBeam.makeReinforcements() with keyword arguments from config and
+    returns list of tuples (reinforcement group, structure, facename)."""
+    from BeamReinforcement import TwoLeggedBeam
+
+    config = config or BEAM_REINFORCEMENT_CONFIG
+    groups = TwoLeggedBeam.makeReinforcements(structures, **config)
+    return [
+        (groups[structure], structure, facename)
+        for structure, facename in structures
+    ]
+
+
+def editBeams(groups, config=None):
+    """editBeams(Groups, [Config]):
+    Edit each (reinforcement group, structure, facename) in groups using
+    TwoLeggedBeam.editReinforcement() with keyword arguments from config."""
+    from BeamReinforcement import TwoLeggedBeam
+
+    config = config or BEAM_REINFORCEMENT_CONFIG
+    for group, structure, facename in groups:
+        TwoLeggedBeam.editReinforcement(
+            group, structure=structure, facename=facename, **config
+        )
+
+
+def reinforceCircularColumns(structures, compact=False, config=None):
+    """reinforceCircularColumns(Structures, [Compact, Config]):
+    Reinforce each (structure, facename) in structures using
+    CircularColumn.makeReinforcements() with keyword arguments from config
+    and returns list of tuples (reinforcement group, structure, facename)."""
+    from ColumnReinforcement import CircularColumn
+
+    config = config or CIRCULAR_COLUMN_REINFORCEMENT_CONFIG
+    groups = CircularColumn.makeReinforcements(
+        structures, compact=compact, **config
+    )
+    return [
+        (groups[structure], structure, facename)
+        for structure, facename in structures
+    ]
+
+
+def editCircularColumns(groups, config=None):
+    """editCircularColumns(Groups, [Config]):
+    Edit each (reinforcement group, structure, facename) in groups using
+    CircularColumn.editReinforcement() with keyword arguments from config."""
+    from ColumnReinforcement import CircularColumn
+
+    config = config or CIRCULAR_COLUMN_REINFORCEMENT_CONFIG
+    for group, structure, facename in groups:
+        CircularColumn.editReinforcement(
+            group, structure=structure, facename=facename, **config
+        )
+
+
+def assignRebarMarks(document=None):
+    """assignRebarMarks([Document]):
+    Assign unique Mark to each rebar of document having no Mark, so that it is
+    included in bar bending schedule and rebar shape cut list."""
+    document = document or FreeCAD.ActiveDocument
+    mark = 0
+    for obj in document.Objects:
+        if hasattr(obj, "Mark") and hasattr(obj, "Amount") and not obj.Mark:
+            mark += 1
+            obj.Mark = str(mark)
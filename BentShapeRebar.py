@@ -29,7 +29,6 @@ import math
 from pathlib import Path
 from typing import Tuple, List
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -46,6 +45,10 @@ from Rebarfunc import (
     check_selected_face,
     facenormalDirection,
     get_rebar_amount_from_spacing,
+    recompute,
+    batch_recompute,
+    setSketchLinePoints,
+    getStructureExtent,
 )
 
 
@@ -441,7 +444,7 @@ def makeBentShapeRebar(
         sketch.Support = [(structure, facename)]
     else:
         sketch.AttachmentSupport = [(structure, facename)]
-    FreeCAD.ActiveDocument.recompute()
+    recompute(sketch)
     sketch.addGeometry(Part.LineSegment(points[0], points[1]), False)
     sketch.addGeometry(Part.LineSegment(points[1], points[2]), False)
     sketch.addGeometry(Part.LineSegment(points[2], points[3]), False)
@@ -457,13 +460,9 @@ def makeBentShapeRebar(
             f_cover + diameter / 2,
             name="BentShapeRebar",
         )
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             sketch,
@@ -558,10 +557,11 @@ def makeBentShapeRebar(
     else:
         rebar.AmountCheck = False
         rebar.TrueSpacing = amount_spacing_value
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar
 
 
+@batch_recompute()
 def editBentShapeRebar(
     Rebar,
     f_cover,
@@ -624,45 +624,18 @@ def editBentShapeRebar(
         diameter,
         facenormalDirection(structure, facename),
     )
-    sketch.movePoint(0, 1, points[0], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(0, 2, points[1], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(1, 1, points[1], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(1, 2, points[2], 0)
-    FreeCAD.ActiveDocument.recompute()
-
-    sketch.movePoint(2, 1, points[2], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(2, 2, points[3], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(3, 1, points[3], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(3, 2, points[4], 0)
-    FreeCAD.ActiveDocument.recompute()
-
-    sketch.movePoint(4, 1, points[4], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(4, 2, points[5], 0)
-    FreeCAD.ActiveDocument.recompute()
+    setSketchLinePoints(sketch, points)
 
     Rebar.OffsetStart = f_cover + diameter / 2
     Rebar.OffsetEnd = f_cover + diameter / 2
     if amount_spacing_check:
         Rebar.Amount = amount_spacing_value
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = False
     Rebar.Diameter = diameter
     Rebar.FrontCover = f_cover
@@ -675,7 +648,7 @@ def editBentShapeRebar(
     Rebar.Rounding = rounding
     Rebar.TrueSpacing = amount_spacing_value
     Rebar.Orientation = orientation
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return Rebar
 
 
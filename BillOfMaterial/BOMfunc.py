@@ -25,16 +25,41 @@ __title__ = "Bill Of Material Helper Functions"
 __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple
 import re
 import Draft
 import FreeCAD
 from PySide import QtGui
 
+from RebarProfiling import profiled
+
 
 # TODO: Use(Uncomment) typing.Literal for minimum python3.8
 
 
+# The rebar2 reinforcement object types
+REINFORCEMENT_OBJECT_TYPES = [
+    "ReinforcementGeneric",
+    "ReinforcementLattice",
+    "ReinforcementCustom",
+    "ReinforcementIndividual",
+    "ReinforcementLinear",
+]
+
+# The properties, on change of which, cached document reinforcement index
+# becomes invalid
+REINFORCEMENT_INDEX_PROPERTIES = (
+    "Proxy",
+    "Host",
+    "Mark",
+    "MarkNumber",
+    "BaseRebar",
+    "Label",
+)
+
+
 def getBaseRebar(reinforcement_obj):
     if hasattr(reinforcement_obj, "BaseRebar"):
         return reinforcement_obj.BaseRebar
@@ -42,6 +67,173 @@ def getBaseRebar(reinforcement_obj):
         return reinforcement_obj
 
 
+def getReinforcementMark(rebar) -> str:
+    """Returns mark of ArchRebar or rebar2 reinforcement object."""
+    # If object is ArchRebar object
+    if Draft.get_type(rebar) == "Rebar":
+        if hasattr(rebar, "Mark"):
+            return str(rebar.Mark)
+        else:
+            return str(rebar.Label)
+    # Otherwise object is Rebar2 reinforcement object
+    else:
+        return str(rebar.BaseRebar.MarkNumber)
+
+
+class ReinforcementIndex:
+    """Index of objects by their type with host -> rebars, mark -> rebars and
+    base rebar -> reinforcements maps, built once from the objects list.
+
+    The lists in index keep the order of objects in objects list and are
+    accompanied by sets for fast membership tests, so that BOM, BBS, rebar
+    shape cut list and reinforcement drawing generation can share one index
+    instead of scanning document objects again and again.
+    """
+
+    def __init__(self, objects_list: List):
+        self.objects = list(objects_list)
+        self.objects_set = set(self.objects)
+        self.objects_position = {}
+        self.type_objects_dict = {}
+        for position, obj in enumerate(self.objects):
+            self.objects_position.setdefault(obj, position)
+            obj_type = Draft.get_type(obj)
+            self.type_objects_dict.setdefault(obj_type, []).append(obj)
+        self.type_objects_set = {
+            obj_type: set(objects)
+            for obj_type, objects in self.type_objects_dict.items()
+        }
+
+        # Maps are filled in order of getObjectsOfType("Rebar",
+        # *REINFORCEMENT_OBJECT_TYPES), so that their lists are in same order
+        # as of getReinforcementRebarObjects() for whole document
+        self.host_rebars_dict = {}
+        self.mark_rebars_dict = {}
+        self.rebar_mark_dict = {}
+        self.base_rebar_reinforcements_dict = {}
+        for obj in self.getObjectsOfType("Rebar"):
+            self.host_rebars_dict.setdefault(obj.Host, []).append(obj)
+            mark = getReinforcementMark(obj)
+            self.rebar_mark_dict[obj] = mark
+            self.mark_rebars_dict.setdefault(mark, []).append(obj)
+        for obj in self.getObjectsOfType(*REINFORCEMENT_OBJECT_TYPES):
+            self.host_rebars_dict.setdefault(obj.Host, []).append(obj)
+            if obj.BaseRebar:
+                mark = getReinforcementMark(obj)
+                self.rebar_mark_dict[obj] = mark
+                self.mark_rebars_dict.setdefault(mark, []).append(obj)
+            else:
+                self.rebar_mark_dict[obj] = None
+            self.base_rebar_reinforcements_dict.setdefault(
+                obj.BaseRebar, []
+            ).append(obj)
+
+    def getObjectsOfType(self, *obj_types: str) -> List:
+        """Returns new list of objects of obj_types, grouped in order of
+        obj_types."""
+        objects = []
+        for obj_type in obj_types:
+            objects.extend(self.type_objects_dict.get(obj_type, []))
+        return objects
+
+    def isObjectOfType(self, obj, *obj_types: str) -> bool:
+        """Returns True if obj is of any of obj_types, otherwise False."""
+        return any(
+            obj in self.type_objects_set.get(obj_type, ())
+            for obj_type in obj_types
+        )
+
+    def sortObjects(self, objects) -> List:
+        """Returns new list of objects sorted in order of objects list of
+        index."""
+        return sorted(objects, key=self.objects_position.__getitem__)
+
+    def getHostRebars(self, host) -> List:
+        """Returns list of ArchRebar and reinforcement objects having host."""
+        return list(self.host_rebars_dict.get(host, []))
+
+    def getMarkRebars(self, mark: str) -> List:
+        """Returns list of ArchRebar and reinforcement objects having mark."""
+        return list(self.mark_rebars_dict.get(str(mark), []))
+
+    def getRebarMark(self, rebar) -> Optional[str]:
+        """Returns mark of ArchRebar or reinforcement object, or None if
+        reinforcement object has no base rebar. Mark of object not present in
+        index is computed from object."""
+        if rebar in self.rebar_mark_dict:
+            return self.rebar_mark_dict[rebar]
+        if not getBaseRebar(rebar):
+            return None
+        return getReinforcementMark(rebar)
+
+    def getBaseRebarReinforcements(self, base_rebar) -> List:
+        """Returns list of reinforcement objects derived from base_rebar."""
+        return list(self.base_rebar_reinforcements_dict.get(base_rebar, []))
+
+
+class ReinforcementIndexObserver:
+    """Document observer to invalidate cached reinforcement index of document
+    on its change."""
+
+    def slotCreatedObject(self, obj):
+        invalidateReinforcementIndex(obj.Document)
+
+    def slotDeletedObject(self, obj):
+        invalidateReinforcementIndex(obj.Document)
+
+    def slotChangedObject(self, obj, prop):
+        if prop in REINFORCEMENT_INDEX_PROPERTIES:
+            invalidateReinforcementIndex(obj.Document)
+
+    def slotDeletedDocument(self, document):
+        invalidateReinforcementIndex(document)
+
+
+REINFORCEMENT_INDEX_CACHE = {}
+REINFORCEMENT_INDEX_OBSERVER = None
+
+
+def getReinforcementIndex(document=None) -> ReinforcementIndex:
+    """Returns cached ReinforcementIndex of document, building it if document
+    changed since index was last built.
+
+    Parameters
+    ----------
+    document: <App::Document>, optional
+        The document to get its reinforcement index. If not provided, active
+        document will be used.
+
+    Returns
+    -------
+    ReinforcementIndex
+        The reinforcement index of document objects.
+    """
+    global REINFORCEMENT_INDEX_OBSERVER
+    if REINFORCEMENT_INDEX_OBSERVER is None:
+        REINFORCEMENT_INDEX_OBSERVER = ReinforcementIndexObserver()
+        FreeCAD.addDocumentObserver(REINFORCEMENT_INDEX_OBSERVER)
+
+    document = document or FreeCAD.ActiveDocument
+    index = REINFORCEMENT_INDEX_CACHE.get(document.Name)
+    # Objects count check is a safety net for changes not notified to
+    # document observer
+    if index is None or len(index.objects) != len(document.Objects):
+        index = ReinforcementIndex(document.Objects)
+        REINFORCEMENT_INDEX_CACHE[document.Name] = index
+    return index
+
+
+def invalidateReinforcementIndex(document=None):
+    """Invalidate cached reinforcement index of document. If document is not
+    provided, cached reinforcement index of all documents will be invalidated.
+    """
+    if document is None:
+        REINFORCEMENT_INDEX_CACHE.clear()
+    else:
+        REINFORCEMENT_INDEX_CACHE.pop(document.Name, None)
+
+
+@profiled
 def getReinforcementRebarObjects(objects_list=None):
     """getReinforcementRebarObjects(ObjectsList):
     objects_list is the list of ArchRebar, rebar2 and/or structural objects.
@@ -51,65 +243,57 @@ def getReinforcementRebarObjects(objects_list=None):
     passed base rebar2 objects, if objects_list is provided. Otherwise
     returns list of ArchRebar and reinforcement objects from active document.
     """
-    if not objects_list:
-        # Get all objects in active document
-        objects_list = FreeCAD.ActiveDocument.Objects
+    document_index = getReinforcementIndex()
+    if not objects_list or objects_list == FreeCAD.ActiveDocument.Objects:
+        return document_index.getObjectsOfType(
+            "Rebar", *REINFORCEMENT_OBJECT_TYPES
+        )
+
+    objects_index = ReinforcementIndex(objects_list)
 
     # Get ArchRebar objects
-    rebars_list = Draft.get_objects_of_type(objects_list, "Rebar")
+    rebars_list = objects_index.getObjectsOfType("Rebar")
+    rebars_set = set(rebars_list)
 
     # Add all ArchRebar objects present in active document having host present
     # in objects_list
-    if objects_list != FreeCAD.ActiveDocument.Objects:
-        all_arch_rebar_objects = Draft.get_objects_of_type(
-            FreeCAD.ActiveDocument.Objects, "Rebar"
-        )
-        for arch_rebar_object in all_arch_rebar_objects:
-            if (
-                arch_rebar_object.Host in objects_list
-                and arch_rebar_object not in rebars_list
-            ):
-                rebars_list.append(arch_rebar_object)
+    host_rebars = {
+        rebar
+        for host in objects_index.objects_set
+        for rebar in document_index.getHostRebars(host)
+        if document_index.isObjectOfType(rebar, "Rebar")
+        and rebar not in rebars_set
+    }
+    rebars_list.extend(document_index.sortObjects(host_rebars))
 
     # Get Rebar2 objects
-    reinforcement_obj_types = [
-        "ReinforcementGeneric",
-        "ReinforcementLattice",
-        "ReinforcementCustom",
-        "ReinforcementIndividual",
-        "ReinforcementLinear",
-    ]
-    reinforcement_list = []
-    for reinforcement_obj_type in reinforcement_obj_types:
-        reinforcement_list.extend(
-            Draft.get_objects_of_type(objects_list, reinforcement_obj_type)
-        )
+    reinforcement_list = objects_index.getObjectsOfType(
+        *REINFORCEMENT_OBJECT_TYPES
+    )
+    reinforcement_set = set(reinforcement_list)
 
     # Add all reinforcement elements present in active document derived from
     # base rebar objects in objects_list
     # And all reinforcement elements present in active document having Host
     # present in objects_list
-    if objects_list != FreeCAD.ActiveDocument.Objects:
-        all_objects = FreeCAD.ActiveDocument.Objects
-        all_reinforcement_obj = []
-        for reinforcement_obj_type in reinforcement_obj_types:
-            all_reinforcement_obj.extend(
-                Draft.get_objects_of_type(all_objects, reinforcement_obj_type)
-            )
-        base_rebar_objects = Draft.get_objects_of_type(
-            objects_list, "RebarShape"
+    derived_reinforcements = {
+        reinforcement
+        for base_rebar in objects_index.getObjectsOfType("RebarShape")
+        for reinforcement in document_index.getBaseRebarReinforcements(
+            base_rebar
+        )
+    }
+    derived_reinforcements.update(
+        reinforcement
+        for host in objects_index.objects_set
+        for reinforcement in document_index.getHostRebars(host)
+        if document_index.isObjectOfType(
+            reinforcement, *REINFORCEMENT_OBJECT_TYPES
         )
-        for reinforcement in all_reinforcement_obj:
-            if (
-                reinforcement.BaseRebar in base_rebar_objects
-                and reinforcement not in reinforcement_list
-            ):
-                reinforcement_list.append(reinforcement)
-            elif (
-                reinforcement.Host in objects_list
-                and reinforcement not in reinforcement_list
-            ):
-                reinforcement_list.append(reinforcement)
+    )
+    reinforcement_list.extend(
+        document_index.sortObjects(derived_reinforcements - reinforcement_set)
+    )
 
     rebars_list.extend(reinforcement_list)
     return rebars_list
@@ -129,6 +313,7 @@ def naturalKey(item: Tuple):
     return [atoi(keyComponent) for keyComponent in re.split(r"(\d+)", key)]
 
 
+@profiled
 def getMarkReinforcementsDict(objects_list: List = None) -> Dict[str, List]:
     """getMarkReinforcementsDict(ObjectsList):
     objects_list is the list of ArchRebar, rebar2 and/or structural objects.
@@ -138,25 +323,13 @@ def getMarkReinforcementsDict(objects_list: List = None) -> Dict[str, List]:
     rebar_objects = getReinforcementRebarObjects(objects_list)
 
     # Create dictionary with mark number as key with corresponding reinforcement
-    # objects list as value
+    # objects list as value, looking up marks in document index
+    document_index = getReinforcementIndex()
     mark_reinforcements_dict = {}
-
     for rebar in rebar_objects:
-        # If object is ArchRebar object
-        if Draft.get_type(rebar) == "Rebar":
-            if hasattr(rebar, "Mark"):
-                mark = str(rebar.Mark)
-            else:
-                mark = str(rebar.Label)
-            if mark not in mark_reinforcements_dict:
-                mark_reinforcements_dict[mark] = []
-            mark_reinforcements_dict[mark].append(rebar)
-        # Otherwise object is Rebar2 reinforcement object
-        else:
-            mark = str(rebar.BaseRebar.MarkNumber)
-            if mark not in mark_reinforcements_dict:
-                mark_reinforcements_dict[mark] = []
-            mark_reinforcements_dict[mark].append(rebar)
+        mark = document_index.getRebarMark(rebar)
+        if mark is not None:
+            mark_reinforcements_dict.setdefault(mark, []).append(rebar)
 
     mark_reinforcements_dict = dict(
         sorted(mark_reinforcements_dict.items(), key=naturalKey)
@@ -165,6 +338,7 @@ def getMarkReinforcementsDict(objects_list: List = None) -> Dict[str, List]:
     return mark_reinforcements_dict
 
 
+@profiled
 def getHostReinforcementsDict(
     objects_list: Optional[List] = None,
 ) -> Dict[object, List]:
@@ -186,12 +360,10 @@ def getHostReinforcementsDict(
     # Create dictionary with rebar host as key with corresponding reinforcement
     # objects list as value
     host_reinforcements_dict = {}
-
     for rebar in rebar_objects:
-        rebar_host = rebar.Host or "None"
-        if rebar_host not in host_reinforcements_dict:
-            host_reinforcements_dict[rebar_host] = []
-        host_reinforcements_dict[rebar_host].append(rebar)
+        host_reinforcements_dict.setdefault(rebar.Host or "None", []).append(
+            rebar
+        )
 
     host_reinforcements_dict = dict(
         sorted(
@@ -303,29 +475,38 @@ def fixColumnUnits(
     return column_units
 
 
-def getStringWidth(
-    input_string,
-    font_size,
-    font_family="DejaVu Sans",
-    font_file="DejaVuSans.ttf",
-):
-    """getStringWidth(InputString, FontSize, FontFamily):
-    font_size is size of font in mm.
-    font_file is required where no X11 display is available, in pure console
-    mode.
+# The maximum number of strings whose width is cached per font
+STRING_WIDTH_CACHE_SIZE = 4096
 
-    Returns width of string in mm.
+
+class FontMetrics:
+    """Font metrics to measure width of strings in mm for a font.
+
+    The font is loaded once per (font_family, font_file, font_size). Widths
+    of strings are cached in a bounded LRU cache. In pure console mode, where
+    font is loaded using PIL library, whole string is measured at once, so
+    that kerning is taken into account. Summing cached advance widths of its
+    glyphs is only a fallback for fonts which can't measure whole string.
     """
-    # Convert font size from mm to points
-    font_size = 2.8346456693 * font_size
-
-    if FreeCAD.GuiUp:
-        font = QtGui.QFont(font_family, font_size)
-        font_metrics = QtGui.QFontMetrics(font)
-        width = font_metrics.boundingRect(input_string).width()
-        # Convert width from pixels to mm
-        width = 0.2645833333 * width
-    else:
+
+    def __init__(self, font_size, font_family, font_file):
+        """font_size is size of font in mm.
+        font_file is required where no X11 display is available, in pure
+        console mode.
+        """
+        # Convert font size from mm to points
+        self.font_size = 2.8346456693 * font_size
+        self.glyph_advances = {}
+        self.string_widths = OrderedDict()
+        self.qt_font_metrics = None
+        self.pil_font = None
+
+        if FreeCAD.GuiUp:
+            self.qt_font_metrics = QtGui.QFontMetrics(
+                QtGui.QFont(font_family, self.font_size)
+            )
+            return
+
         try:
             from PIL import ImageFont
         except ModuleNotFoundError as error:
@@ -333,18 +514,103 @@ def getStringWidth(
                 "Module {} not found. It is required to calculate string width "
                 "in console mode.\n".format(error.name)
             )
-            return len(input_string) * font_size / 2.8346456693
+            return
 
         try:
-            font = ImageFont.truetype(font_file, round(font_size))
+            self.pil_font = ImageFont.truetype(font_file, round(self.font_size))
         except OSError:
             FreeCAD.Console.PrintError(
                 "Unable to find/open Font file `{}`. Default font `better than "
                 "nothing` will be used from PIL library.\n".format(font_file)
             )
-            font = ImageFont.load_default()
+            self.pil_font = ImageFont.load_default()
+
+    def getGlyphAdvance(self, glyph: str) -> float:
+        """Returns advance width of glyph in points, for font loaded using PIL
+        library."""
+        advance = self.glyph_advances.get(glyph)
+        if advance is None:
+            advance = self.pil_font.getlength(glyph)
+            self.glyph_advances[glyph] = advance
+        return advance
+
+    def measurePILStringWidth(self, input_string: str) -> float:
+        """Returns width of string in points, for font loaded using PIL
+        library."""
+        if hasattr(self.pil_font, "getsize"):
+            return self.pil_font.getsize(input_string, stroke_width=0.35)[0]
+        elif hasattr(self.pil_font, "getbbox"):
+            # getsize() was removed in Pillow 10, width of bounding box is same
+            # as width returned by getsize()
+            left, _, right, _ = self.pil_font.getbbox(
+                input_string, stroke_width=0.35
+            )
+            return right - left
+        else:
+            return sum(self.getGlyphAdvance(glyph) for glyph in input_string)
+
+    @profiled
+    def measureStringWidth(self, input_string: str) -> float:
+        """Returns width of string in mm, without using cached string widths."""
+        if self.qt_font_metrics is not None:
+            width = self.qt_font_metrics.boundingRect(input_string).width()
+            # Convert width from pixels to mm
+            return 0.2645833333 * width
+        elif self.pil_font is not None:
+            width = self.measurePILStringWidth(input_string)
+            # Convert width from points to mm
+            return width / 2.8346456693
+        else:
+            return len(input_string) * self.font_size / 2.8346456693
+
+    def getStringWidth(self, input_string: str) -> float:
+        """Returns width of string in mm."""
+        width = self.string_widths.get(input_string)
+        if width is not None:
+            self.string_widths.move_to_end(input_string)
+            return width
+        width = self.measureStringWidth(input_string)
+        self.string_widths[input_string] = width
+        if len(self.string_widths) > STRING_WIDTH_CACHE_SIZE:
+            self.string_widths.popitem(last=False)
+        return width
+
+    def getMaxStringWidth(self, strings: List[str]) -> float:
+        """Returns maximum width of strings in mm, e.g. to measure all texts of
+        a table column in one call. Returns 0 for empty strings list."""
+        return max(
+            (self.getStringWidth(string) for string in set(strings)),
+            default=0,
+        )
+
+
+@lru_cache(maxsize=32)
+def getFontMetrics(
+    font_size, font_family="DejaVu Sans", font_file="DejaVuSans.ttf"
+) -> FontMetrics:
+    """getFontMetrics(FontSize, [FontFamily, FontFile]):
+    font_size is size of font in mm.
+    font_file is required where no X11 display is available, in pure console
+    mode.
+
+    Returns cached FontMetrics object for font.
+    """
+    return FontMetrics(font_size, font_family, font_file)
+
+
+def getStringWidth(
+    input_string,
+    font_size,
+    font_family="DejaVu Sans",
+    font_file="DejaVuSans.ttf",
+):
+    """getStringWidth(InputString, FontSize, FontFamily):
+    font_size is size of font in mm.
+    font_file is required where no X11 display is available, in pure console
+    mode.
 
-        width = font.getsize(input_string, stroke_width=0.35)[0]
-        # Convert width from points to mm
-        width = width / 2.8346456693
-    return width
+    Returns width of string in mm.
+    """
+    return getFontMetrics(font_size, font_family, font_file).getStringWidth(
+        input_string
+    )
@@ -26,16 +26,18 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
-import re
 from xml.etree import ElementTree
 
 import FreeCAD
 QT_TRANSLATE_NOOP = FreeCAD.Qt.QT_TRANSLATE_NOOP
 
-from .BOMfunc import getStringWidth
+from .BOMfunc import getFontMetrics
 from SVGfunc import getTechdrawViewScalingFactor
 
 
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+
 class BOMContent:
     """A Rebars Bill of Material SVG Content object."""
 
@@ -258,22 +260,24 @@ class BOMContent:
         if not obj.Symbol:
             return
 
+        # Reuse table model if Symbol is not changed since last recompute,
+        # otherwise parse Symbol and build table model from it
+        table_model = getattr(self, "table_model", None)
+        if table_model is None or table_model.symbol != obj.Symbol:
+            table_model = BOMTableModel(obj.Symbol)
+            self.table_model = table_model
+
         if obj.Font:
-            obj.Symbol = re.sub(
-                'font-family="([^"]+)"',
-                'font-family="{}"'.format(obj.Font),
-                obj.Symbol,
-            )
+            table_model.setFontFamily(obj.Font)
 
         if obj.FontSize:
-            obj.Symbol = re.sub(
-                'font-size="([^"]+)"',
-                'font-size="{}"'.format(obj.FontSize.Value),
-                obj.Symbol,
-            )
+            table_model.setFontSize(obj.FontSize.Value)
+
+        self.setColumnWidth(obj, table_model)
+        self.setRowHeight(obj, table_model)
 
-        self.setColumnWidth(obj)
-        self.setRowHeight(obj)
+        if table_model.modified:
+            obj.Symbol = table_model.serialize()
 
         if obj.Width and obj.Height and obj.Template:
             scaling_factor = getTechdrawViewScalingFactor(
@@ -299,45 +303,30 @@ class BOMContent:
             obj.ViewObject.update()
 
     @staticmethod
-    def getColumnWidth(bom_content_obj):
-        font_size = bom_content_obj.FontSize.Value
-        font_family = bom_content_obj.Font
-        font_filename = bom_content_obj.FontFilename
+    def getColumnWidth(bom_content_obj, table_model):
+        font_metrics = getFontMetrics(
+            bom_content_obj.FontSize.Value,
+            bom_content_obj.Font,
+            bom_content_obj.FontFilename,
+        )
         min_column_width = 0
 
-        namespace = {"xmlns": "http://www.w3.org/2000/svg"}
-        bom_content = ElementTree.fromstring(bom_content_obj.Symbol)
         prev_column_width = bom_content_obj.ColumnWidth.Value
 
         column_count = int(bom_content_obj.Width.Value / prev_column_width)
         for col_seq in range(1, column_count + 1):
-            text_elements = bom_content.findall(
-                ".//*[@id='bom_table_cell_column_{}']/xmlns:text".format(
-                    col_seq
-                ),
-                namespace,
+            min_column_width = max(
+                min_column_width,
+                table_model.getColumnTextWidth(col_seq, font_metrics),
             )
-            for text_element in text_elements:
-                text = text_element.text
-                min_column_width = max(
-                    min_column_width,
-                    getStringWidth(text, font_size, font_family, font_filename),
-                )
 
-        multi_column_text_elements = bom_content.findall(
-            ".//*[@id='bom_table_cell_column_multi_column']/xmlns:text",
-            namespace,
+        multi_column_text_widths = table_model.getMultiColumnTextWidths(
+            font_metrics
         )
-        multi_column_rect_elements = bom_content.findall(
-            ".//*[@id='bom_table_cell_column_multi_column']/xmlns:rect",
-            namespace,
-        )
-        for i, text_element in enumerate(multi_column_text_elements):
-            text = text_element.text
-            text_width = getStringWidth(
-                text, font_size, font_family, font_filename
+        for i, text_width in enumerate(multi_column_text_widths):
+            rect_width = float(
+                table_model.multi_column_rect_elements[i].get("width")
             )
-            rect_width = float(multi_column_rect_elements[i].get("width"))
             col_span = int(rect_width / prev_column_width)
             available_width = col_span * bom_content_obj.PrefColumnWidth.Value
             if text_width > available_width:
@@ -345,32 +334,27 @@ class BOMContent:
                 min_column_width = max(min_column_width, text_width_per_column)
         return min_column_width
 
-    def setColumnWidth(self, bom_content_obj):
+    def setColumnWidth(self, bom_content_obj, table_model):
         pref_column_width = bom_content_obj.PrefColumnWidth.Value
-        column_width = self.getColumnWidth(bom_content_obj) + 4
+        column_width = self.getColumnWidth(bom_content_obj, table_model) + 4
         if column_width < pref_column_width:
             column_width = pref_column_width
 
-        namespace = {"xmlns": "http://www.w3.org/2000/svg"}
-        ElementTree.register_namespace("", "http://www.w3.org/2000/svg")
-        bom_content = ElementTree.fromstring(bom_content_obj.Symbol)
+        # Table geometry is already up to date
+        if (
+            table_model.column_width == column_width
+            and bom_content_obj.ColumnWidth.Value == column_width
+        ):
+            return
 
         column_count = int(
             bom_content_obj.Width.Value / bom_content_obj.ColumnWidth.Value
         )
         for col_seq in range(1, column_count + 1):
-            rectangle_elements = bom_content.findall(
-                ".//*[@id='bom_table_cell_column_{}']/xmlns:rect".format(
-                    col_seq
-                ),
-                namespace,
-            )
-            text_elements = bom_content.findall(
-                ".//*[@id='bom_table_cell_column_{}']/xmlns:text".format(
-                    col_seq
-                ),
-                namespace,
+            rectangle_elements = table_model.column_rect_elements.get(
+                col_seq, []
             )
+            text_elements = table_model.column_text_elements.get(col_seq, [])
             for row in range(len(rectangle_elements)):
                 rectangle_elements[row].set("width", str(column_width))
                 rectangle_elements[row].set(
@@ -379,24 +363,13 @@ class BOMContent:
                 text_elements[row].set(
                     "x", str(column_width * (col_seq - 1) + column_width / 2)
                 )
-            cell_elements = bom_content.findall(
-                ".//*xmlns:rect[@id='bom_table_cell_column_{}']".format(
-                    col_seq
-                ),
-                namespace,
-            )
+            cell_elements = table_model.column_cell_elements.get(col_seq, [])
             for cell in cell_elements:
                 cell.set("width", str(column_width))
                 cell.set("x", str(column_width * (col_seq - 1)))
 
-        multi_column_rect_elements = bom_content.findall(
-            ".//*[@id='bom_table_cell_column_multi_column']/xmlns:rect",
-            namespace,
-        )
-        multi_column_text_elements = bom_content.findall(
-            ".//*[@id='bom_table_cell_column_multi_column']/xmlns:text",
-            namespace,
-        )
+        multi_column_rect_elements = table_model.multi_column_rect_elements
+        multi_column_text_elements = table_model.multi_column_text_elements
         for i, rect_element in enumerate(multi_column_rect_elements):
             col_span = int(
                 float(rect_element.get("width"))
@@ -416,12 +389,11 @@ class BOMContent:
                 str(column_width * (col_seq - 1) + column_width * col_span / 2),
             )
 
-        total_separator = bom_content.find(
-            ".//*[@id='bom_table_cell_column_separator']",
-        )
+        total_separator = table_model.separator_element
         if total_separator is not None:
             total_separator.set("width", str(column_count * column_width))
 
+        bom_content = table_model.svg
         bom_content.set(
             "viewBox",
             "0 0 {} {}".format(
@@ -431,9 +403,8 @@ class BOMContent:
         bom_content.set("width", "{}mm".format(column_count * column_width))
         bom_content_obj.ColumnWidth = column_width
         bom_content_obj.Width = column_count * column_width
-        bom_content_obj.Symbol = ElementTree.tostring(
-            bom_content, encoding="unicode"
-        )
+        table_model.column_width = column_width
+        table_model.modified = True
 
     @staticmethod
     def getRowHeight(bom_content_obj):
@@ -442,15 +413,17 @@ class BOMContent:
             bom_content_obj.FontSize.Value * 1.618,
         )
 
-    def setRowHeight(self, bom_content_obj):
+    def setRowHeight(self, bom_content_obj, table_model):
         row_height = self.getRowHeight(bom_content_obj)
 
-        namespace = {"xmlns": "http://www.w3.org/2000/svg"}
-        ElementTree.register_namespace("", "http://www.w3.org/2000/svg")
-        bom_content = ElementTree.fromstring(bom_content_obj.Symbol)
+        # Table geometry is already up to date
+        if (
+            table_model.row_height == row_height
+            and bom_content_obj.RowHeight.Value == row_height
+        ):
+            return
 
-        text_elements = bom_content.findall(".//xmlns:text", namespace)
-        for text_element in text_elements:
+        for text_element in table_model.text_elements:
             preceding_row_count = int(
                 float(text_element.get("y")) / bom_content_obj.RowHeight.Value
             )
@@ -465,8 +438,7 @@ class BOMContent:
                 ),
             )
 
-        rect_elements = bom_content.findall(".//xmlns:rect", namespace)
-        for rect_element in rect_elements:
+        for rect_element in table_model.rect_elements:
             preceding_row_count = int(
                 float(rect_element.get("y")) / bom_content_obj.RowHeight.Value
             )
@@ -480,6 +452,7 @@ class BOMContent:
         row_count = int(
             bom_content_obj.Height.Value / bom_content_obj.RowHeight.Value
         )
+        bom_content = table_model.svg
         bom_content.set(
             "viewBox",
             "0 0 {} {}".format(
@@ -489,9 +462,8 @@ class BOMContent:
         bom_content.set("height", "{}mm".format(row_count * row_height))
         bom_content_obj.RowHeight = row_height
         bom_content_obj.Height = row_count * row_height
-        bom_content_obj.Symbol = ElementTree.tostring(
-            bom_content, encoding="unicode"
-        )
+        table_model.row_height = row_height
+        table_model.modified = True
 
     def __getstate__(self):
         return None
@@ -500,6 +472,134 @@ class BOMContent:
         return None
 
 
+class BOMTableModel:
+    """Structured table model of Bill of Material content svg.
+
+    The svg is parsed once and its table cells are indexed by column, so that
+    BOMContent object can update only the affected geometry on change of its
+    properties and serialize svg once per recompute. Widths of column texts
+    are cached per font.
+    """
+
+    def __init__(self, symbol):
+        ElementTree.register_namespace("", SVG_NAMESPACE)
+        self.svg = ElementTree.fromstring(symbol)
+        self.symbol = None
+        self.modified = True
+        self.font_family = None
+        self.font_size = None
+        self.column_width = None
+        self.row_height = None
+        # Cached text widths with font metrics as key
+        self.column_text_widths = {}
+        self.multi_column_text_widths = {}
+
+        text_tag = "{{{}}}text".format(SVG_NAMESPACE)
+        rect_tag = "{{{}}}rect".format(SVG_NAMESPACE)
+        column_id_prefix = "bom_table_cell_column_"
+        column_id_start = len(column_id_prefix)
+        self.text_elements = list(self.svg.iter(text_tag))
+        self.rect_elements = list(self.svg.iter(rect_tag))
+        self.font_family_elements = []
+        self.font_size_elements = []
+        # Text and rect elements of cells of each column
+        self.column_text_elements = {}
+        self.column_rect_elements = {}
+        # Rect elements acting as cell of each column
+        self.column_cell_elements = {}
+        self.multi_column_text_elements = []
+        self.multi_column_rect_elements = []
+        self.separator_element = None
+        for parent in self.svg.iter():
+            if parent.get("font-family"):
+                self.font_family_elements.append(parent)
+            if parent.get("font-size"):
+                self.font_size_elements.append(parent)
+
+            parent_id = parent.get("id", "")
+            if parent is not self.svg:
+                for child in parent:
+                    child_id = child.get("id", "")
+                    if child.tag == rect_tag and child_id.startswith(
+                        column_id_prefix
+                    ):
+                        column = child_id[column_id_start:]
+                        if column.isdigit():
+                            self.column_cell_elements.setdefault(
+                                int(column), []
+                            ).append(child)
+            if not parent_id.startswith(column_id_prefix):
+                continue
+            column = parent_id[column_id_start:]
+            if column == "separator":
+                if self.separator_element is None:
+                    self.separator_element = parent
+            elif column == "multi_column":
+                for child in parent:
+                    if child.tag == text_tag:
+                        self.multi_column_text_elements.append(child)
+                    elif child.tag == rect_tag:
+                        self.multi_column_rect_elements.append(child)
+            elif column.isdigit():
+                for child in parent:
+                    if child.tag == text_tag:
+                        self.column_text_elements.setdefault(
+                            int(column), []
+                        ).append(child)
+                    elif child.tag == rect_tag:
+                        self.column_rect_elements.setdefault(
+                            int(column), []
+                        ).append(child)
+
+    def setFontFamily(self, font_family):
+        if font_family == self.font_family:
+            return
+        for element in self.font_family_elements:
+            element.set("font-family", font_family)
+        self.font_family = font_family
+        self.modified = True
+
+    def setFontSize(self, font_size):
+        if font_size == self.font_size:
+            return
+        for element in self.font_size_elements:
+            element.set("font-size", str(font_size))
+        self.font_size = font_size
+        self.modified = True
+
+    def getColumnTextWidth(self, col_seq, font_metrics):
+        """Returns maximum width of texts of column col_seq."""
+        column_text_widths = self.column_text_widths.setdefault(
+            font_metrics, {}
+        )
+        if col_seq not in column_text_widths:
+            column_text_widths[col_seq] = font_metrics.getMaxStringWidth(
+                [
+                    text_element.text or ""
+                    for text_element in self.column_text_elements.get(
+                        col_seq, []
+                    )
+                ]
+            )
+        return column_text_widths[col_seq]
+
+    def getMultiColumnTextWidths(self, font_metrics):
+        """Returns list of widths of texts of cells spanning multiple
+        columns."""
+        if font_metrics not in self.multi_column_text_widths:
+            self.multi_column_text_widths[font_metrics] = [
+                font_metrics.getStringWidth(text_element.text or "")
+                for text_element in self.multi_column_text_elements
+            ]
+        return self.multi_column_text_widths[font_metrics]
+
+    def serialize(self):
+        """Returns table svg string."""
+        self.symbol = ElementTree.tostring(self.svg, encoding="unicode")
+        self.modified = False
+        return self.symbol
+
+
 def makeBOMObject(template_file):
     """Create BillOfMaterial object to store BOM svg."""
     bom_object = FreeCAD.ActiveDocument.addObject(
@@ -32,16 +32,18 @@ from typing import (
     OrderedDict as OrderedDictType,
     Union,
 )
-from xml.dom import minidom
 from xml.etree import ElementTree
 
 import FreeCAD
 
+from RebarProfiling import profiled
 from SVGfunc import (
     getSVGRootElement,
     getSVGRectangle,
     getSVGDataCell,
     getTechdrawViewScalingFactor,
+    getSVGString,
+    writeSVG,
 )
 from .BOMPreferences import BOMPreferences
 from .BOMfunc import (
@@ -178,6 +180,7 @@ def getColumnHeadersSVG(
     return column_headers_svg
 
 
+@profiled
 def makeBillOfMaterialSVG(
     # column_headers: Optional[
     #     OrderedDictType[
@@ -219,12 +222,13 @@ def makeBillOfMaterialSVG(
     # reinforcement_group_by: Optional[Literal["Mark", "Host"]] = None,
     reinforcement_group_by: Optional[str] = None,
     return_svg_only: bool = False,
+    pretty_print: bool = True,
 ):
     """makeBillOfMaterialSVG([ColumnHeaders, ColumnUnits, DiaWeightMap,
     RebarLengthType, FontFamily, FontSize, FontFilename, ColumnWidth, RowHeight,
     BOMLeftOffset, BOMTopOffset, BOMMinRightOffset, BOMMinBottomOffset,
     BOMTableSVGMaxWidth, BOMTableSVGMaxHeight, TemplateFile, OutputFile,
-    RebarObjects, ReinforcementGroupBy, ReturnSVGOnly]):
+    RebarObjects, ReinforcementGroupBy, ReturnSVGOnly, PrettyPrint]):
     Generates the Rebars Material Bill SVG.
 
     column_headers is an ordered dictionary with keys: "Host", "Mark",
@@ -270,6 +274,10 @@ def makeBillOfMaterialSVG(
     svg is written to output_file. And it returns svg element.
     Default is False.
 
+    If pretty_print is True, then svg written to output_file will be pretty
+    printed.
+    Default is True.
+
     Returns Bill Of Material svg code.
     """
     reinforcement_objects = getReinforcementRebarObjects(rebar_objects)
@@ -995,9 +1003,7 @@ def makeBillOfMaterialSVG(
     if return_svg_only:
         return svg
 
-    svg_output = minidom.parseString(
-        ElementTree.tostring(svg, encoding="unicode")
-    ).toprettyxml(indent="  ")
+    svg_output = getSVGString(svg)
 
     bom_obj = makeBOMObject(template_file)
     template_height = bom_obj.Template.Height.Value
@@ -1049,10 +1055,6 @@ def makeBillOfMaterialSVG(
         )
 
     if output_file:
-        svg_sheet = minidom.parseString(
-            ElementTree.tostring(bom_table_svg, encoding="unicode")
-        ).toprettyxml(indent="  ")
-
         if template_svg:
             bom_table_svg.set(
                 "transform",
@@ -1060,21 +1062,31 @@ def makeBillOfMaterialSVG(
                     bom_left_offset, bom_top_offset, scaling_factor
                 ),
             )
-            bom_svg = minidom.parseString(
-                ElementTree.tostring(bom_table_svg, encoding="unicode")
-            ).toprettyxml(indent="  ")
-            # Remove xml declaration as XML declaration allowed only at the
-            # start of the document
-            if "<?xml" in bom_svg.splitlines()[0]:
-                bom_svg = bom_svg.lstrip(bom_svg.splitlines()[0])
-            svg_sheet = template_svg.replace("<!-- DrawingContent -->", bom_svg)
-
+            # Stream bom table svg in place of DrawingContent placeholder of
+            # template
+            (
+                template_svg_start,
+                _,
+                template_svg_end,
+            ) = template_svg.partition("<!-- DrawingContent -->")
         try:
             with open(output_file, "w", encoding="utf-8") as svg_output_file:
-                svg_output_file.write(svg_sheet)
+                if template_svg:
+                    svg_output_file.write(template_svg_start)
+                    # XML declaration allowed only at the start of the
+                    # document
+                    writeSVG(
+                        bom_table_svg,
+                        svg_output_file,
+                        pretty_print,
+                        xml_declaration=False,
+                    )
+                    svg_output_file.write(template_svg_end)
+                else:
+                    writeSVG(bom_table_svg, svg_output_file, pretty_print)
         except OSError:
             FreeCAD.Console.PrintError(
-                "Error writing svg to file " + str(svg_output_file) + "\n"
+                "Error writing svg to file " + str(output_file) + "\n"
             )
 
     FreeCAD.ActiveDocument.recompute()
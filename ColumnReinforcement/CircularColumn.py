@@ -30,7 +30,7 @@ import math
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 import FreeCAD
-import ArchCommands
+import ArchRebar
 
 from HelicalRebar import makeHelicalRebar, editHelicalRebar
 from Rebarfunc import (
@@ -39,8 +39,13 @@ from Rebarfunc import (
     getParametersOfFace,
     setGroupProperties,
     setGroupPropertiesValues,
+    batch_recompute,
+    recompute,
+    getStructureExtent,
+    makeReinforcementOfStructures,
 )
 from RebarData import RebarTypes
+from RebarProfiling import profiled
 
 if FreeCAD.GuiUp:
     import FreeCADGui
@@ -90,6 +95,8 @@ def getPointsOfStraightRebars(
     return points_list
 
 
+@profiled
+@batch_recompute()
 def makeReinforcement(
     s_cover,
     helical_rebar_t_offset,
@@ -103,13 +110,15 @@ def makeReinforcement(
     number_angle_value,
     structure=None,
     facename=None,
+    compact=False,
 ):
     """makeReinforcement(SideCover, TopOffsetOfHelicalRebars,
     BottomOffsetOfHelicalRebars, Pitch, DiameterOfHelicalRebar,
     TopOffsetOfMainRebars, BottomOffsetOfMainRebars, DiameterOfMainRebars,
-    NumberAngleCheck, NumberAngleValue, Structure, Facename):
+    NumberAngleCheck, NumberAngleValue, Structure, Facename, Compact):
     Adds the helical and straight rebars to the selected structural column
-    object.
+    object. If Compact is True, then all main rebars are created as single
+    rebar object having polar placement list.
     """
     if not structure and not facename:
         if FreeCAD.GuiUp:
@@ -148,6 +157,7 @@ def makeReinforcement(
         number_angle_value,
         structure,
         facename,
+        compact=compact,
     )
 
     CircularColumnReinforcementRebarGroup = (
@@ -178,10 +188,26 @@ def makeReinforcement(
         properties_values,
         CircularColumnReinforcementRebarGroup.main_rebars_group,
     )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return CircularColumnReinforcementRebarGroup
 
 
+def makeReinforcements(structure_facename_list, **config):
+    """makeReinforcements(StructureFacenameList, **Config):
+    Adds the Circular Column reinforcement to each (structure, facename) in
+    structure_facename_list, with keyword arguments of makeReinforcement()
+    from config shared by all structures. Each structure must appear only once
+    in structure_facename_list. Document is recomputed only once, after all
+    structures are reinforced.
+
+    Returns dictionary with structure as key and created reinforcement group
+    (None on error) as value.
+    """
+    return makeReinforcementOfStructures(
+        makeReinforcement, structure_facename_list, config
+    )
+
+
 def makeStraightRebars(
     s_cover,
     t_offset,
@@ -192,16 +218,18 @@ def makeStraightRebars(
     structure,
     facename,
     base_line_list=None,
+    compact=False,
 ):
     """makeStraightRebars(SideCover, TopOffset, BottomOffset, Diameter,
-    NumberAngleCheck, NumberAngleValue, Structure, Facename, BaseLineObjList):
-    Adds the straight rebars in circular column structural object.
+    NumberAngleCheck, NumberAngleValue, Structure, Facename, BaseLineObjList,
+    Compact):
+    Adds the straight rebars in circular column structural object. If Compact
+    is True, then single rebar object is created with one base line and polar
+    placement list of all main rebars.
     """
     face = structure.Shape.Faces[(getFaceNumber(facename) - 1)]
     FacePRM = getParametersOfFace(structure, facename, False)
-    column_size = ArchCommands.projectToVector(
-        structure.Shape.copy(), face.normalAt(0, 0)
-    ).Length
+    column_size = getStructureExtent(structure, face.normalAt(0, 0))
     points_list = getPointsOfStraightRebars(
         FacePRM,
         s_cover,
@@ -212,6 +240,9 @@ def makeStraightRebars(
         number_angle_check,
         number_angle_value,
     )
+    amount = len(points_list)
+    if compact:
+        points_list = points_list[:1]
     import Arch
     import Draft
 
@@ -252,9 +283,45 @@ def makeStraightRebars(
         main_rebars_list[-1].RebarShape = "StraightRebar"
         main_rebars_list[-1].setEditorMode("RebarShape", 2)
 
+    if compact:
+        if number_angle_check:
+            angle = 360.0 / number_angle_value
+        else:
+            angle = number_angle_value
+        rebar = main_rebars_list[0]
+        _PolarRebar(rebar)
+        rebar.PolarCenter = FreeCAD.Vector(FacePRM[1])
+        rebar.PolarAxis = points_list[0][0].sub(points_list[0][1]).normalize()
+        rebar.PolarAngle = angle
+        rebar.Amount = amount
     return main_rebars_list
 
 
+def isCompactMainRebars(main_rebars_list):
+    """isCompactMainRebars(MainRebarsList):
+    Returns True if main rebars are created as single rebar object having
+    polar placement list, otherwise False.
+    """
+    return len(main_rebars_list) == 1 and isinstance(
+        main_rebars_list[0].Proxy, _PolarRebar
+    )
+
+
+def getPolarPlacements(center, axis, angle, amount):
+    """getPolarPlacements(Center, Axis, Angle, Amount):
+    Returns list of placements rotating object about axis passing through
+    center, where each consecutive placement is rotated by angle (in degrees).
+    """
+    return [
+        FreeCAD.Placement(
+            FreeCAD.Vector(), FreeCAD.Rotation(axis, i * angle), center
+        )
+        for i in range(amount)
+    ]
+
+
+@profiled
+@batch_recompute()
 def editReinforcement(
     rebar_group,
     s_cover,
@@ -269,13 +336,15 @@ def editReinforcement(
     number_angle_value,
     structure=None,
     facename=None,
+    compact=None,
 ):
     """editReinforcement(RebarGroup, SideCover, TopOffsetOfHelicalRebars,
     BottomOffsetOfHelicalRebars, Pitch, DiameterOfHelicalRebar,
     TopOffsetOfMainRebars, BottomOffsetOfMainRebars, DiameterOfMainRebars,
-    NumberAngleCheck, NumberAngleValue, Structure, Facename):
+    NumberAngleCheck, NumberAngleValue, Structure, Facename, Compact):
     Edit the helical and straight rebars for the selected structural column
-    object.
+    object. If Compact is None, then main rebars are kept in their current
+    mode.
     """
     helical_rebar = rebar_group.RebarGroups[0].HelicalRebars[0]
     line = helical_rebar.Base
@@ -307,9 +376,12 @@ def editReinforcement(
         number = number_angle_value
     else:
         number = math.ceil(360 / number_angle_value)
+    main_rebars = rebar_group.RebarGroups[1].MainRebars
+    if compact is None:
+        compact = isCompactMainRebars(main_rebars)
     base_line_list = []
-    for i, rebar in enumerate(rebar_group.RebarGroups[1].MainRebars):
-        if i < number:
+    for i, rebar in enumerate(main_rebars):
+        if i < (1 if compact else number):
             base_line_list.append(rebar.Base)
         else:
             FreeCAD.ActiveDocument.removeObject(rebar.Base.Name)
@@ -326,6 +398,7 @@ def editReinforcement(
         structure,
         facename,
         base_line_list,
+        compact,
     )
 
     rebar_group.RebarGroups[1].addObjects(main_rebars_list)
@@ -341,7 +414,7 @@ def editReinforcement(
     else:
         rebar_group.RebarGroups[1].Number = math.ceil(360 / number_angle_value)
         rebar_group.RebarGroups[1].Angle = number_angle_value
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar_group
 
 
@@ -439,6 +512,80 @@ class _CircularColumnReinforcementRebarGroup:
         self.main_rebars_group.MainRebars = main_rebars_list
 
 
+class _PolarRebar(ArchRebar._Rebar):
+    """A straight rebar repeated in polar array about the column axis.
+
+    The base line of first main rebar is swept once and copied to each
+    placement of PlacementList, so Amount is the actual number of main rebars
+    and is used as it is by bill of material.
+    """
+
+    def __init__(self, obj):
+        obj.Proxy = self
+        self.Type = "Rebar"
+        self.setPolarProperties(obj)
+
+    def setPolarProperties(self, obj):
+        pl = obj.PropertiesList
+        if "PolarCenter" not in pl:
+            obj.addProperty(
+                "App::PropertyVector",
+                "PolarCenter",
+                "PolarArray",
+                QT_TRANSLATE_NOOP("App::Property", "Centre of polar array"),
+            )
+        if "PolarAxis" not in pl:
+            obj.addProperty(
+                "App::PropertyVector",
+                "PolarAxis",
+                "PolarArray",
+                QT_TRANSLATE_NOOP("App::Property", "Axis of polar array"),
+            )
+        if "PolarAngle" not in pl:
+            obj.addProperty(
+                "App::PropertyAngle",
+                "PolarAngle",
+                "PolarArray",
+                QT_TRANSLATE_NOOP(
+                    "App::Property", "Angle between consecutive rebars"
+                ),
+            )
+
+    def onDocumentRestored(self, obj):
+        ArchRebar._Rebar.onDocumentRestored(self, obj)
+        self.setPolarProperties(obj)
+
+    def execute(self, obj):
+        if self.clone(obj):
+            return
+        if not obj.Base or not obj.Base.Shape.Edges or not obj.Diameter.Value:
+            return
+        import Part
+
+        wire = Part.Wire(obj.Base.Shape.Edges[0].copy())
+        start = wire.Vertexes[0].Point
+        direction = wire.Vertexes[-1].Point.sub(start)
+        bar = Part.makeCylinder(
+            obj.Diameter.Value / 2, direction.Length, start, direction
+        )
+        placements = getPolarPlacements(
+            obj.PolarCenter, obj.PolarAxis, obj.PolarAngle.Value, obj.Amount
+        )
+        shapes = []
+        self.wires = []
+        for placement in placements:
+            shape = bar.copy()
+            shape.Placement = placement.multiply(shape.Placement)
+            shapes.append(shape)
+            centerline = wire.copy()
+            centerline.Placement = placement.multiply(centerline.Placement)
+            self.wires.append(centerline)
+        obj.Shape = Part.makeCompound(shapes)
+        obj.PlacementList = placements
+        obj.Length = direction.Length
+        obj.TotalLength = direction.Length * len(placements)
+
+
 class _ViewProviderCircularColumnReinforcementRebarGroup:
     def __init__(self, vobj):
         vobj.Proxy = self
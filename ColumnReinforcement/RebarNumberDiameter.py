@@ -51,7 +51,9 @@ class _NumberDiameterDialog:
         """This function is used to set values in ui."""
         # Set values of number and diameter from rebars_widget
         self.NumberDiameter = self.rebars_widget.numberDiameter.text()
-        number_diameter_list = gettupleOfNumberDiameter(self.NumberDiameter)
+        number_diameter_list = list(
+            gettupleOfNumberDiameter(self.NumberDiameter)
+        )
         number_diameter_list.extend(
             [(0, 0) for _ in range(3 - len(number_diameter_list))]
         )
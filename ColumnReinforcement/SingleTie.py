@@ -40,12 +40,15 @@ from Rebarfunc import (
     setGroupPropertiesValues,
     _RebarGroup,
     _ViewProviderRebarGroup,
+    batch_recompute,
+    recompute,
 )
 
 if FreeCAD.GuiUp:
     import FreeCADGui
 
 
+@batch_recompute()
 def makeSingleTieFourRebars(
     l_cover_of_tie,
     r_cover_of_tie,
@@ -248,10 +251,11 @@ def makeSingleTieFourRebars(
     setGroupPropertiesValues(
         properties_values, SingleTieFourRebars.main_rebars_group
     )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return SingleTieFourRebars
 
 
+@batch_recompute()
 def editSingleTieFourRebars(
     rebar_group,
     l_cover_of_tie,
@@ -508,7 +512,7 @@ def editSingleTieFourRebars(
         hook_extension = "0.00 mm"
     main_rebars_group.HookExtension = hook_extension
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar_group
 
 
@@ -41,12 +41,15 @@ from Rebarfunc import (
     getFacenameforRebar,
     getLRebarOrientationLeftRightCover,
     setGroupProperties,
+    batch_recompute,
+    recompute,
 )
 
 if FreeCAD.GuiUp:
     import FreeCADGui
 
 
+@batch_recompute()
 def makeSingleTieMultipleRebars(
     l_cover_of_tie,
     r_cover_of_tie,
@@ -263,10 +266,11 @@ def makeSingleTieMultipleRebars(
         ydir_rebars_group.BottomOffset = ydir_rebars_b_offset
         ydir_rebars_group.NumberDiameter = ydir_rebars_number_diameter
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return SingleTieMultipleRebars.Object
 
 
+@batch_recompute()
 def makeXDirRebars(
     l_cover_of_tie,
     r_cover_of_tie,
@@ -296,8 +300,7 @@ def makeXDirRebars(
     # find list of tuples of number and diameter of xdir rebars
     xdir_rebars_number_diameter_list = gettupleOfNumberDiameter(
         xdir_rebars_number_diameter
-    )
-    xdir_rebars_number_diameter_list.reverse()
+    )[::-1]
 
     # Calculate spacing between xdir-rebars
     xdir_span_length = (
@@ -429,10 +432,11 @@ def makeXDirRebars(
                 f_cover_of_xdir_rebars += (
                     number * dia + number * spacing_in_xdir_rebars
                 )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return xdir_rebars
 
 
+@batch_recompute()
 def makeYDirRebars(
     l_cover_of_tie,
     r_cover_of_tie,
@@ -594,10 +598,11 @@ def makeYDirRebars(
                 f_cover_of_ydir_rebars += (
                     number * dia + number * spacing_in_ydir_rebars
                 )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return ydir_rebars
 
 
+@batch_recompute()
 def editSingleTieMultipleRebars(
     rebar_group,
     l_cover_of_tie,
@@ -716,7 +721,7 @@ def editSingleTieMultipleRebars(
 
     # If secondary rebars doesn't exists, return
     if len(rebar_group.RebarGroups) < 3:
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
         return rebar_group
 
     # Set parameters for xdir and ydir rebars
@@ -781,7 +786,7 @@ def editSingleTieMultipleRebars(
             base_name = Rebar.Base.Name
             FreeCAD.ActiveDocument.removeObject(Rebar.Name)
             FreeCAD.ActiveDocument.removeObject(base_name)
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
 
         if xdir_rebars_number_diameter and xdir_rebars_number_diameter != "0":
             xdir_rebars = makeXDirRebars(
@@ -826,7 +831,7 @@ def editSingleTieMultipleRebars(
             base_name = Rebar.Base.Name
             FreeCAD.ActiveDocument.removeObject(Rebar.Name)
             FreeCAD.ActiveDocument.removeObject(base_name)
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
 
         if ydir_rebars_number_diameter and ydir_rebars_number_diameter != "0":
             ydir_rebars = makeYDirRebars(
@@ -890,10 +895,11 @@ def editSingleTieMultipleRebars(
     ydir_rebars_group.BottomOffset = ydir_rebars_b_offset
     ydir_rebars_group.NumberDiameter = ydir_rebars_number_diameter
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar_group
 
 
+@batch_recompute()
 def editXDirRebars(
     xdir_rebars_list,
     l_cover_of_tie,
@@ -922,8 +928,7 @@ def editXDirRebars(
     # find list of tuples of number and diameter of xdir rebars
     xdir_rebars_number_diameter_list = gettupleOfNumberDiameter(
         xdir_rebars_number_diameter
-    )
-    xdir_rebars_number_diameter_list.reverse()
+    )[::-1]
 
     # Calculate spacing between xdir-rebars
     xdir_span_length = (
@@ -1059,9 +1064,10 @@ def editXDirRebars(
                     number * dia + number * spacing_in_xdir_rebars
                 )
                 index += 1
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
 
+@batch_recompute()
 def editYDirRebars(
     ydir_rebars_list,
     l_cover_of_tie,
@@ -1228,7 +1234,7 @@ def editYDirRebars(
                     number * dia + number * spacing_in_ydir_rebars
                 )
                 index += 1
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
 
 class _SingleTieMultipleRebars:
@@ -41,12 +41,15 @@ from Rebarfunc import (
     getFacenameforRebar,
     getLRebarOrientationLeftRightCover,
     setGroupProperties,
+    batch_recompute,
+    recompute,
 )
 
 if FreeCAD.GuiUp:
     import FreeCADGui
 
 
+@batch_recompute()
 def makeTwoTiesSixRebars(
     l_cover_of_ties,
     r_cover_of_ties,
@@ -180,10 +183,11 @@ def makeTwoTiesSixRebars(
     TwoTiesSixRebars = _TwoTiesSixRebars(SingleTieFourRebarsObject)
     TwoTiesSixRebars.ties_group.TiesSequence = ties_sequence
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return TwoTiesSixRebars.Object
 
 
+@batch_recompute()
 def makeMainRebars(
     l_cover_of_ties,
     r_cover_of_ties,
@@ -318,10 +322,11 @@ def makeMainRebars(
                 main_rebars[i].OffsetEnd = (
                     l_cover_of_ties + dia_of_ties + dia_of_main_rebars / 2
                 )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return main_rebars
 
 
+@batch_recompute()
 def editTwoTiesSixRebars(
     rebar_group,
     l_cover_of_ties,
@@ -478,10 +483,11 @@ def editTwoTiesSixRebars(
     rebar_group.RebarGroups[0].BottomCover = b_cover_of_ties
     rebar_group.RebarGroups[0].TiesSequence = ties_sequence
 
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar_group
 
 
+@batch_recompute()
 def editMainRebars(
     main_rebar_group,
     l_cover_of_ties,
@@ -669,7 +675,7 @@ def editMainRebars(
                     main_rebars[i].OffsetEnd = (
                         l_cover_of_ties + dia_of_ties + dia_of_main_rebars / 2
                     )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return main_rebars
 
 
@@ -27,8 +27,14 @@ __url__ = "https://www.freecadweb.org"
 
 
 import FreeCAD
-from Rebarfunc import showWarning
-from typing import Union, Tuple, Optional
+from Rebarfunc import (
+    batch_recompute,
+    makeReinforcementOfStructures,
+    recompute,
+    showWarning,
+)
+from RebarProfiling import profiled
+from typing import Dict, List, Union, Tuple, Optional
 
 from FootingReinforcement.FootingReinforcementObject import (
     FootingReinforcementGroup,
@@ -39,6 +45,8 @@ if FreeCAD.GuiUp:
     import FreeCADGui
 
 
+@profiled
+@batch_recompute()
 def makeFootingReinforcement(
     parallel_rebar_type: str,
     parallel_front_cover: float,
@@ -442,10 +450,39 @@ def makeFootingReinforcement(
         footingReinforcementGroup.ColumnSecHookExtension = (
             column_sec_hook_extension
         )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return footingReinforcementGroup
 
 
+def makeFootingReinforcements(
+    structure_facename_list: List[Tuple],
+    **config,
+) -> Dict:
+    """Generate Footing Reinforcement of multiple structures at once
+
+    Parameters
+    ----------
+    structure_facename_list: list of tuple
+        List of tuples (structure, facename) to be reinforced. Each structure
+        must appear only once.
+    **config
+        Keyword arguments of makeFootingReinforcement(), except structure and
+        facename, shared by all structures.
+
+    Returns
+    -------
+    dict
+        Dictionary with structure as key and created FootingReinforcementGroup
+        (None on error) as value. Document is recomputed only once, after
+        all structures are reinforced.
+    """
+    return makeReinforcementOfStructures(
+        makeFootingReinforcement, structure_facename_list, config
+    )
+
+
+@profiled
+@batch_recompute()
 def editFootingReinforcement(
     footingReinforcementGroup: FootingReinforcementGroup,
     parallel_rebar_type: str,
@@ -839,5 +876,5 @@ def editFootingReinforcement(
         footingReinforcementGroup.ColumnSecHookExtension = (
             column_sec_hook_extension
         )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return footingReinforcementGroup
@@ -43,6 +43,8 @@ from Rebarfunc import (
     getFacenamesforFootingReinforcement,
     getParametersOfFace,
     showWarning,
+    batch_recompute,
+    recompute,
 )
 
 
@@ -946,6 +948,7 @@ class FootingReinforcementGroup:
     def execute(self, obj):
         pass
 
+    @batch_recompute()
     def makeOrEditFootingReinforcement(self, obj):
         """Create or update Footing Reinforcement"""
         mesh_cover_along = obj.MeshCoverAlong
@@ -1546,7 +1549,7 @@ class FootingReinforcementGroup:
                     columns_container[row][column] = columnReinforcementGroup
 
         self.addColumnsGroups(obj.ReinforcementGroups[1], columns_container)
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
 
     def removeColumnReinforcement(self, column):
         """Remove column reinforcement from footing"""
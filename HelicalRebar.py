@@ -28,13 +28,17 @@ __url__ = "https://www.freecadweb.org"
 import math
 from pathlib import Path
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from DraftTools import translate
 from PySide import QtGui
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from PopUpImage import showPopUpImageDialog
 from RebarData import RebarTypes
 from Rebarfunc import (
@@ -44,6 +48,8 @@ from Rebarfunc import (
     showWarning,
     check_selected_face,
     facenormalDirection,
+    recompute,
+    getStructureExtent,
 )
 
 
@@ -52,6 +58,12 @@ def getpointsOfHelicalRebar(
 ):
     """getpointsOfHelicalRebar(FacePRM, s_cover, b_cover, t_cover):
     Return points of the LShape rebar in the form of array for sketch."""
+    if numpy is not None:
+        coordinates = getCoordinatesOfHelicalRebar(
+            FacePRM, s_cover, b_cover, t_cover, pitch, edges, size, direction
+        )
+        return [FreeCAD.Vector(x, y, z) for x, y, z in coordinates.tolist()]
+
     dz = float(pitch) / edges
     R = FacePRM[0][0] / 2 - s_cover
     points = []
@@ -83,6 +95,45 @@ def getpointsOfHelicalRebar(
     return points
 
 
+def getCoordinatesOfHelicalRebar(
+    FacePRM, s_cover, b_cover, t_cover, pitch, edges, size, direction
+):
+    """getCoordinatesOfHelicalRebar(FacePRM, SideCover, BottomCover, TopCover,
+    Pitch, Edges, Size, Direction):
+    Return numpy array of shape (N, 3) having coordinates of points of helical
+    rebar. Points are same as returned by getpointsOfHelicalRebar(), but
+    angles and heights of all points are computed at once.
+    """
+    if direction[2] not in {-1, 1}:
+        return numpy.empty((0, 3))
+    edges_per_turn = int(edges)
+    dz = float(pitch) / edges
+    height = abs(size - b_cover - t_cover)
+    # Number of complete turns, each turn adds edges_per_turn points after
+    # the first point
+    turns = 0
+    z = 0
+    while round(z) < height:
+        z += edges_per_turn * dz
+        turns += 1
+    if not turns:
+        return numpy.empty((0, 3))
+
+    index = numpy.arange(1 + turns * edges_per_turn)
+    edge_index = numpy.where(index == 0, 0, (index - 1) % edges_per_turn + 1)
+    angles = numpy.radians(edge_index * 360 / edges)
+    if direction[2] == 1:
+        zz = FacePRM[1][2] - t_cover - index * dz
+    else:
+        zz = FacePRM[1][2] + b_cover + index * dz
+    R = FacePRM[0][0] / 2 - s_cover
+    coordinates = numpy.empty((len(index), 3))
+    coordinates[:, 0] = FacePRM[1][0] + R * numpy.cos(angles)
+    coordinates[:, 1] = FacePRM[1][1] + R * numpy.sin(angles)
+    coordinates[:, 2] = zz
+    return coordinates
+
+
 def createHelicalWire(
     FacePRM,
     s_cover,
@@ -144,7 +195,7 @@ def createHelicalWire(
             FacePRM[1][0], FacePRM[1][1], FacePRM[1][2] + b_cover
         )
         helix.Placement.Rotation = FreeCAD.Rotation(FreeCAD.Vector(0, 0, -1), 0)
-    FreeCAD.ActiveDocument.recompute()
+    recompute(helix)
     return helix
 
 
@@ -285,11 +336,7 @@ def makeHelicalRebar(
             "element is derived\n"
         )
         return
-    size = (
-        ArchCommands.projectToVector(
-            structure.Shape.copy(), face.normalAt(0, 0)
-        )
-    ).Length
+    size = getStructureExtent(structure, face.normalAt(0, 0))
     normal = face.normalAt(0, 0)
     # normal = face.Placement.Rotation.inverted().multVec(normal)
     import Arch
@@ -306,7 +353,7 @@ def makeHelicalRebar(
     )
     rebar.OffsetStart = diameter / 2
     rebar.OffsetEnd = diameter / 2
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     # Adds properties to the rebar object
     rebar.addProperty(
         "App::PropertyEnumeration",
@@ -344,7 +391,7 @@ def makeHelicalRebar(
         QT_TRANSLATE_NOOP("App::Property", "Top cover of rebar"),
     ).TopCover = t_cover
     rebar.setEditorMode("TopCover", 2)
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar
 
 
@@ -390,11 +437,7 @@ def editHelicalRebar(
     # StructurePRM = getTrueParametersOfStructure(structure)
     # Get parameters of the face where sketch of rebar is drawn
     FacePRM = getParametersOfFace(structure, facename, False)
-    size = (
-        ArchCommands.projectToVector(
-            structure.Shape.copy(), face.normalAt(0, 0)
-        )
-    ).Length
+    size = getStructureExtent(structure, face.normalAt(0, 0))
     normal = face.normalAt(0, 0)
     # normal = face.Placement.Rotation.inverted().multVec(normal)
     createHelicalWire(
@@ -408,13 +451,13 @@ def editHelicalRebar(
         diameter,
         Rebar.Base,
     )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     Rebar.Diameter = diameter
     Rebar.SideCover = s_cover
     Rebar.BottomCover = b_cover
     Rebar.TopCover = t_cover
     Rebar.Pitch = pitch
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return Rebar
 
 
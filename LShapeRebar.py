@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 from pathlib import Path
 from typing import Tuple, List
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -45,6 +44,10 @@ from Rebarfunc import (
     check_selected_face,
     facenormalDirection,
     get_rebar_amount_from_spacing,
+    recompute,
+    batch_recompute,
+    setSketchLinePoints,
+    getStructureExtent,
 )
 
 
@@ -381,7 +384,7 @@ def makeLShapeRebar(
         sketch.Support = [(structure, facename)]
     else:
         sketch.AttachmentSupport = [(structure, facename)]
-    FreeCAD.ActiveDocument.recompute()
+    recompute(sketch)
     sketch.addGeometry(Part.LineSegment(points[0], points[1]), False)
     sketch.addGeometry(Part.LineSegment(points[1], points[2]), False)
 
@@ -394,13 +397,9 @@ def makeLShapeRebar(
             f_cover + diameter / 2,
             name="LShapeRebar",
         )
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             sketch,
@@ -480,10 +479,11 @@ def makeLShapeRebar(
     else:
         rebar.AmountCheck = False
         rebar.TrueSpacing = amount_spacing_value
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar
 
 
+@batch_recompute()
 def editLShapeRebar(
     Rebar,
     f_cover,
@@ -545,30 +545,17 @@ def editLShapeRebar(
         diameter,
         facenormalDirection(structure, facename),
     )
-    sketch.movePoint(0, 1, points[0], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(0, 2, points[1], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(1, 1, points[1], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(1, 2, points[2], 0)
-    FreeCAD.ActiveDocument.recompute()
+    setSketchLinePoints(sketch, points)
     Rebar.OffsetStart = f_cover + diameter / 2
     Rebar.OffsetEnd = f_cover + diameter / 2
     if amount_spacing_check:
         Rebar.Amount = amount_spacing_value
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = False
     Rebar.Diameter = diameter
     Rebar.FrontCover = f_cover
@@ -579,7 +566,7 @@ def editLShapeRebar(
     Rebar.Rounding = rounding
     Rebar.TrueSpacing = amount_spacing_value
     Rebar.Orientation = orientation
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return Rebar
 
 
@@ -28,12 +28,15 @@ __url__ = "https://www.freecadweb.org"
 import math
 from pathlib import Path
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
 
-from Rebarfunc import getFaceNumber
+from Rebarfunc import (
+    getFaceNumber,
+    getStructureExtent,
+    parseRebarSpecString,
+)
 
 
 class _RebarDistributionDialog:
@@ -139,20 +142,10 @@ def getCustomSpacingString(
 
 def getTupleOfCustomSpacing(span_string):
     """getTupleOfCustomSpacing(span_string): This function take input
-    in specific syntax and return output in the form of list. For eg.
+    in specific syntax and return output in the form of tuple. For eg.
     Input: "3@100+2@200+3@100"
-    Output: [(3, 100), (2, 200), (3, 100)]"""
-
-    span_st = span_string.strip()
-    span_sp = span_st.split("+")
-    index = 0
-    spacinglist = []
-    while index < len(span_sp):
-        # Find "@" recursively in span_sp array.
-        in_sp = span_sp[index].split("@")
-        spacinglist.append((int(in_sp[0]), float(in_sp[1])))
-        index += 1
-    return spacinglist
+    Output: ((3, 100), (2, 200), (3, 100))"""
+    return parseRebarSpecString(span_string, "NumberSpacing")
 
 
 def runRebarDistribution(self, front_cover=None):
@@ -160,11 +153,7 @@ def runRebarDistribution(self, front_cover=None):
         front_cover = self.form.frontCover.text()
         front_cover = FreeCAD.Units.Quantity(front_cover).Value
     face = self.SelectedObj.Shape.Faces[getFaceNumber(self.FaceName) - 1]
-    size = (
-        ArchCommands.projectToVector(
-            self.SelectedObj.Shape.copy(), face.normalAt(0, 0)
-        )
-    ).Length
+    size = getStructureExtent(self.SelectedObj, face.normalAt(0, 0))
     dialog = _RebarDistributionDialog(front_cover, size)
     dialog.setupUi(self.CustomSpacing)
     dialog.form.exec_()
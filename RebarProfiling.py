@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Reinforcement Workbench contributors             *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Opt-in profiling of hot paths of the workbench.
+
+Profiling is enabled by setting boolean parameter "Enabled" in parameter
+group PROFILING_PREF_PATH, and is read once when this module is imported, so
+FreeCAD needs to be restarted after changing it. When disabled, profiled()
+returns the decorated function itself and span() returns a shared no-op
+context manager, so there is no overhead.
+
+When enabled, call count and cumulative time of each profiled function and
+span are collected. On exit of outermost profiled call, summary is printed
+to FreeCAD report view and, if string parameter "ChromeTraceFile" is set,
+trace events are written to it in Chrome trace format, which can be opened
+in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+__title__ = "Rebar Profiling"
+__author__ = "Reinforcement Workbench contributors"
+__url__ = "https://www.freecadweb.org"
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+
+import FreeCAD
+
+PROFILING_PREF_PATH = (
+    "User parameter:BaseApp/Preferences/Mod/RebarTools/Profiling"
+)
+
+
+class Profiler:
+    """Collects call count, cumulative time and trace events of spans."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.depth = 0
+        self.stats = OrderedDict()
+        self.events = []
+
+    def reset(self):
+        """Discard collected stats and trace events."""
+        self.stats.clear()
+        self.events = []
+
+    @contextmanager
+    def span(self, name):
+        """Context manager to profile its block with given name."""
+        self.depth += 1
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter()
+            self.depth -= 1
+            self.addSpan(name, start_time, end_time)
+            if not self.depth:
+                self.report()
+
+    def addSpan(self, name, start_time, end_time):
+        """Add span with given name, start and end time to stats and trace
+        events."""
+        stat = self.stats.setdefault(name, [0, 0.0])
+        stat[0] += 1
+        stat[1] += end_time - start_time
+        self.events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start_time - self.origin) * 1e6,
+                "dur": (end_time - start_time) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def getSummary(self):
+        """Returns summary table of collected stats, sorted by cumulative
+        time."""
+        lines = ["{:>8} {:>12}  {}".format("Calls", "Cumulative", "Name")]
+        for name, (count, cumulative_time) in sorted(
+            self.stats.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            lines.append(
+                "{:>8} {:>11.3f}s  {}".format(count, cumulative_time, name)
+            )
+        return "\n".join(lines) + "\n"
+
+    def exportChromeTrace(self, trace_file):
+        """Write collected trace events to trace_file in Chrome trace
+        format."""
+        with open(trace_file, "w", encoding="utf-8") as trace_output_file:
+            json.dump(
+                {"traceEvents": self.events, "displayTimeUnit": "ms"},
+                trace_output_file,
+            )
+
+    def report(self):
+        """Print summary to FreeCAD console, export Chrome trace file if set in
+        preferences and reset collected data."""
+        FreeCAD.Console.PrintMessage("Rebar profiling:\n" + self.getSummary())
+        trace_file = FreeCAD.ParamGet(PROFILING_PREF_PATH).GetString(
+            "ChromeTraceFile"
+        )
+        if trace_file:
+            try:
+                self.exportChromeTrace(trace_file)
+            except OSError:
+                FreeCAD.Console.PrintError(
+                    "Error writing profiling trace to file "
+                    + str(trace_file)
+                    + "\n"
+                )
+        self.reset()
+
+
+def isProfilingEnabled():
+    """isProfilingEnabled(): Returns True if profiling is enabled in
+    preferences, otherwise False."""
+    return FreeCAD.ParamGet(PROFILING_PREF_PATH).GetBool("Enabled", False)
+
+
+PROFILING_ENABLED = isProfilingEnabled()
+PROFILER = Profiler()
+NULL_SPAN = nullcontext()
+
+
+def profiled(func):
+    """Decorator to profile calls of func, if profiling is enabled. Otherwise,
+    func is returned as it is."""
+    if not PROFILING_ENABLED:
+        return func
+    name = func.__module__ + "." + func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with PROFILER.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def span(name):
+    """span(Name): Returns context manager to profile its block with given
+    name, if profiling is enabled. Otherwise, no-op context manager is
+    returned."""
+    if not PROFILING_ENABLED:
+        return NULL_SPAN
+    return PROFILER.span(name)
@@ -25,10 +25,14 @@ __title__ = "RebarShape Cut List Functions"
 __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
+import copy
+import hashlib
+import json
+import os
 import re
 import math
+from collections import OrderedDict
 from typing import Union, List, Tuple, Optional
-from xml.dom import minidom
 from xml.etree import ElementTree
 
 import Draft
@@ -38,6 +42,11 @@ import FreeCAD
 import Part
 import WorkingPlane
 
+from BillOfMaterial.BOMfunc import (
+    REINFORCEMENT_OBJECT_TYPES,
+    ReinforcementIndex,
+    getReinforcementIndex,
+)
 from ReinforcementDrawing.ReinforcementDrawingfunc import (
     getRebarsSpanAxis,
     getSVGPlaneFromAxis,
@@ -45,17 +54,22 @@ from ReinforcementDrawing.ReinforcementDrawingfunc import (
     getRoundEdgeSVG,
     getRebarColor,
 )
+from RebarProfiling import profiled
 from SVGfunc import (
     getSVGRootElement,
     getPointSVG,
     getLineSVG,
     getSVGTextElement,
     getSVGRectangle,
+    writeSVG,
 )
 
 
 # TODO: Use(Uncomment) typing.Literal for minimum python3.8
 
+REBAR_SHAPE_SVG_CACHE_SIZE = 1024
+REBAR_SHAPE_SVG_CACHE_FILE_SUFFIX = "_RebarShapeSVGCache.json"
+
 
 def getBaseRebarsList(
     objects_filter_list: Optional[List] = None,
@@ -83,44 +97,36 @@ def getBaseRebarsList(
     if not objects_filter_list:
         if not FreeCAD.ActiveDocument:
             return []
-        objects_filter_list = FreeCAD.ActiveDocument.Objects
+        objects_index = getReinforcementIndex()
+    else:
+        objects_index = ReinforcementIndex(objects_filter_list)
 
     rebars = []
-    mark_list = []
+    mark_set = set()
 
-    arch_rebars = Draft.get_objects_of_type(objects_filter_list, "Rebar")
+    arch_rebars = objects_index.getObjectsOfType("Rebar")
     if one_rebar_per_mark:
         for rebar in arch_rebars:
-            if rebar.Mark and rebar.Mark not in mark_list:
+            if rebar.Mark and rebar.Mark not in mark_set:
                 rebars.append(rebar)
-                mark_list.append(rebar.Mark)
+                mark_set.add(rebar.Mark)
     else:
         rebars.extend(arch_rebars)
 
-    base_rebars = Draft.get_objects_of_type(objects_filter_list, "RebarShape")
-    rebar_distribution_obj_types = [
-        "ReinforcementGeneric",
-        "ReinforcementLattice",
-        "ReinforcementCustom",
-        "ReinforcementIndividual",
-        "ReinforcementLinear",
-    ]
-    for reinforcement_type in rebar_distribution_obj_types:
-        base_rebars.extend(
-            {
-                x.BaseRebar
-                for x in Draft.get_objects_of_type(
-                    objects_filter_list, reinforcement_type
-                )
-                if x.BaseRebar not in base_rebars
-            }
-        )
+    base_rebars = objects_index.getObjectsOfType("RebarShape")
+    base_rebars_set = set(base_rebars)
+    for reinforcement in objects_index.getObjectsOfType(
+        *REINFORCEMENT_OBJECT_TYPES
+    ):
+        if reinforcement.BaseRebar not in base_rebars_set:
+            base_rebars.append(reinforcement.BaseRebar)
+            base_rebars_set.add(reinforcement.BaseRebar)
 
     if one_rebar_per_mark:
         for rebar in base_rebars:
-            if str(rebar.MarkNumber) and str(rebar.MarkNumber) not in mark_list:
+            if str(rebar.MarkNumber) and str(rebar.MarkNumber) not in mark_set:
                 rebars.append(rebar)
-                mark_list.append(str(rebar.MarkNumber))
+                mark_set.add(str(rebar.MarkNumber))
     else:
         rebars.extend(base_rebars)
 
@@ -400,6 +406,250 @@ def getEdgesAngleSVG(
     return bent_angle_svg
 
 
+def getRebarMark(rebar) -> str:
+    """Returns Mark of ArchRebar or MarkNumber of rebar2.BaseRebar object and
+    empty string, if rebar has none of them."""
+    if hasattr(rebar, "Mark"):
+        return rebar.Mark
+    elif hasattr(rebar, "MarkNumber"):
+        return rebar.MarkNumber
+    return ""
+
+
+def getShapeGeometrySignature(
+    shape: Part.Shape, origin: FreeCAD.Vector, precision: int = 6
+) -> Tuple:
+    """Returns signature of shape geometry, which is independent of shape
+    position.
+
+    Parameters
+    ----------
+    shape: Part.Shape
+        The shape to get its geometry signature.
+    origin: FreeCAD.Vector
+        The point relative to which coordinates of shape vertexes are taken.
+    precision: int, optional
+        The number of decimals to round lengths and coordinates to.
+        Default is 6.
+
+    Returns
+    -------
+    tuple
+        The tuple of (geometry type, length, vertexes relative coordinates)
+        of each edge of shape.
+    """
+    signature = []
+    for edge in shape.Edges:
+        signature.append(
+            (
+                DraftGeomUtils.geomType(edge),
+                round(edge.Length, precision),
+                tuple(
+                    tuple(
+                        # Adding 0.0 normalizes -0.0 to 0.0
+                        round(coordinate, precision) + 0.0
+                        for coordinate in vertex.Point.sub(origin)
+                    )
+                    for vertex in edge.Vertexes
+                ),
+            )
+        )
+    return tuple(signature)
+
+
+def getRebarShapeSignature(rebar) -> Tuple:
+    """Returns signature of rebar shape geometry, which is same for rebars
+    having same shape irrespective of their position.
+
+    Parameters
+    ----------
+    rebar: <ArchRebar._Rebar> or <rebar2.BaseRebar>
+        The rebar to get its shape signature.
+
+    Returns
+    -------
+    tuple
+        The rebar shape signature.
+    """
+    bound_box = rebar.Base.Shape.BoundBox
+    origin = FreeCAD.Vector(bound_box.XMin, bound_box.YMin, bound_box.ZMin)
+    rebar_shape = getattr(rebar, "RebarShape", None)
+    signature = [
+        rebar_shape,
+        getattr(rebar, "BentAngle", None),
+        rebar.Rounding,
+        rebar.Diameter.Value,
+        getShapeGeometrySignature(rebar.Base.Shape.Wires[0], origin),
+    ]
+    if rebar_shape == "HelicalRebar":
+        # Helical rebar shape svg is generated from rebar shape and its
+        # dimension label from helix radius and pitch
+        signature.extend(
+            [
+                rebar.Base.Radius.Value,
+                rebar.Base.Pitch.Value,
+                getShapeGeometrySignature(rebar.Shape, origin),
+            ]
+        )
+    return tuple(signature)
+
+
+class RebarShapeSVGCache:
+    """Content-addressed cache of rebar shape svgs.
+
+    The rebar shape svgs are cached with hash of rebar shape signature and
+    svg styling arguments as key, so that rebars having same shape reuse the
+    generated rebar shape svg. The cache can be persisted to json file.
+    """
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        max_size: int = REBAR_SHAPE_SVG_CACHE_SIZE,
+    ):
+        self.cache_file = cache_file
+        self.max_size = max_size
+        # Cached svg elements or svg data loaded from cache file
+        self.svgs = OrderedDict()
+        self.modified = False
+        if cache_file and os.path.isfile(cache_file):
+            self.load()
+
+    @staticmethod
+    def getKey(*signature) -> str:
+        """Returns cache key corresponding to signature."""
+        return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def getElementData(element: ElementTree.Element) -> List:
+        """Returns json serializable data of element. Unlike svg string, it
+        keeps namespace attributes of svg root element as plain attributes."""
+        return [
+            element.tag,
+            dict(element.attrib),
+            element.text,
+            element.tail,
+            [RebarShapeSVGCache.getElementData(child) for child in element],
+        ]
+
+    @staticmethod
+    def getElementFromData(data: List) -> ElementTree.Element:
+        """Returns element created from data returned by getElementData()."""
+        tag, attrib, text, tail, children = data
+        element = ElementTree.Element(tag, attrib)
+        element.text = text
+        element.tail = tail
+        element.extend(
+            RebarShapeSVGCache.getElementFromData(child) for child in children
+        )
+        return element
+
+    def get(self, key: str) -> Optional[ElementTree.Element]:
+        """Returns copy of cached svg for key or None, if not cached."""
+        svg = self.svgs.get(key)
+        if svg is None:
+            return None
+        if not isinstance(svg, ElementTree.Element):
+            svg = self.getElementFromData(svg)
+            self.svgs[key] = svg
+        self.svgs.move_to_end(key)
+        return copy.deepcopy(svg)
+
+    def set(self, key: str, svg: ElementTree.Element):
+        """Cache copy of svg for key."""
+        self.svgs[key] = copy.deepcopy(svg)
+        self.svgs.move_to_end(key)
+        while len(self.svgs) > self.max_size:
+            self.svgs.popitem(last=False)
+        self.modified = True
+
+    def clear(self):
+        self.svgs.clear()
+        self.modified = True
+
+    def load(self):
+        """Load cached svgs from cache file."""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                self.svgs.update(json.load(f))
+        except (OSError, ValueError) as error:
+            FreeCAD.Console.PrintWarning(
+                "Unable to load rebar shape svg cache from {}: {}\n".format(
+                    self.cache_file, error
+                )
+            )
+        self.modified = False
+
+    def save(self):
+        """Save cached svgs to cache file, if cache is modified."""
+        if not self.cache_file or not self.modified:
+            return
+        svgs = {
+            key: (
+                self.getElementData(svg)
+                if isinstance(svg, ElementTree.Element)
+                else svg
+            )
+            for key, svg in self.svgs.items()
+        }
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(svgs, f)
+        except OSError as error:
+            FreeCAD.Console.PrintWarning(
+                "Unable to save rebar shape svg cache to {}: {}\n".format(
+                    self.cache_file, error
+                )
+            )
+            return
+        self.modified = False
+
+
+REBAR_SHAPE_SVG_CACHE = {}
+
+
+def getRebarShapeSVGCache(document=None) -> RebarShapeSVGCache:
+    """Returns rebar shape svg cache of document.
+
+    If "PersistSVGCache" preference of rebar shape cut list is enabled and
+    document is saved, then cache is persisted to json file next to document
+    file.
+
+    Parameters
+    ----------
+    document: <App::Document>, optional
+        The document to get its rebar shape svg cache. If not provided, active
+        document will be used.
+
+    Returns
+    -------
+    RebarShapeSVGCache
+        The rebar shape svg cache of document.
+    """
+    if document is None:
+        document = FreeCAD.ActiveDocument
+    document_name = document.Name if document else ""
+
+    cache_file = None
+    if document and document.FileName:
+        persist_cache = FreeCAD.ParamGet(
+            "User parameter:BaseApp/Preferences/Mod/RebarTools/"
+            "RebarShapeCutList"
+        ).GetBool("PersistSVGCache", False)
+        if persist_cache:
+            cache_file = (
+                os.path.splitext(document.FileName)[0]
+                + REBAR_SHAPE_SVG_CACHE_FILE_SUFFIX
+            )
+
+    cache = REBAR_SHAPE_SVG_CACHE.get(document_name)
+    if cache is None or cache.cache_file != cache_file:
+        cache = RebarShapeSVGCache(cache_file)
+        REBAR_SHAPE_SVG_CACHE[document_name] = cache
+    return cache
+
+
+@profiled
 def getRebarShapeSVG(
     rebar,
     view_direction: Union[FreeCAD.Vector, WorkingPlane.Plane] = FreeCAD.Vector(
@@ -426,6 +676,7 @@ def getRebarShapeSVG(
     max_width: float = 0,
     side_padding: float = 1,
     horizontal_shape: bool = False,
+    use_cache: bool = True,
 ) -> ElementTree.Element:
     """Generate and return rebar shape svg.
 
@@ -499,6 +750,11 @@ def getRebarShapeSVG(
         If True, then rebar shape will be made horizontal by rotating max
         length edge of rebar shape.
         Default is False.
+    use_cache: bool, optional
+        If True, then rebar shape svg will be reused from rebar shape svg cache
+        of rebar document for rebars with same shape and svg styling
+        arguments, see getRebarShapeSVGCache().
+        Default is True.
 
     Returns
     -------
@@ -541,6 +797,40 @@ def getRebarShapeSVG(
 
     rebar_color = getRebarColor(rebar, rebar_color_style)
 
+    if use_cache:
+        svg_cache = getRebarShapeSVGCache(rebar.Document)
+        svg_cache_key = svg_cache.getKey(
+            getRebarShapeSignature(rebar),
+            tuple(view_plane.u),
+            tuple(view_plane.v),
+            tuple(view_plane.axis),
+            include_mark,
+            stirrup_extended_edge_offset,
+            rebar_stroke_width,
+            rebar_color,
+            include_dimensions,
+            rebar_dimension_units,
+            precision,
+            include_units_in_dimension_label,
+            tuple(bent_angle_dimension_exclude_list),
+            dimension_font_family,
+            dimension_font_size,
+            helical_rebar_dimension_label_format,
+            scale,
+            max_height,
+            max_width,
+            side_padding,
+            horizontal_shape,
+        )
+        svg = svg_cache.get(svg_cache_key)
+        if svg is not None:
+            # Update rebar specific data of cached svg
+            rebar_shape_svg = svg[0]
+            rebar_shape_svg.set("id", str(rebar.Name))
+            if include_mark:
+                rebar_shape_svg[2].text = str(getRebarMark(rebar))
+            return svg
+
     # Create required svg elements
     svg = getSVGRootElement()
     rebar_shape_svg = ElementTree.Element("g", attrib={"id": str(rebar.Name)})
@@ -777,15 +1067,9 @@ def getRebarShapeSVG(
 
     # Include rebar.Mark in rebar shape svg
     if include_mark:
-        if hasattr(rebar, "Mark"):
-            mark = rebar.Mark
-        elif hasattr(rebar, "MarkNumber"):
-            mark = rebar.MarkNumber
-        else:
-            mark = ""
         rebar_shape_svg.append(
             getSVGTextElement(
-                mark,
+                getRebarMark(rebar),
                 rebar_shape_min_x,
                 rebar_shape_min_y
                 - (0.5 + bool(include_dimensions)) * dimension_font_size,
@@ -1015,9 +1299,12 @@ def getRebarShapeSVG(
                 edge_svg = ElementTree.Element("g")
             rebar_edges_svg.append(edge_svg)
 
+    if use_cache:
+        svg_cache.set(svg_cache_key, svg)
     return svg
 
 
+@profiled
 def getRebarShapeCutList(
     base_rebars_list: Optional[List] = None,
     view_directions: Union[
@@ -1047,6 +1334,7 @@ def getRebarShapeCutList(
     side_padding: float = 1,
     horizontal_rebar_shape: bool = True,
     output_file: Optional[str] = None,
+    pretty_print: bool = True,
 ) -> ElementTree.Element:
     """Generate and return rebar shape cut list svg.
 
@@ -1125,6 +1413,9 @@ def getRebarShapeCutList(
         Default is True.
     output_file: str, optional
         The output file to write generated rebar shape cut list svg.
+    pretty_print: bool, optional
+        If True, then svg written to output_file will be pretty printed.
+        Default is True.
 
     Returns
     -------
@@ -1233,15 +1524,9 @@ def getRebarShapeCutList(
         cell_svg.extend([cell_border_svg, rebar_shape_svg])
         # Include mark label in each row
         if include_mark:
-            if hasattr(rebar, "Mark"):
-                mark = rebar.Mark
-            elif hasattr(rebar, "MarkNumber"):
-                mark = rebar.MarkNumber
-            else:
-                mark = ""
             cell_svg.append(
                 getSVGTextElement(
-                    mark,
+                    getRebarMark(rebar),
                     2,
                     2 * dimension_font_size,
                     dimension_font_family,
@@ -1269,6 +1554,13 @@ def getRebarShapeCutList(
                 cell_svg.append(cell_border_svg)
                 rebar_shape_cut_list.append(cell_svg)
 
+    # Persist rebar shape svg cache of rebars documents, if enabled
+    documents = {
+        rebar.Document.Name: rebar.Document for rebar in base_rebars_list
+    }
+    for document in documents.values():
+        getRebarShapeSVGCache(document).save()
+
     svg_width = column_count * column_width
     svg_height = row * row_height
     svg.set("width", "{}mm".format(svg_width))
@@ -1279,15 +1571,12 @@ def getRebarShapeCutList(
     )
 
     if output_file:
-        svg_sheet = minidom.parseString(
-            ElementTree.tostring(svg, encoding="unicode")
-        ).toprettyxml(indent="  ")
         try:
             with open(output_file, "w", encoding="utf-8") as svg_output_file:
-                svg_output_file.write(svg_sheet)
+                writeSVG(svg, svg_output_file, pretty_print)
         except OSError:
             FreeCAD.Console.PrintError(
-                "Error writing svg to file " + str(svg_output_file) + "\n"
+                "Error writing svg to file " + str(output_file) + "\n"
             )
 
     return svg
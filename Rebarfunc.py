@@ -30,7 +30,11 @@ from PySide.QtCore import QT_TRANSLATE_NOOP
 from DraftGeomUtils import vec, isCubic
 import FreeCAD
 import FreeCADGui
+import functools
 import math
+import re
+from collections import namedtuple
+from contextlib import contextmanager
 
 # --------------------------------------------------------------------------
 # Generic functions
@@ -101,34 +105,194 @@ def facenormalDirection(structure=None, facename=None):
     return normal
 
 
+# Parsed sets of rebar specification strings, in which sets are joined by "+"
+NumberDiameter = namedtuple("NumberDiameter", ("number", "diameter"))
+NumberDiameterOffset = namedtuple(
+    "NumberDiameterOffset", ("number", "diameter", "offset")
+)
+NumberSpacing = namedtuple("NumberSpacing", ("number", "spacing"))
+
+# Grammar of one set of rebar specification string, with key SpecType and
+# value (CompiledPattern, SpecClass, Syntax). Number is an integer and
+# diameter/offset are lengths in mm, optionally followed by "mm".
+SPEC_NUMBER = r"\s*(\d+)\s*"
+SPEC_FLOAT = r"\s*(-?(?:\d+(?:\.\d*)?|\.\d+))\s*"
+SPEC_LENGTH = SPEC_FLOAT + r"(?:mm)?\s*"
+REBAR_SPEC_GRAMMAR = {
+    "NumberDiameter": (
+        re.compile(SPEC_NUMBER + "#" + SPEC_LENGTH),
+        NumberDiameter,
+        "number#diameter",
+    ),
+    "NumberDiameterOffset": (
+        re.compile(SPEC_NUMBER + "#" + SPEC_LENGTH + "@" + SPEC_LENGTH),
+        NumberDiameterOffset,
+        "number#diameter@offset",
+    ),
+    "NumberSpacing": (
+        re.compile(SPEC_NUMBER + "@" + SPEC_FLOAT),
+        NumberSpacing,
+        "number@spacing",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def parseRebarSpecString(spec_string, spec_type):
+    """parseRebarSpecString(SpecString, SpecType):
+    Parse spec_string having sets joined by "+", each set in syntax of
+    spec_type from REBAR_SPEC_GRAMMAR. Results are memoised by spec_string,
+    so they are returned as immutable tuple of namedtuples of spec_type.
+    For eg.
+    Input: ("2#20@50+3#16mm@100", "NumberDiameterOffset")
+    Output: (
+                NumberDiameterOffset(number=2, diameter=20.0, offset=50.0),
+                NumberDiameterOffset(number=3, diameter=16.0, offset=100.0),
+            )
+
+    Raises ValueError with invalid set and expected syntax, if spec_string
+    does not follow syntax of spec_type.
+    """
+    pattern, spec_class, syntax = REBAR_SPEC_GRAMMAR[spec_type]
+    specs = []
+    for index, spec_set in enumerate(spec_string.strip().split("+")):
+        match = pattern.fullmatch(spec_set)
+        if not match:
+            raise ValueError(
+                'Invalid set {} "{}" in "{}", expected {}'.format(
+                    index + 1, spec_set, spec_string, syntax
+                )
+            )
+        number, *values = match.groups()
+        specs.append(spec_class(int(number), *map(float, values)))
+    return tuple(specs)
+
+
 def gettupleOfNumberDiameter(diameter_string):
     """gettupleOfNumberDiameter(diameter_string): This function take input in
-    specific syntax and return output in the form of list. For eg.
+    specific syntax and return output in the form of tuple. For eg.
     Input: "3#100+2#200+3#100"
-    Output: [(3, 100), (2, 200), (3, 100)]"""
-    diameter_st = diameter_string.strip()
-    diameter_sp = diameter_st.split("+")
-    index = 0
-    number_diameter_list = []
-    while index < len(diameter_sp):
-        # Find "#" recursively in diameter_sp array.
-        in_sp = diameter_sp[index].split("#")
-        number_diameter_list.append(
-            (int(in_sp[0]), float(in_sp[1].replace("mm", "")))
-        )
-        index += 1
-    return number_diameter_list
+    Output: ((3, 100), (2, 200), (3, 100))"""
+    return parseRebarSpecString(diameter_string, "NumberDiameter")
 
 
 # --------------------------------------------------------------------------
 # Main functions which is use while creating any rebar.
 # --------------------------------------------------------------------------
 
+# Analysed parameters of structures, with key (DocumentName, StructureName)
+# and value {"ShapeHash": ShapeHash, "Parameters": {Key: Parameters}}
+STRUCTURE_PARAMETERS_CACHE = {}
+
+
+def getShapeHash(obj):
+    """getShapeHash(obj): Returns hash of shape and placement of object, which
+    changes whenever shape of object is changed.
+    Shape.hashCode() alone may repeat for a new shape allocated at the address
+    of a freed one, so bounding box of shape is part of hash too."""
+    shape = obj.Shape
+    if shape.isNull():
+        bound_box = None
+    else:
+        bound_box = shape.BoundBox
+        bound_box = (
+            bound_box.XMin,
+            bound_box.YMin,
+            bound_box.ZMin,
+            bound_box.XMax,
+            bound_box.YMax,
+            bound_box.ZMax,
+        )
+    return (
+        shape.hashCode(),
+        bound_box,
+        tuple(obj.Placement.toMatrix().A),
+    )
+
+
+def getCachedParameters(obj, key, func):
+    """getCachedParameters(obj, key, func):
+    Returns parameters of obj for given key from cache, if shape of obj is not
+    changed since they were cached. Otherwise, parameters are computed using
+    func(), stored in cache and returned."""
+    cache_key = (obj.Document.Name, obj.Name)
+    shape_hash = getShapeHash(obj)
+    cache = STRUCTURE_PARAMETERS_CACHE.get(cache_key)
+    if cache is None or cache["ShapeHash"] != shape_hash:
+        cache = {"ShapeHash": shape_hash, "Parameters": {}}
+        STRUCTURE_PARAMETERS_CACHE[cache_key] = cache
+    if key not in cache["Parameters"]:
+        cache["Parameters"][key] = func()
+    return cache["Parameters"][key]
+
+
+def clearStructureParametersCache(obj=None):
+    """clearStructureParametersCache([obj]): Clear cached parameters of obj
+    or of all structures, if obj is not given."""
+    if obj is None:
+        STRUCTURE_PARAMETERS_CACHE.clear()
+    else:
+        STRUCTURE_PARAMETERS_CACHE.pop((obj.Document.Name, obj.Name), None)
+
+
+def getStructureExtent(obj, direction):
+    """getStructureExtent(obj, direction): Returns extent of structural
+    element along direction i.e. distance between its extreme vertexes
+    projected on direction. It is same as length of
+    ArchCommands.projectToVector(obj.Shape.copy(), direction), without copying
+    shape.
+    If direction is along x, y or z axis, extent is taken from bounding box of
+    shape. Otherwise, it is computed from vertexes of shape and cached until
+    shape of obj is changed."""
+    direction = FreeCAD.Vector(direction).normalize()
+    axis_extent = getStructureAxisExtent(obj, direction)
+    if axis_extent is not None:
+        return axis_extent
+    return getCachedParameters(
+        obj,
+        ("Extent",) + tuple(round(value, 9) for value in direction),
+        lambda: computeStructureExtent(obj, direction),
+    )
+
+
+def getStructureAxisExtent(obj, direction):
+    """getStructureAxisExtent(obj, direction): Returns extent of structural
+    element from its bounding box, if unit vector direction is along x, y or
+    z axis. Otherwise, returns None."""
+    components = (abs(direction.x), abs(direction.y), abs(direction.z))
+    if sorted(components)[1] > 1e-9 or obj.Shape.isNull():
+        return None
+    bound_box = obj.Shape.BoundBox
+    return (bound_box.XLength, bound_box.YLength, bound_box.ZLength)[
+        components.index(max(components))
+    ]
+
+
+def computeStructureExtent(obj, direction):
+    """computeStructureExtent(obj, direction): Uncached version of
+    getStructureExtent() computed from vertexes of shape, direction must be a
+    unit vector."""
+    distances = [vertex.Point.dot(direction) for vertex in obj.Shape.Vertexes]
+    return max(distances) - min(distances)
+
 
 def getTrueParametersOfStructure(obj):
     """getTrueParametersOfStructure(obj): This function return actual length,
     width and height of the structural element in the form of array like
     [Length, Width, Height]"""
+    parameters = getCachedParameters(
+        obj,
+        "TrueParameters",
+        lambda: computeTrueParametersOfStructure(obj),
+    )
+    if parameters is None:
+        return None
+    return list(parameters)
+
+
+def computeTrueParametersOfStructure(obj):
+    """computeTrueParametersOfStructure(obj): Uncached version of
+    getTrueParametersOfStructure()."""
     baseObject = getBaseObject(obj)
     # If selected_obj is not derived from any base object
     if baseObject:
@@ -165,6 +329,20 @@ def getTrueParametersOfStructure(obj):
 
 def getParametersOfFace(structure, facename, sketch=True):
     """getParametersOfFace(structure, facename, sketch = True):
+    Returns cached result of computeParametersOfFace(). The face is analysed
+    again only when shape of structure is changed."""
+    face_parameters = getCachedParameters(
+        structure,
+        ("FaceParameters", facename, bool(sketch)),
+        lambda: computeParametersOfFace(structure, facename, sketch),
+    )
+    if sketch:
+        return list(face_parameters)
+    return [face_parameters[0], FreeCAD.Vector(face_parameters[1])]
+
+
+def computeParametersOfFace(structure, facename, sketch=True):
+    """computeParametersOfFace(structure, facename, sketch = True):
     This function will return length, width and points of center of mass of a
     given face w.r.t sketch value.
 
@@ -750,8 +928,8 @@ def getdictofNumberDiameterOffset(number_diameter_offset_tuple):
     dictionary. For eg.
     Input: ("2#20@50+3#16@100+2#20@50", "1#18@30+2#14@30+1#18@30")
     Output: {
-                'layer1': [(2, 20, 50), (3, 16, 100), (2, 20, 50)],
-                'layer2': [(1, 18, 30), (2, 14, 30), (1, 18, 30)],
+                'layer1': ((2, 20, 50), (3, 16, 100), (2, 20, 50)),
+                'layer2': ((1, 18, 30), (2, 14, 30), (1, 18, 30)),
             }
     """
     number_diameter_offset_dict = {}
@@ -769,26 +947,11 @@ def gettupleOfNumberDiameterOffset(number_diameter_offset_string):
     This function take input in specific syntax and return output in the form of
     tuple. For eg.
     Input: "2#20@50+3#16@100+2#20@50"
-    Output: [(2, 20, 50), (3, 16, 100), (2, 20, 50)]
+    Output: ((2, 20, 50), (3, 16, 100), (2, 20, 50))
     """
-    import re
-
-    number_diameter_offset_st = number_diameter_offset_string.strip()
-    number_diameter_offset_sp = number_diameter_offset_st.split("+")
-    index = 0
-    number_diameter_offset_list = []
-    while index < len(number_diameter_offset_sp):
-        # Find "#" and "@" recursively in number_diameter_offset_sp array.
-        in_sp = re.split("#|@", number_diameter_offset_sp[index])
-        number_diameter_offset_list.append(
-            (
-                int(in_sp[0]),
-                float(in_sp[1].replace("mm", "")),
-                float(in_sp[2].replace("mm", "")),
-            )
-        )
-        index += 1
-    return number_diameter_offset_list
+    return parseRebarSpecString(
+        number_diameter_offset_string, "NumberDiameterOffset"
+    )
 
 
 class _ViewProviderBeamReinforcementGroup:
@@ -866,6 +1029,166 @@ def get_rebar_amount_from_spacing(bar_distribution_len, bar_dia, spacing):
     return math.ceil((bar_distribution_len - bar_dia) / spacing) + 1
 
 
+class BatchRecomputeObserver:
+    """Document observer to collect names of objects created or changed inside
+    batch_recompute() context."""
+
+    def __init__(self, document):
+        self.document = document
+        self.object_names = set()
+
+    def slotCreatedObject(self, obj):
+        if obj.Document == self.document:
+            self.object_names.add(obj.Name)
+
+    def slotChangedObject(self, obj, prop):
+        if obj.Document == self.document:
+            self.object_names.add(obj.Name)
+
+    def slotDeletedObject(self, obj):
+        if obj.Document == self.document:
+            self.object_names.discard(obj.Name)
+
+    def getObjects(self):
+        """Returns list of collected objects and objects depending on them."""
+        objects = {}
+        for name in self.object_names:
+            obj = self.document.getObject(name)
+            if obj is None:
+                continue
+            objects[obj.Name] = obj
+            for dependent_obj in obj.InListRecursive:
+                objects[dependent_obj.Name] = dependent_obj
+        return list(objects.values())
+
+
+BATCH_RECOMPUTE_OBSERVER = None
+
+
+@contextmanager
+def batch_recompute(document=None):
+    """batch_recompute([Document]):
+    Context manager to suppress intermediate recomputes of document, requested
+    by reinforcement builders with recompute(). On exit of outermost context,
+    only the objects created or changed inside context and objects depending
+    on them are recomputed, once. It can be used as decorator too.
+
+    e.g.
+        with batch_recompute():
+            makeStraightRebar(...)
+            makeStirrup(...)
+    """
+    global BATCH_RECOMPUTE_OBSERVER
+    if BATCH_RECOMPUTE_OBSERVER is not None:
+        # Nested context, outermost context will recompute document
+        yield
+        return
+
+    if document is None:
+        document = FreeCAD.ActiveDocument
+    observer = BatchRecomputeObserver(document)
+    BATCH_RECOMPUTE_OBSERVER = observer
+    FreeCAD.addDocumentObserver(observer)
+    try:
+        yield
+    finally:
+        FreeCAD.removeDocumentObserver(observer)
+        BATCH_RECOMPUTE_OBSERVER = None
+        objects = observer.getObjects()
+        if objects:
+            try:
+                document.recompute(objects)
+            except TypeError:
+                # Recompute of objects list is not supported
+                document.recompute()
+
+
+def isBatchRecompute():
+    """isBatchRecompute(): Returns True if recompute of document is deferred
+    by batch_recompute() context."""
+    return BATCH_RECOMPUTE_OBSERVER is not None
+
+
+def recompute(*required_objects):
+    """recompute([RequiredObjects]):
+    Recompute active document. Inside batch_recompute() context, recompute of
+    document is deferred to exit of context and only required_objects, whose
+    shape or placement is needed up to date at this point, are recomputed
+    immediately.
+    """
+    if not isBatchRecompute():
+        FreeCAD.ActiveDocument.recompute()
+        return
+    for obj in required_objects:
+        obj.recompute()
+
+
+def makeReinforcementOfStructures(
+    make_reinforcement, structure_facename_list, config
+):
+    """makeReinforcementOfStructures(MakeReinforcement,
+    StructureFacenameList, Config):
+    Reinforce each (structure, facename) in structure_facename_list using
+    make_reinforcement() with keyword arguments from config. All structures
+    are reinforced inside one batch_recompute() context, so document is
+    recomputed only once at the end. Each structure must appear only once in
+    structure_facename_list, otherwise ValueError is raised before any
+    structure is reinforced.
+
+    If reinforcing a structure raises an error, it is printed on console and
+    remaining structures are still reinforced.
+
+    Returns dictionary with structure as key and reinforcement group created
+    by make_reinforcement() (None on error) as value.
+    """
+    structures = set()
+    duplicate_structures = set()
+    for structure, _ in structure_facename_list:
+        if structure in structures:
+            duplicate_structures.add(structure.Name)
+        structures.add(structure)
+    if duplicate_structures:
+        raise ValueError(
+            "Structures to reinforce are listed more than once: {}".format(
+                ", ".join(sorted(duplicate_structures))
+            )
+        )
+
+    structure_group_dict = {}
+    with batch_recompute():
+        for structure, facename in structure_facename_list:
+            try:
+                structure_group_dict[structure] = make_reinforcement(
+                    structure=structure, facename=facename, **config
+                )
+            except Exception as error:
+                FreeCAD.Console.PrintError(
+                    "Error reinforcing {}: {}\n".format(structure.Name, error)
+                )
+                structure_group_dict[structure] = None
+    return structure_group_dict
+
+
+def setSketchLinePoints(sketch, points):
+    """setSketchLinePoints(Sketch, Points):
+    Set end points of lines of rebar base sketch, such that line i joins
+    points[i] and points[i + 1]. If sketch has no constraints, its geometry
+    list is replaced in place at once, keeping geometry indices unchanged.
+    Otherwise end points are moved with sketch.movePoint(), so that
+    constraints of sketch are kept and satisfied.
+    """
+    import Part
+
+    if sketch.ConstraintCount:
+        for i, (p1, p2) in enumerate(zip(points, points[1:])):
+            sketch.movePoint(i, 1, p1, 0)
+            sketch.movePoint(i, 2, p2, 0)
+    else:
+        sketch.Geometry = [
+            Part.LineSegment(p1, p2) for p1, p2 in zip(points, points[1:])
+        ]
+
+
 def showWarning(message):
     """showWarning(message): This function is used to produce warning
     message for the user."""
@@ -782,65 +782,64 @@ class _ReinforcementDrawingDimensioningDialog:
 
         rebars_list = getFreeCADObjectsList(reinforcement_objs)
         FreeCADGui.addModule("ReinforcementDrawing.make_reinforcement_drawing")
-        for view in views:
-            FreeCADGui.doCommand(
-                "ReinforcementDrawing.make_reinforcement_drawing."
-                "makeStructuresReinforcementDrawing(structure_list=None, "
-                f"rebars_list={rebars_list}, "
-                f'view="{view}", '
-                f"rebars_stroke_width={rebars_stroke_width}, "
-                f'rebars_color_style="{rebars_color_style}", '
-                f"rebars_color={rebars_color}, "
-                f"structure_stroke_width={structure_stroke_width}, "
-                f'structure_color_style="{structure_color_style}", '
-                f"structure_color={structure_color}, "
-                f"drawing_left_offset={drawing_left_offset}, "
-                f"drawing_top_offset={drawing_top_offset}, "
-                f"drawing_min_right_offset={drawing_min_right_offset}, "
-                f"drawing_min_bottom_offset={drawing_min_bottom_offset}, "
-                f"drawing_max_width={drawing_max_width}, "
-                f"drawing_max_height={drawing_max_height}, "
-                f'template_file=r"{template_file}", '
-                f"perform_dimensioning={perform_dimensioning}, "
-                "dimension_rebars_filter_list=None, "
-                f'dimension_label_format="{dimension_label_format}",  '
-                f'dimension_font_family="{dimension_font_family}", '
-                f"dimension_font_size={dimension_font_size}, "
-                f"dimension_stroke_width={dimension_stroke_width}, "
-                f'dimension_line_style="{dimension_line_style}",'
-                f" dimension_line_color={dimension_line_color}, "
-                f"dimension_text_color={dimension_text_color}, "
-                'dimension_single_rebar_line_start_symbol="'
-                f'{dimension_single_rebar_line_start_symbol}", '
-                'dimension_single_rebar_line_end_symbol="'
-                f'{dimension_single_rebar_line_end_symbol}", '
-                'dimension_multi_rebar_line_start_symbol="'
-                f'{dimension_multi_rebar_line_start_symbol}", '
-                'dimension_multi_rebar_line_end_symbol="'
-                f'{dimension_multi_rebar_line_end_symbol}", '
-                'dimension_line_mid_point_symbol="'
-                f'{dimension_line_mid_point_symbol}", '
-                f"dimension_left_offset={dimension_left_offset}, "
-                f"dimension_right_offset={dimension_right_offset}, "
-                f"dimension_top_offset={dimension_top_offset}, "
-                f"dimension_bottom_offset={dimension_bottom_offset}, "
-                "dimension_left_offset_increment="
-                f"{dimension_left_offset_increment}, "
-                "dimension_right_offset_increment="
-                f"{dimension_right_offset_increment}, "
-                "dimension_top_offset_increment="
-                f"{dimension_top_offset_increment}, "
-                "dimension_bottom_offset_increment="
-                f"{dimension_bottom_offset_increment}, "
-                "dimension_single_rebar_outer_dim="
-                f"{dimension_single_rebar_outer_dim}, "
-                "dimension_multi_rebar_outer_dim="
-                f"{dimension_multi_rebar_outer_dim}, "
-                "dimension_single_rebar_text_position_type="
-                f'"{dimension_single_rebar_text_position_type}", '
-                "dimension_multi_rebar_text_position_type="
-                f'"{dimension_multi_rebar_text_position_type}")'
-            )
+        FreeCADGui.doCommand(
+            "ReinforcementDrawing.make_reinforcement_drawing."
+            "makeStructuresReinforcementDrawings(structure_list=None, "
+            f"rebars_list={rebars_list}, "
+            f"views={views}, "
+            f"rebars_stroke_width={rebars_stroke_width}, "
+            f'rebars_color_style="{rebars_color_style}", '
+            f"rebars_color={rebars_color}, "
+            f"structure_stroke_width={structure_stroke_width}, "
+            f'structure_color_style="{structure_color_style}", '
+            f"structure_color={structure_color}, "
+            f"drawing_left_offset={drawing_left_offset}, "
+            f"drawing_top_offset={drawing_top_offset}, "
+            f"drawing_min_right_offset={drawing_min_right_offset}, "
+            f"drawing_min_bottom_offset={drawing_min_bottom_offset}, "
+            f"drawing_max_width={drawing_max_width}, "
+            f"drawing_max_height={drawing_max_height}, "
+            f'template_file=r"{template_file}", '
+            f"perform_dimensioning={perform_dimensioning}, "
+            "dimension_rebars_filter_list=None, "
+            f'dimension_label_format="{dimension_label_format}",  '
+            f'dimension_font_family="{dimension_font_family}", '
+            f"dimension_font_size={dimension_font_size}, "
+            f"dimension_stroke_width={dimension_stroke_width}, "
+            f'dimension_line_style="{dimension_line_style}",'
+            f" dimension_line_color={dimension_line_color}, "
+            f"dimension_text_color={dimension_text_color}, "
+            'dimension_single_rebar_line_start_symbol="'
+            f'{dimension_single_rebar_line_start_symbol}", '
+            'dimension_single_rebar_line_end_symbol="'
+            f'{dimension_single_rebar_line_end_symbol}", '
+            'dimension_multi_rebar_line_start_symbol="'
+            f'{dimension_multi_rebar_line_start_symbol}", '
+            'dimension_multi_rebar_line_end_symbol="'
+            f'{dimension_multi_rebar_line_end_symbol}", '
+            'dimension_line_mid_point_symbol="'
+            f'{dimension_line_mid_point_symbol}", '
+            f"dimension_left_offset={dimension_left_offset}, "
+            f"dimension_right_offset={dimension_right_offset}, "
+            f"dimension_top_offset={dimension_top_offset}, "
+            f"dimension_bottom_offset={dimension_bottom_offset}, "
+            "dimension_left_offset_increment="
+            f"{dimension_left_offset_increment}, "
+            "dimension_right_offset_increment="
+            f"{dimension_right_offset_increment}, "
+            "dimension_top_offset_increment="
+            f"{dimension_top_offset_increment}, "
+            "dimension_bottom_offset_increment="
+            f"{dimension_bottom_offset_increment}, "
+            "dimension_single_rebar_outer_dim="
+            f"{dimension_single_rebar_outer_dim}, "
+            "dimension_multi_rebar_outer_dim="
+            f"{dimension_multi_rebar_outer_dim}, "
+            "dimension_single_rebar_text_position_type="
+            f'"{dimension_single_rebar_text_position_type}", '
+            "dimension_multi_rebar_text_position_type="
+            f'"{dimension_multi_rebar_text_position_type}")'
+        )
         self.form.close()
 
 
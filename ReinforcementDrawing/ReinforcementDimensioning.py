@@ -473,6 +473,19 @@ class ReinforcementDimensioning:
             )
             obj.MultiRebar_OuterDimension = DIMENSION_MULTI_REBAR_OUTER_DIM
 
+        if not hasattr(obj, "DimensionLineSeed"):
+            obj.addProperty(
+                "App::PropertyInteger",
+                "DimensionLineSeed",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The seed to shift position of dimension line for "
+                    "automated reinforcement dimensioning",
+                ),
+            )
+            obj.DimensionLineSeed = 0
+
         if not hasattr(obj, "SingleRebar_TextPositionType"):
             obj.addProperty(
                 "App::PropertyEnumeration",
@@ -567,13 +580,29 @@ class ReinforcementDimensioning:
         root_svg = getSVGRootElement()
 
         view_plane = getViewPlane(obj.ParentDrawingView.View)
-        min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
-            obj.ParentDrawingView.Structure,
-            obj.ParentDrawingView.Rebars,
-            view_plane,
-        )
+        # Use drawing bounds stored by parent drawing view on its recompute,
+        # instead of computing them again for each dimensioning object
+        if len(getattr(obj.ParentDrawingView, "DrawingBounds", [])) == 4:
+            min_x, min_y, max_x, max_y = obj.ParentDrawingView.DrawingBounds
+        else:
+            min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
+                obj.ParentDrawingView.Structure,
+                obj.ParentDrawingView.Rebars,
+                view_plane,
+            )
 
         if obj.WayPointsType == "Automatic":
+            # Index of rebar in parent drawing view, to place its dimension
+            # line deterministically. Rebar may be not visible in view anymore
+            parent_drawing_view = obj.ParentDrawingView
+            if obj.Rebar in parent_drawing_view.VisibleRebars:
+                dimension_index = parent_drawing_view.VisibleRebars.index(
+                    obj.Rebar
+                )
+            elif obj.Rebar in parent_drawing_view.Rebars:
+                dimension_index = parent_drawing_view.Rebars.index(obj.Rebar)
+            else:
+                dimension_index = 0
             dimension_data_list, dimension_align = getRebarDimensionData(
                 obj.Rebar,
                 obj.DimensionFormat,
@@ -589,6 +618,8 @@ class ReinforcementDimensioning:
                 obj.Scale,
                 obj.SingleRebar_OuterDimension,
                 obj.MultiRebar_OuterDimension,
+                dimension_index,
+                obj.DimensionLineSeed,
             )
             if hasattr(self, "FirstExecute") and self.FirstExecute is True:
                 self.FirstExecute = False
@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 
 import math
 from xml.etree import ElementTree
-import random
 
 import FreeCAD
 import DraftGeomUtils
@@ -43,6 +42,28 @@ from .ReinforcementDrawingfunc import (
 from SVGfunc import getSVGTextElement, getLinePathElement
 
 
+def getDimensionLinePosition(min_value, max_value, dimension_index=0, seed=0):
+    """getDimensionLinePosition(MinValue, MaxValue, [DimensionIndex, Seed]):
+    Returns position of dimension line between min_value and max_value.
+
+    Position is deterministic: it is the (dimension_index + seed + 1)th term
+    of van der Corput sequence (1/2, 1/4, 3/4, 1/8, 5/8, ...) scaled to the
+    interval, so that each successive dimension line is placed in the middle
+    of the largest free part of the interval left by dimension lines of
+    smaller indices. seed can be changed to shift all dimension lines.
+    Negative dimension_index is taken as 0 and negative seed by its absolute
+    value.
+    """
+    index = max(0, dimension_index) + abs(seed) + 1
+    fraction = 0
+    denominator = 1
+    for _ in range(index.bit_length()):
+        denominator *= 2
+        index, remainder = divmod(index, 2)
+        fraction += remainder / denominator
+    return round(min_value + fraction * (max_value - min_value))
+
+
 def getPathMidPoint(points_list, return_left_right_points=False):
     """getPathMidPoint(PointsList, [ReturnLeftRightPoints]):
     Returns mid point of path defined by points_list.
@@ -633,6 +654,8 @@ def getStraightRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    dimension_index=0,
+    seed=0,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -649,8 +672,8 @@ def getStraightRebarDimensionData(
 
         # Rebar is more horizontal, so dimension line will be vertical
         if abs(p2.y - p1.y) <= abs(p2.x - p1.x):
-            start_x = end_x = random.randint(
-                int(min(p1.x, p2.x)), int(max(p1.x, p2.x))
+            start_x = end_x = getDimensionLinePosition(
+                min(p1.x, p2.x), max(p1.x, p2.x), dimension_index, seed
             )
             # Rebar is more closer to top of drawing
             if abs(svg_min_y - min(p1.y, p2.y)) < abs(
@@ -677,8 +700,8 @@ def getStraightRebarDimensionData(
 
         # Rebar is more vertical, so dimension line will be horizontal
         else:
-            start_y = end_y = random.randint(
-                int(min(p1.y, p2.y)), int(max(p1.y, p2.y))
+            start_y = end_y = getDimensionLinePosition(
+                min(p1.y, p2.y), max(p1.y, p2.y), dimension_index, seed
             )
             # Rebar is more closer to left of drawing
             if abs(svg_min_x - min(p1.x, p2.x)) < abs(
@@ -1005,6 +1028,8 @@ def getLShapeRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    dimension_index=0,
+    seed=0,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -1023,8 +1048,8 @@ def getLShapeRebarDimensionData(
             p2 = getProjectionToSVGPlane(basewire.Vertexes[1].Point, view_plane)
         # Rebar is more horizontal, so dimension line will be vertical
         if abs(p2.y - p1.y) <= abs(p2.x - p1.x):
-            start_x = end_x = random.randint(
-                int(min(p1.x, p2.x)), int(max(p1.x, p2.x))
+            start_x = end_x = getDimensionLinePosition(
+                min(p1.x, p2.x), max(p1.x, p2.x), dimension_index, seed
             )
             # Rebar is more closer to top of drawing
             if abs(svg_min_y - min(p1.y, p2.y)) < abs(
@@ -1051,8 +1076,8 @@ def getLShapeRebarDimensionData(
 
         # Rebar is more vertical, so dimension line will be horizontal
         else:
-            start_y = end_y = random.randint(
-                int(min(p1.y, p2.y)), int(max(p1.y, p2.y))
+            start_y = end_y = getDimensionLinePosition(
+                min(p1.y, p2.y), max(p1.y, p2.y), dimension_index, seed
             )
             # Rebar is more closer to left of drawing
             if abs(svg_min_x - min(p1.x, p2.x)) < abs(
@@ -1420,6 +1445,8 @@ def getUShapeRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    dimension_index=0,
+    seed=0,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -1438,8 +1465,8 @@ def getUShapeRebarDimensionData(
 
         # Rebar is more horizontal, so dimension line will be vertical
         if abs(p2.y - p1.y) <= abs(p2.x - p1.x):
-            start_x = end_x = random.randint(
-                int(min(p1.x, p2.x)), int(max(p1.x, p2.x))
+            start_x = end_x = getDimensionLinePosition(
+                min(p1.x, p2.x), max(p1.x, p2.x), dimension_index, seed
             )
             # Rebar is more closer to top of drawing
             if abs(svg_min_y - min(p1.y, p2.y)) < abs(
@@ -1466,8 +1493,8 @@ def getUShapeRebarDimensionData(
 
         # Rebar is more vertical, so dimension line will be horizontal
         else:
-            start_y = end_y = random.randint(
-                int(min(p1.y, p2.y)), int(max(p1.y, p2.y))
+            start_y = end_y = getDimensionLinePosition(
+                min(p1.y, p2.y), max(p1.y, p2.y), dimension_index, seed
             )
             # Rebar is more closer to left of drawing
             if abs(svg_min_x - min(p1.x, p2.x)) < abs(
@@ -1839,6 +1866,8 @@ def getBentRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    dimension_index=0,
+    seed=0,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -1857,8 +1886,8 @@ def getBentRebarDimensionData(
 
         # Rebar is more horizontal, so dimension line will be vertical
         if abs(p2.y - p1.y) <= abs(p2.x - p1.x):
-            start_x = end_x = random.randint(
-                int(min(p1.x, p2.x)), int(max(p1.x, p2.x))
+            start_x = end_x = getDimensionLinePosition(
+                min(p1.x, p2.x), max(p1.x, p2.x), dimension_index, seed
             )
             # Rebar is more closer to top of drawing
             if abs(svg_min_y - min(p1.y, p2.y)) < abs(
@@ -1885,8 +1914,8 @@ def getBentRebarDimensionData(
 
         # Rebar is more vertical, so dimension line will be horizontal
         else:
-            start_y = end_y = random.randint(
-                int(min(p1.y, p2.y)), int(max(p1.y, p2.y))
+            start_y = end_y = getDimensionLinePosition(
+                min(p1.y, p2.y), max(p1.y, p2.y), dimension_index, seed
             )
             # Rebar is more closer to left of drawing
             if abs(svg_min_x - min(p1.x, p2.x)) < abs(
@@ -2271,6 +2300,8 @@ def getHelicalRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    dimension_index=0,
+    seed=0,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -2281,9 +2312,8 @@ def getHelicalRebarDimensionData(
         basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
         point = getProjectionToSVGPlane(
             basewire.Vertexes[
-                random.randint(
-                    int(min(0, len(basewire.Vertexes) - 1)),
-                    int(max(0, len(basewire.Vertexes) - 1)),
+                getDimensionLinePosition(
+                    0, len(basewire.Vertexes) - 1, dimension_index, seed
                 )
             ].Point,
             view_plane,
@@ -2438,6 +2468,8 @@ def getRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    dimension_index=0,
+    seed=0,
 ):
     if rebar.RebarShape == "Stirrup":
         dimension_data = getStirrupDimensionData(
@@ -2472,6 +2504,8 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            dimension_index,
+            seed,
         )
     elif rebar.RebarShape == "LShapeRebar":
         dimension_data = getLShapeRebarDimensionData(
@@ -2489,6 +2523,8 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            dimension_index,
+            seed,
         )
     elif rebar.RebarShape == "UShapeRebar":
         dimension_data = getUShapeRebarDimensionData(
@@ -2506,6 +2542,8 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            dimension_index,
+            seed,
         )
     elif rebar.RebarShape == "BentShapeRebar":
         dimension_data = getBentRebarDimensionData(
@@ -2523,6 +2561,8 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            dimension_index,
+            seed,
         )
     elif rebar.RebarShape == "HelicalRebar":
         dimension_data = getHelicalRebarDimensionData(
@@ -2540,5 +2580,7 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            dimension_index,
+            seed,
         )
     return dimension_data
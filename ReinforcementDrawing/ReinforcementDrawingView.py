@@ -26,6 +26,7 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
+import hashlib
 from xml.etree import ElementTree
 
 import FreeCAD
@@ -34,15 +35,17 @@ from Draft import getrgb
 
 from .ReinforcementDrawingfunc import (
     getViewPlane,
-    getSVGWidthHeight,
+    getDrawingMinMaxXY,
     getReinforcementDrawingSVGData,
 )
+from Rebarfunc import getShapeHash
 from SVGfunc import getTechdrawViewScalingFactor
 from .config import (
     DIMENSION_LEFT_OFFSET,
     DIMENSION_RIGHT_OFFSET,
     DIMENSION_TOP_OFFSET,
     DIMENSION_BOTTOM_OFFSET,
+    DIMENSION_FONT_SIZE,
 )
 
 
@@ -289,6 +292,21 @@ class ReinforcementDrawingView:
             )
             obj.MaxHeight = 250
 
+        if not hasattr(obj, "LODThreshold"):
+            obj.addProperty(
+                "App::PropertyInteger",
+                "LODThreshold",
+                "ReinforcementDrawingView",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Regular runs of more than this number of straight, "
+                    "u-shape, l-shape or bent rebars are drawn as first and "
+                    "last rebars with distribution annotation. Set 0 to draw "
+                    "all rebars",
+                ),
+            )
+            obj.LODThreshold = 0
+
         if not hasattr(obj, "VisibleRebars"):
             obj.addProperty(
                 "App::PropertyLinkList",
@@ -302,6 +320,34 @@ class ReinforcementDrawingView:
             )
         obj.setEditorMode("VisibleRebars", 2)
 
+        if not hasattr(obj, "DrawingBounds"):
+            obj.addProperty(
+                "App::PropertyFloatList",
+                "DrawingBounds",
+                "ReinforcementDrawingView",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The min_x, min_y, max_x and max_y of drawing in view "
+                    "plane",
+                ),
+                8,
+            )
+        obj.setEditorMode("DrawingBounds", 2)
+
+        if not hasattr(obj, "InputsFingerprint"):
+            obj.addProperty(
+                "App::PropertyString",
+                "InputsFingerprint",
+                "ReinforcementDrawingView",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The fingerprint of inputs of drawing, used to skip its "
+                    "regeneration when inputs are not changed",
+                ),
+                8,
+            )
+        obj.setEditorMode("InputsFingerprint", 2)
+
         # These offsets are used by ReinforcementDimensioning objects to
         # auto-calculate rebars dimension points to align dimension text to
         # left, right, top or bottom line
@@ -386,6 +432,83 @@ class ReinforcementDrawingView:
             )
             return
 
+        # Reuse existing drawing svg, if none of its inputs is changed
+        inputs_fingerprint = self.getInputsFingerprint(obj)
+        if obj.Symbol and obj.InputsFingerprint == inputs_fingerprint:
+            return
+
+        view_plane = self.updateLayout(obj)
+        rebars_color_style, struct_fill_style = self.getColorStyles(obj)
+
+        reinforcement_drawing_data = getReinforcementDrawingSVGData(
+            obj.Structure,
+            obj.Rebars,
+            view_plane,
+            obj.RebarsStrokeWidth.Value / obj.Scale,
+            rebars_color_style,
+            obj.StructureStrokeWidth.Value / obj.Scale,
+            struct_fill_style,
+            obj.DrawingBounds,
+            obj.LODThreshold,
+            DIMENSION_FONT_SIZE / obj.Scale,
+        )
+        obj.Symbol = ElementTree.tostring(
+            reinforcement_drawing_data["svg"], encoding="unicode"
+        )
+        obj.VisibleRebars = reinforcement_drawing_data["rebars"]
+        obj.InputsFingerprint = inputs_fingerprint
+
+        if FreeCAD.GuiUp:
+            obj.ViewObject.update()
+
+    def getInputsFingerprint(self, obj):
+        """Returns fingerprint of inputs of ReinforcementDrawing object i.e.
+        shapes and placements of structure and rebars, view, styles and
+        layout properties. Width, Height, X, Y and automatic Scale are not
+        included, as they are computed from these inputs."""
+        struct = obj.Structure
+        inputs = [
+            struct.Name,
+            getShapeHash(struct),
+            obj.View,
+            obj.RebarsStrokeWidth.Value,
+            obj.StructureStrokeWidth.Value,
+            self.getColorStyles(obj),
+            obj.ScaleType,
+            obj.Scale if obj.ScaleType != "Automatic" else None,
+            obj.PositionType,
+            obj.Template.Width.Value,
+            obj.Template.Height.Value,
+            obj.LeftOffset.Value,
+            obj.TopOffset.Value,
+            obj.MinRightOffset.Value,
+            obj.MinBottomOffset.Value,
+            obj.MaxWidth.Value,
+            obj.MaxHeight.Value,
+            obj.LODThreshold,
+        ]
+        if FreeCAD.GuiUp:
+            inputs.append(struct.ViewObject.ShapeColor)
+        for rebar in obj.Rebars:
+            inputs.extend(
+                [
+                    rebar.Name,
+                    rebar.Shape.hashCode(),
+                    getShapeHash(rebar.Base) if rebar.Base else None,
+                    tuple(
+                        tuple(placement.toMatrix().A)
+                        for placement in rebar.PlacementList
+                    ),
+                    rebar.Diameter.Value,
+                ]
+            )
+            if FreeCAD.GuiUp:
+                inputs.append(rebar.ViewObject.ShapeColor)
+        return hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()
+
+    def updateLayout(self, obj):
+        """Update size, scale and position of ReinforcementDrawing object on
+        template and return its view plane."""
         if obj.PositionType == "Automatic":
             obj.setEditorMode("X", 1)
             obj.setEditorMode("Y", 1)
@@ -394,9 +517,14 @@ class ReinforcementDrawingView:
             obj.setEditorMode("Y", 0)
 
         view_plane = getViewPlane(obj.View)
-        obj.Width, obj.Height = getSVGWidthHeight(
+        # Drawing bounds are stored to be reused by drawing svg and by
+        # ReinforcementDimensioning objects of this view
+        min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
             obj.Structure, obj.Rebars, view_plane
         )
+        obj.DrawingBounds = [min_x, min_y, max_x, max_y]
+        obj.Width = round(max_x - min_x)
+        obj.Height = round(max_y - min_y)
 
         if obj.ScaleType == "Automatic":
             scaling_factor = getTechdrawViewScalingFactor(
@@ -420,7 +548,11 @@ class ReinforcementDrawingView:
                 - obj.Height.Value * obj.Scale / 2
                 - obj.TopOffset.Value
             )
+        return view_plane
 
+    def getColorStyles(self, obj):
+        """Returns tuple of rebars color style and structure fill style of
+        ReinforcementDrawing object."""
         if obj.StructureColorStyle == "Automatic":
             if FreeCAD.GuiUp:
                 struct_fill_style = "shape color"
@@ -435,20 +567,17 @@ class ReinforcementDrawingView:
             rebars_color_style = "shape color"
         else:
             rebars_color_style = getrgb(obj.RebarsColor)
-
-        reinforcement_drawing_data = getReinforcementDrawingSVGData(
-            obj.Structure,
-            obj.Rebars,
-            view_plane,
-            obj.RebarsStrokeWidth.Value / obj.Scale,
-            rebars_color_style,
-            obj.StructureStrokeWidth.Value / obj.Scale,
-            struct_fill_style,
-        )
-        obj.Symbol = ElementTree.tostring(
-            reinforcement_drawing_data["svg"], encoding="unicode"
-        )
-        obj.VisibleRebars = reinforcement_drawing_data["rebars"]
+        return rebars_color_style, struct_fill_style
+
+    def setSVGData(self, obj, svg, visible_rebars):
+        """Set reinforcement drawing svg string and visible rebars computed
+        outside of execute(), e.g. by a worker process. The layout of object
+        must be updated by updateLayout() before computing svg."""
+        obj.Symbol = svg
+        obj.VisibleRebars = visible_rebars
+        obj.InputsFingerprint = self.getInputsFingerprint(obj)
+        # Drawing is up to date, so don't regenerate it on next recompute
+        obj.purgeTouched()
 
         if FreeCAD.GuiUp:
             obj.ViewObject.update()
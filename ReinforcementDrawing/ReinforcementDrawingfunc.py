@@ -37,19 +37,32 @@ import DraftVecUtils
 import WorkingPlane
 from importSVG import getcolor
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from RebarProfiling import profiled
 from SVGfunc import (
     getSVGRootElement,
     getPointSVG,
     isPointInSVG,
     getLineSVG,
     isLineInSVG,
+    getLinePathElement,
+    getSVGTextElement,
+    SVGPrimitivesRegistry,
 )
+from .config import DIMENSION_FONT_FAMILY, DIMENSION_FONT_SIZE
 
 
 def getRebarsSpanAxis(rebar):
     """getRebarsSpanAxis(Rebar):
-    Returns span axis of rebars.
+    Returns span axis of rebars. For RebarGeometry of rebar, it is computed
+    once and reused by drawings of all views.
     """
+    if getattr(rebar, "SpanAxis", None) is not None:
+        return rebar.SpanAxis
     if (
         Draft.getType(rebar.Base) == "Wire"
         or rebar.Base.Shape.ShapeType == "Wire"
@@ -65,9 +78,29 @@ def getRebarsSpanAxis(rebar):
         if not DraftVecUtils.isNull(rebar.Direction):
             axis = FreeCAD.Vector(rebar.Direction)
             axis.normalize()
+    if isinstance(rebar, RebarGeometry):
+        rebar.SpanAxis = axis
     return axis
 
 
+def getFilletedBaseWire(rebar):
+    """getFilletedBaseWire(Rebar):
+    Returns base wire of rebar with its corners filleted by rebar rounding.
+    Filleted wire with placement of rebar multiplied is same as fillet of base
+    wire with that placement, so it can be shared by all placements of rebar.
+    For RebarGeometry of rebar, it is computed once and reused by drawings of
+    all views.
+    """
+    if getattr(rebar, "FilletedBaseWire", None) is not None:
+        return rebar.FilletedBaseWire
+    filleted_wire = DraftGeomUtils.filletWire(
+        rebar.Base.Shape.Wires[0], rebar.Rounding * rebar.Diameter.Value
+    )
+    if isinstance(rebar, RebarGeometry):
+        rebar.FilletedBaseWire = filleted_wire
+    return filleted_wire
+
+
 def getViewPlane(view):
     """getViewPlane(View):
     Returns view_plane corresponding to view, where view can be "Front", "Rear",
@@ -154,6 +187,128 @@ def getProjectionToSVGPlane(vec, plane):
     return FreeCAD.Vector(lx, ly, 0)
 
 
+def getPlacementsProjectionToSVGPlane(points, placements, plane):
+    """getPlacementsProjectionToSVGPlane(PointsList, PlacementsList, Plane):
+    Returns list of tuples of projections of points on plane, one tuple for
+    each placement in placements list. Points are transformed by all
+    placements at once using numpy, if available.
+    """
+    if numpy is None:
+        return [
+            tuple(
+                getProjectionToSVGPlane(placement.multVec(point), plane)
+                for point in points
+            )
+            for placement in placements
+        ]
+
+    # Rotation and translation rows of placement matrices, shape (N, 3, 4)
+    matrices = numpy.array(
+        [placement.toMatrix().A for placement in placements], dtype=float
+    ).reshape(-1, 4, 4)[:, :3, :]
+    # Homogeneous points, shape (4, M)
+    points_array = numpy.array(
+        [(point.x, point.y, point.z, 1) for point in points], dtype=float
+    ).T
+    # Unit projection axes, shape (2, 3)
+    axes = numpy.array(
+        [(plane.u.x, plane.u.y, plane.u.z), (plane.v.x, plane.v.y, plane.v.z)],
+        dtype=float,
+    )
+    axes /= numpy.linalg.norm(axes, axis=1, keepdims=True)
+    # Projected points, shape (N, M, 2)
+    projections = numpy.einsum("ij,njk->nki", axes, matrices @ points_array)
+    return [
+        tuple(FreeCAD.Vector(x, y, 0) for x, y in placement_projections)
+        for placement_projections in projections.tolist()
+    ]
+
+
+def getRegularRunSpacing(placement_list):
+    """getRegularRunSpacing(PlacementList):
+    Returns spacing between consecutive placements of placement_list, if they
+    form a regular run i.e. all placements have same rotation and are equally
+    spaced along a line. Otherwise, returns None.
+    """
+    if len(placement_list) < 3:
+        return None
+    step = placement_list[1].Base.sub(placement_list[0].Base)
+    rotation = placement_list[0].Rotation.Q
+    for previous, placement in zip(placement_list, placement_list[1:]):
+        if placement.Base.sub(previous.Base).sub(step).Length > 1e-3:
+            return None
+        if any(
+            abs(q1 - q2) > 1e-6
+            for q1, q2 in zip(placement.Rotation.Q, rotation)
+        ):
+            return None
+    return step.Length
+
+
+def getLODPlacements(placement_list, lod_threshold=0):
+    """getLODPlacements(PlacementList, [LODThreshold]):
+    Returns tuple of placements to draw and spacing of collapsed run.
+
+    If lod_threshold is non zero and placement_list is a regular run of more
+    than lod_threshold placements, then only first and last placements are
+    returned with spacing of run. Otherwise, placement_list is returned with
+    spacing None.
+    """
+    placement_list = list(placement_list)
+    if lod_threshold and len(placement_list) > lod_threshold:
+        spacing = getRegularRunSpacing(placement_list)
+        if spacing:
+            return [placement_list[0], placement_list[-1]], spacing
+    return placement_list, None
+
+
+def getDistributionAnnotationSVG(
+    point,
+    first_placement,
+    last_placement,
+    count,
+    spacing,
+    view_plane,
+    stroke_width,
+    color,
+    font_size=DIMENSION_FONT_SIZE,
+):
+    """getDistributionAnnotationSVG(Point, FirstPlacement, LastPlacement,
+    Count, Spacing, ViewPlane, StrokeWidth, Color, [FontSize]):
+    Returns svg of collapsed regular run of rebars i.e. dashed line joining
+    point of first and last rebars, transformed by first_placement and
+    last_placement respectively, with label "count@spacing".
+    """
+    (p1,), (p2,) = getPlacementsProjectionToSVGPlane(
+        [point], [first_placement, last_placement], view_plane
+    )
+    annotation_svg = ElementTree.Element(
+        "g", attrib={"class": "DistributionAnnotation"}
+    )
+    # Dash length is scaled with font size, so that line is visibly dashed at
+    # any drawing scale
+    annotation_svg.append(
+        getLinePathElement(
+            [(p1.x, p1.y), (p2.x, p2.y)],
+            stroke_width,
+            "{},{}".format(font_size, font_size / 2),
+            color,
+        )
+    )
+    label_svg = getSVGTextElement(
+        "{}@{}".format(count, round(spacing)),
+        (p1.x + p2.x) / 2,
+        (p1.y + p2.y) / 2 - font_size / 2,
+        DIMENSION_FONT_FAMILY,
+        font_size,
+        "middle",
+    )
+    label_svg.set("fill", color)
+    annotation_svg.append(label_svg)
+    return annotation_svg
+
+
+@profiled
 def getDrawingMinMaxXY(structure, rebars_list, view_plane):
     """getDrawingMinMaxXY(Structure, RebarsList, ViewPlane):
     Returns (min_x, min_y, max_x, max_y) of drawing.
@@ -200,9 +355,10 @@ def getSVGWidthHeight(structure, rebars_list, view_plane):
     return svg_width, svg_height
 
 
-def getRoundEdgeSVG(edge, view_plane, stroke_width, stroke_color):
-    """getRoundEdgeSVG(Edge, ViewPlane, StrokeWidth, StrokeColor):
-    Returns round corner edge svg with given radius.
+def getRoundEdgeSVGPoints(edge, view_plane):
+    """getRoundEdgeSVGPoints(Edge, ViewPlane):
+    Returns tuple of projected start point, projected end point and sweep flag
+    of round corner edge in view_plane.
     """
     p1 = getProjectionToSVGPlane(edge.Vertexes[0].Point, view_plane)
     p2 = getProjectionToSVGPlane(edge.Vertexes[1].Point, view_plane)
@@ -211,18 +367,21 @@ def getRoundEdgeSVG(edge, view_plane, stroke_width, stroke_color):
         edge.FirstParameter + (edge.LastParameter - edge.FirstParameter) / 10
     )
     flag_sweep = int(DraftVecUtils.angle(t1, t2, view_plane.axis) < 0)
+    return p1, p2, flag_sweep
+
+
+def getRoundEdgeSVG(edge, view_plane, stroke_width, stroke_color):
+    """getRoundEdgeSVG(Edge, ViewPlane, StrokeWidth, StrokeColor):
+    Returns round corner edge svg with given radius.
+    """
+    p1, p2, flag_sweep = getRoundEdgeSVGPoints(edge, view_plane)
     radius = edge.Curve.Radius
     svg = ElementTree.Element("path")
     svg.set("style", "stroke:{};fill:none".format(stroke_color))
     svg.set(
         "d",
-        "M{x1} {y1} A{radius} {radius} 0 0 {flag_sweep} {x2} {y2}".format(
-            x1=round(p1.x),
-            y1=round(p1.y),
-            x2=round(p2.x),
-            y2=round(p2.y),
-            radius=round(radius),
-            flag_sweep=flag_sweep,
+        SVGPrimitivesRegistry.getRoundCornerPathData(
+            p1, p2, radius, flag_sweep
         ),
     )
     svg.set("stroke-width", str(stroke_width))
@@ -234,14 +393,14 @@ def isRoundCornerInSVG(edge, radius, view_plane, svg):
     """isRoundCornerInSVG(Edge, Radius, ViewPlane. SVG):
     Returns True if svg corresponding to round corner edge is present in SVG
     element, False otherwise.
+
+    svg can also be SVGPrimitivesRegistry of SVG element.
     """
-    p1 = getProjectionToSVGPlane(edge.Vertexes[0].Point, view_plane)
-    p2 = getProjectionToSVGPlane(edge.Vertexes[1].Point, view_plane)
-    t1 = edge.tangentAt(edge.FirstParameter)
-    t2 = edge.tangentAt(
-        edge.FirstParameter + (edge.LastParameter - edge.FirstParameter) / 10
-    )
-    flag_sweep = int(DraftVecUtils.angle(t1, t2, view_plane.axis) < 0)
+    p1, p2, flag_sweep = getRoundEdgeSVGPoints(edge, view_plane)
+    if isinstance(svg, SVGPrimitivesRegistry):
+        return svg.hasRoundCorner(
+            p1, p2, radius, flag_sweep
+        ) or svg.hasRoundCorner(p2, p1, radius, not flag_sweep)
     if (
         svg.find(
             './/path[@d="M{x1} {y1} A{radius} {radius} 0 0 {flag_sweep} {x2} '
@@ -276,6 +435,16 @@ def isRoundCornerInSVG(edge, radius, view_plane, svg):
         return False
 
 
+def getSVGPrimitivesRegistry(svg):
+    """getSVGPrimitivesRegistry(SVG):
+    Returns SVGPrimitivesRegistry of svg element. If svg is already a
+    SVGPrimitivesRegistry, it is returned as it is.
+    """
+    if isinstance(svg, SVGPrimitivesRegistry):
+        return svg
+    return SVGPrimitivesRegistry(svg)
+
+
 def getRebarColor(rebar, rebar_color_style="shape color"):
     """getRebarColor(Rebar, [RebarColorStyle]):
     Returns rebar color.
@@ -329,6 +498,7 @@ def getStirrupSVGPoints(stirrup_wire, stirrup_alignment, view_plane):
         )
 
 
+@profiled
 def getStirrupSVGData(
     rebar, view_plane, rebars_svg, rebars_stroke_width, rebars_color_style
 ):
@@ -336,6 +506,9 @@ def getStirrupSVGData(
     RebarsColorStyle):
     Returns dictionary containing stirrup svg data.
 
+    rebars_svg is the svg element of already drawn rebars or its
+    SVGPrimitivesRegistry.
+
     rebars_color_style can be:
         - "shape color" to select color of rebar shape
         - color name or hex value of color
@@ -346,6 +519,7 @@ def getStirrupSVGData(
         "visibility": is_rebar_visible,
     }
     """
+    rebars_svg = getSVGPrimitivesRegistry(rebars_svg)
     rebars_color = getRebarColor(rebar, rebars_color_style)
 
     stirrup_svg = ElementTree.Element("g", attrib={"id": str(rebar.Name)})
@@ -353,14 +527,9 @@ def getStirrupSVGData(
     drawing_plane_normal = view_plane.axis
     stirrup_span_axis = getRebarsSpanAxis(rebar)
     if round(drawing_plane_normal.cross(stirrup_span_axis).Length) == 0:
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        edges = Part.__sortEdges__(
-            DraftGeomUtils.filletWire(
-                basewire,
-                rebar.Rounding * rebar.Diameter.Value,
-            ).Edges
-        )
+        wire = getFilletedBaseWire(rebar).copy()
+        wire.Placement = rebar.PlacementList[0].multiply(wire.Placement)
+        edges = Part.__sortEdges__(wire.Edges)
         for edge in edges:
             if DraftGeomUtils.geomType(edge) == "Line":
                 p1 = getProjectionToSVGPlane(edge.Vertexes[0].Point, view_plane)
@@ -387,9 +556,7 @@ def getStirrupSVGData(
             stirrup_alignment = "V"
         else:
             stirrup_alignment = "H"
-        basewire = DraftGeomUtils.filletWire(
-            rebar.Base.Shape.Wires[0], rebar.Rounding * rebar.Diameter.Value
-        )
+        basewire = getFilletedBaseWire(rebar)
         for placement in rebar.PlacementList:
             wire = basewire.copy()
             wire.Placement = placement.multiply(basewire.Placement)
@@ -405,6 +572,7 @@ def getStirrupSVGData(
     }
 
 
+@profiled
 def getUShapeRebarSVGData(
     rebar,
     view_plane,
@@ -412,15 +580,26 @@ def getUShapeRebarSVGData(
     rebars_stroke_width,
     rebars_color_style,
     longitudinal_line_dia=None,
+    lod_threshold=0,
+    lod_font_size=DIMENSION_FONT_SIZE,
 ):
     """getUShapeRebarSVGData(UShapeRebar, ViewPlane, RebarsSVG,
-    RebarsStrokeWidth, RebarsColorStyle, longitudinal_line_dia):
+    RebarsStrokeWidth, RebarsColorStyle, [longitudinal_line_dia, LODThreshold,
+    LODFontSize]):
     Returns dictionary containing UShape rebar svg data.
 
+    rebars_svg is the svg element of already drawn rebars or its
+    SVGPrimitivesRegistry.
+
     rebars_color_style can be:
         - "shape color" to select color of rebar shape
         - color name or hex value of color
 
+    If lod_threshold is non zero and rebar has regular run of more than
+    lod_threshold placements, then only first and last rebars are drawn with
+    distribution annotation of lod_font_size, as returned by
+    getDistributionAnnotationSVG().
+
     Returns dictionary format:
     {
         "svg": u_rebar_svg,
@@ -430,20 +609,16 @@ def getUShapeRebarSVGData(
     if longitudinal_line_dia is None:
         longitudinal_line_dia = 2 * 2 * rebars_stroke_width
 
+    rebars_svg = getSVGPrimitivesRegistry(rebars_svg)
     rebars_color = getRebarColor(rebar, rebars_color_style)
 
     u_rebar_svg = ElementTree.Element("g", attrib={"id": str(rebar.Name)})
     is_rebar_visible = False
     drawing_plane_normal = view_plane.axis
     if round(drawing_plane_normal.cross(getRebarsSpanAxis(rebar)).Length) == 0:
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        edges = Part.__sortEdges__(
-            DraftGeomUtils.filletWire(
-                basewire,
-                rebar.Rounding * rebar.Diameter.Value,
-            ).Edges
-        )
+        wire = getFilletedBaseWire(rebar).copy()
+        wire.Placement = rebar.PlacementList[0].multiply(wire.Placement)
+        edges = Part.__sortEdges__(wire.Edges)
         for edge in edges:
             if DraftGeomUtils.geomType(edge) == "Line":
                 p1 = getProjectionToSVGPlane(edge.Vertexes[0].Point, view_plane)
@@ -485,16 +660,14 @@ def getUShapeRebarSVGData(
                     u_rebar_svg.append(edge_svg)
     else:
         basewire = rebar.Base.Shape.Wires[0]
-        for placement in rebar.PlacementList:
-            wire = basewire.copy()
-            wire.Placement = placement.multiply(basewire.Placement)
-
-            edges = Part.__sortEdges__(
-                DraftGeomUtils.filletWire(
-                    wire,
-                    rebar.Rounding * rebar.Diameter.Value,
-                ).Edges
-            )
+        filleted_wire = getFilletedBaseWire(rebar)
+        placements, spacing = getLODPlacements(
+            rebar.PlacementList, lod_threshold
+        )
+        for placement in placements:
+            wire = filleted_wire.copy()
+            wire.Placement = placement.multiply(filleted_wire.Placement)
+            edges = Part.__sortEdges__(wire.Edges)
             for edge in edges:
                 if DraftGeomUtils.geomType(edge) == "Line":
                     p1 = getProjectionToSVGPlane(
@@ -546,45 +719,77 @@ def getUShapeRebarSVGData(
                             is_rebar_visible = True
                     if is_rebar_visible:
                         u_rebar_svg.append(edge_svg)
+        if is_rebar_visible and spacing:
+            u_rebar_svg.append(
+                getDistributionAnnotationSVG(
+                    basewire.CenterOfMass,
+                    placements[0],
+                    placements[-1],
+                    len(rebar.PlacementList),
+                    spacing,
+                    view_plane,
+                    rebars_stroke_width,
+                    rebars_color,
+                    lod_font_size,
+                )
+            )
     return {
         "svg": u_rebar_svg,
         "visibility": is_rebar_visible,
     }
 
 
+@profiled
 def getStraightRebarSVGData(
     rebar,
     view_plane,
     rebars_svg,
     rebars_stroke_width,
     rebars_color_style,
+    lod_threshold=0,
+    lod_font_size=DIMENSION_FONT_SIZE,
 ):
     """getStraightRebarSVGData(StraightRebar, ViewPlane, RebarsSVG,
-    RebarsStrokeWidth, RebarsColorStyle):
+    RebarsStrokeWidth, RebarsColorStyle, [LODThreshold, LODFontSize]):
     Returns dictionary containing straight rebar svg data.
 
+    rebars_svg is the svg element of already drawn rebars or its
+    SVGPrimitivesRegistry.
+
     rebars_color_style can be:
         - "shape color" to select color of rebar shape
         - color name or hex value of color
 
+    If lod_threshold is non zero and rebar has regular run of more than
+    lod_threshold placements, then only first and last rebars are drawn with
+    distribution annotation of lod_font_size, as returned by
+    getDistributionAnnotationSVG().
+
     Returns dictionary format:
     {
         "svg": straight_rebar_svg,
         "visibility": is_rebar_visible,
     }
     """
+    rebars_svg = getSVGPrimitivesRegistry(rebars_svg)
     rebars_color = getRebarColor(rebar, rebars_color_style)
 
     straight_rebar_svg = ElementTree.Element(
         "g", attrib={"id": str(rebar.Name)}
     )
+    straight_rebar_primitives = SVGPrimitivesRegistry()
     is_rebar_visible = False
     drawing_plane_normal = view_plane.axis
+    # Vertexes of copy of base wire with placement multiplied by rebar
+    # placement are the base wire vertexes transformed by rebar placement, so
+    # transform end points directly instead of creating wire copies
+    base_points = [
+        vertex.Point for vertex in rebar.Base.Shape.Wires[0].Vertexes[:2]
+    ]
     if round(drawing_plane_normal.cross(getRebarsSpanAxis(rebar)).Length) == 0:
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        p1 = getProjectionToSVGPlane(basewire.Vertexes[0].Point, view_plane)
-        p2 = getProjectionToSVGPlane(basewire.Vertexes[1].Point, view_plane)
+        p1, p2 = getPlacementsProjectionToSVGPlane(
+            base_points, rebar.PlacementList[:1], view_plane
+        )[0]
         if round(p1.x) == round(p2.x) and round(p1.y) == round(p2.y):
             rebar_svg = getPointSVG(
                 p1, radius=2 * rebars_stroke_width, fill=rebars_color
@@ -598,196 +803,170 @@ def getStraightRebarSVGData(
         if is_rebar_visible:
             straight_rebar_svg.append(rebar_svg)
     else:
-        basewire = rebar.Base.Shape.Wires[0]
-        for placement in rebar.PlacementList:
-            wire = basewire.copy()
-            wire.Placement = placement.multiply(basewire.Placement)
-            p1 = getProjectionToSVGPlane(wire.Vertexes[0].Point, view_plane)
-            p2 = getProjectionToSVGPlane(wire.Vertexes[1].Point, view_plane)
+        placements, spacing = getLODPlacements(
+            rebar.PlacementList, lod_threshold
+        )
+        for p1, p2 in getPlacementsProjectionToSVGPlane(
+            base_points, placements, view_plane
+        ):
             if round(p1.x) == round(p2.x) and round(p1.y) == round(p2.y):
                 rebar_svg = getPointSVG(
                     p1, radius=2 * rebars_stroke_width, fill=rebars_color
                 )
                 if not (
                     isPointInSVG(p1, rebars_svg)
-                    or isPointInSVG(p1, straight_rebar_svg)
+                    or isPointInSVG(p1, straight_rebar_primitives)
                 ):
                     is_rebar_visible = True
+                if is_rebar_visible:
+                    straight_rebar_primitives.addPoint(p1)
             else:
                 rebar_svg = getLineSVG(
                     p1, p2, rebars_stroke_width, rebars_color
                 )
                 if not (
                     isLineInSVG(p1, p2, rebars_svg)
-                    or isLineInSVG(p1, p2, straight_rebar_svg)
+                    or isLineInSVG(p1, p2, straight_rebar_primitives)
                 ):
                     is_rebar_visible = True
+                if is_rebar_visible:
+                    straight_rebar_primitives.addLine(p1, p2)
             if is_rebar_visible:
                 straight_rebar_svg.append(rebar_svg)
+        if is_rebar_visible and spacing:
+            straight_rebar_svg.append(
+                getDistributionAnnotationSVG(
+                    (base_points[0] + base_points[1]) * 0.5,
+                    placements[0],
+                    placements[-1],
+                    len(rebar.PlacementList),
+                    spacing,
+                    view_plane,
+                    rebars_stroke_width,
+                    rebars_color,
+                    lod_font_size,
+                )
+            )
     return {
         "svg": straight_rebar_svg,
         "visibility": is_rebar_visible,
     }
 
 
-def getReinforcementDrawingSVGData(
+@profiled
+def getStructureSVG(
+    structure, view_plane, structure_stroke_width, structure_fill_style
+):
+    """getStructureSVG(Structure, ViewPlane, StructureStrokeWidth,
+    StructureFillStyle):
+    Returns svg string of structure group for reinforcement drawing.
+    """
+    _structure_svg = '<g id="structure">{}</g>'.format(
+        Draft.get_svg(
+            structure,
+            direction=view_plane,
+            linewidth=structure_stroke_width,
+            fillstyle=structure_fill_style,
+        )
+    )
+
+    # Fix structure transparency (useful in console mode where
+    # obj.ViewObject.Transparency is not available OR in gui mode if
+    # structure transparency is ~0)
+    if structure_fill_style != "none":
+        if _structure_svg.find("fill-opacity") == -1:
+            _structure_svg = _structure_svg.replace(
+                ";fill:", ";fill-opacity:0.2;fill:"
+            )
+        else:
+            import re
+
+            _structure_svg = re.sub(
+                '(fill-opacity:)([^:]+)(;|")', r"\1 0.2\3", _structure_svg
+            )
+    return _structure_svg
+
+
+def getReinforcementDrawingSVGParts(
     structure,
     rebars_list,
-    view_direction,
+    view_plane,
     rebars_stroke_width,
     rebars_color_style,
     structure_stroke_width,
     structure_fill_style,
+    bounds=None,
+    lod_threshold=0,
+    lod_font_size=DIMENSION_FONT_SIZE,
 ):
-    """getReinforcementDrawingSVGData(Structure, RebarsList, ViewDirection,
-    RebarsStrokeWidth, RebarsFillStyle, StructureStrokeWidth,
-    StructureFillStyle):
-    Generates Reinforcement Drawing View.
+    """getReinforcementDrawingSVGParts(Structure, RebarsList, ViewPlane,
+    RebarsStrokeWidth, RebarsColorStyle, StructureStrokeWidth,
+    StructureFillStyle, [Bounds, LODThreshold, LODFontSize]):
+    Returns dictionary of the parts of reinforcement drawing which need
+    FreeCAD document objects to be computed. These parts are assembled into
+    reinforcement drawing svg by assembleReinforcementDrawingSVGData().
 
-    view_direction is FreeCAD.Vector() or WorkingPlane.plane() corresponding to
-    direction of view point.
+    bounds is the tuple (min_x, min_y, max_x, max_y) of drawing, as returned
+    by getDrawingMinMaxXY(). If not provided, it is computed.
 
-    rebars_color_style can be:
-        - "shape color" to select color of rebar shape
-        - color name or hex value of color
-    structure_fill_style can be:
-        - "shape color" to select color of rebar shape
-        - color name or hex value of color
-        - "none" to not fill structure shape
+    lod_threshold and lod_font_size are the level of detail options passed to
+    getStraightRebarSVGData() and getUShapeRebarSVGData().
 
     Returns dictionary format:
     {
-        "svg": reinforcement_drawing_svg,
-        "rebars": visible_rebars,
+        "view_plane": view_plane,
+        "bounds": (min_x, min_y, max_x, max_y),
+        "lod_threshold": lod_threshold,
+        "lod_font_size": lod_font_size,
+        "stirrups": stirrups_list,
+        "bent_rebars": bent_rebars_list,
+        "u_rebars": u_rebars_list,
+        "l_rebars": l_rebars_list,
+        "straight_rebars": straight_rebars_list,
+        "helical_rebars": [(helical_rebar, helical_rebar_svg), ...],
+        "custom_rebars_svg": [custom_rebar_svg, ...],
+        "structure_svg": structure_svg,
     }
     """
-    if isinstance(view_direction, FreeCAD.Vector):
-        if not DraftVecUtils.isNull(view_direction):
-            view_plane = getSVGPlaneFromAxis(view_direction)
-    elif isinstance(view_direction, WorkingPlane.Plane):
-        view_plane = view_direction
-
-    min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
-        structure, rebars_list, view_plane
-    )
-
-    svg = getSVGRootElement()
-
-    reinforcement_drawing = ElementTree.Element(
-        "g", attrib={"id": "reinforcement_drawing"}
-    )
-    svg.append(reinforcement_drawing)
+    parts = {
+        "view_plane": view_plane,
+        "bounds": (
+            tuple(bounds)
+            if bounds
+            else getDrawingMinMaxXY(structure, rebars_list, view_plane)
+        ),
+        "lod_threshold": lod_threshold,
+        "lod_font_size": lod_font_size,
+        "stirrups": [],
+        "bent_rebars": [],
+        "u_rebars": [],
+        "l_rebars": [],
+        "straight_rebars": [],
+        "helical_rebars": [],
+        "custom_rebars_svg": [],
+    }
 
     # Filter rebars created using Reinforcement Workbench
-    stirrups = []
-    bent_rebars = []
-    u_rebars = []
-    l_rebars = []
-    straight_rebars = []
     helical_rebars = []
     custom_rebars = []
     for rebar in rebars_list:
         if not hasattr(rebar, "RebarShape"):
             custom_rebars.append(rebar)
         elif rebar.RebarShape == "Stirrup":
-            stirrups.append(rebar)
+            parts["stirrups"].append(rebar)
         elif rebar.RebarShape == "BentShapeRebar":
-            bent_rebars.append(rebar)
+            parts["bent_rebars"].append(rebar)
         elif rebar.RebarShape == "UShapeRebar":
-            u_rebars.append(rebar)
+            parts["u_rebars"].append(rebar)
         elif rebar.RebarShape == "LShapeRebar":
-            l_rebars.append(rebar)
+            parts["l_rebars"].append(rebar)
         elif rebar.RebarShape == "StraightRebar":
-            straight_rebars.append(rebar)
+            parts["straight_rebars"].append(rebar)
         elif rebar.RebarShape == "HelicalRebar":
             helical_rebars.append(rebar)
         else:
             custom_rebars.append(rebar)
 
-    rebars_svg = ElementTree.Element("g", attrib={"id": "Rebars"})
-    reinforcement_drawing.append(rebars_svg)
-
-    visible_rebars = []
-    stirrups_svg = ElementTree.Element("g", attrib={"id": "Stirrup"})
-    rebars_svg.append(stirrups_svg)
-    for rebar in stirrups:
-        rebar_data = getStirrupSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            stirrups_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    bent_rebars_svg = ElementTree.Element("g", attrib={"id": "BentShapeRebar"})
-    rebars_svg.append(bent_rebars_svg)
-    for rebar in bent_rebars:
-        rebar_data = getUShapeRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            bent_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    u_rebars_svg = ElementTree.Element("g", attrib={"id": "UShapeRebar"})
-    rebars_svg.append(u_rebars_svg)
-    for rebar in u_rebars:
-        rebar_data = getUShapeRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            u_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    l_rebars_svg = ElementTree.Element("g", attrib={"id": "LShapeRebar"})
-    rebars_svg.append(l_rebars_svg)
-    for rebar in l_rebars:
-        rebar_data = getUShapeRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            l_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    straight_rebars_svg = ElementTree.Element(
-        "g", attrib={"id": "StraightRebar"}
-    )
-    rebars_svg.append(straight_rebars_svg)
-
-    for rebar in straight_rebars:
-        rebar_data = getStraightRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            straight_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    helical_rebars_svg = ElementTree.Element("g", attrib={"id": "HelicalRebar"})
-    rebars_svg.append(helical_rebars_svg)
-
-    # SVG is generated for all helical rebars, because all helical rebars in
-    # circular column are assumed to be visible, not overlapped by any other
-    # rebar type (it makes sense for me). Please create an issue on github
-    # repository if you think its wrong assumption
     for rebar in helical_rebars:
         rebars_color = getRebarColor(rebar, rebars_color_style)
         rebars_color = getcolor(rebars_color)
@@ -798,12 +977,8 @@ def getReinforcementDrawingSVGData(
             fillstyle="none",
             color=rebars_color,
         )
-        if rebar_svg_draft:
-            helical_rebars_svg.append(ElementTree.fromstring(rebar_svg_draft))
-            visible_rebars.append(rebar)
+        parts["helical_rebars"].append((rebar, rebar_svg_draft))
 
-    custom_rebars_svg = ElementTree.Element("g", attrib={"id": "CustomRebar"})
-    rebars_svg.append(custom_rebars_svg)
     for rebar in custom_rebars:
         rebars_color = getRebarColor(rebar, rebars_color_style)
         rebars_color = getcolor(rebars_color)
@@ -814,35 +989,100 @@ def getReinforcementDrawingSVGData(
             fillstyle="none",
             color=rebars_color,
         )
-        if rebar_svg_draft:
-            custom_rebars_svg.append(ElementTree.fromstring(rebar_svg_draft))
+        parts["custom_rebars_svg"].append(rebar_svg_draft)
 
-    # Create Structure SVG
-    _structure_svg = '<g id="structure">{}</g>'.format(
-        Draft.get_svg(
-            structure,
-            direction=view_plane,
-            linewidth=structure_stroke_width,
-            fillstyle=structure_fill_style,
-        )
+    parts["structure_svg"] = getStructureSVG(
+        structure, view_plane, structure_stroke_width, structure_fill_style
     )
+    return parts
 
-    # Fix structure transparency (useful in console mode where
-    # obj.ViewObject.Transparency is not available OR in gui mode if
-    # structure transparency is ~0)
-    if structure_fill_style != "none":
-        if _structure_svg.find("fill-opacity") == -1:
-            _structure_svg = _structure_svg.replace(
-                ";fill:", ";fill-opacity:0.2;fill:"
-            )
-        else:
-            import re
 
-            _structure_svg = re.sub(
-                '(fill-opacity:)([^:]+)(;|")', r"\1 0.2\3", _structure_svg
+def assembleReinforcementDrawingSVGData(
+    parts, rebars_stroke_width, rebars_color_style
+):
+    """assembleReinforcementDrawingSVGData(Parts, RebarsStrokeWidth,
+    RebarsColorStyle):
+    Generates Reinforcement Drawing View from parts returned by
+    getReinforcementDrawingSVGParts().
+
+    Stirrups, bent, u-shape, l-shape and straight rebars in parts can be
+    rebar objects or RebarGeometry of rebar objects.
+
+    Returns dictionary format:
+    {
+        "svg": reinforcement_drawing_svg,
+        "rebars": visible_rebars,
+    }
+    """
+    view_plane = parts["view_plane"]
+    min_x, min_y, max_x, max_y = parts["bounds"]
+
+    svg = getSVGRootElement()
+
+    reinforcement_drawing = ElementTree.Element(
+        "g", attrib={"id": "reinforcement_drawing"}
+    )
+    svg.append(reinforcement_drawing)
+
+    rebars_svg = ElementTree.Element("g", attrib={"id": "Rebars"})
+    reinforcement_drawing.append(rebars_svg)
+    # Registry of primitives of visible rebars svg, to check overlapping of
+    # rebars without searching whole rebars_svg for each rebar edge
+    rebars_primitives = SVGPrimitivesRegistry()
+
+    # Level of detail options, supported by all rebar types except stirrups
+    lod_options = {
+        "lod_threshold": parts.get("lod_threshold", 0),
+        "lod_font_size": parts.get("lod_font_size", DIMENSION_FONT_SIZE),
+    }
+    visible_rebars = []
+    for parts_key, group_id, getRebarSVGData, options in (
+        ("stirrups", "Stirrup", getStirrupSVGData, {}),
+        ("bent_rebars", "BentShapeRebar", getUShapeRebarSVGData, lod_options),
+        ("u_rebars", "UShapeRebar", getUShapeRebarSVGData, lod_options),
+        ("l_rebars", "LShapeRebar", getUShapeRebarSVGData, lod_options),
+        (
+            "straight_rebars",
+            "StraightRebar",
+            getStraightRebarSVGData,
+            lod_options,
+        ),
+    ):
+        group_svg = ElementTree.Element("g", attrib={"id": group_id})
+        rebars_svg.append(group_svg)
+        for rebar in parts[parts_key]:
+            rebar_data = getRebarSVGData(
+                rebar,
+                view_plane,
+                rebars_primitives,
+                rebars_stroke_width,
+                rebars_color_style,
+                **options,
             )
+            if rebar_data["visibility"]:
+                group_svg.append(rebar_data["svg"])
+                rebars_primitives.addSVG(rebar_data["svg"])
+                visible_rebars.append(rebar)
+
+    helical_rebars_svg = ElementTree.Element("g", attrib={"id": "HelicalRebar"})
+    rebars_svg.append(helical_rebars_svg)
+
+    # SVG is generated for all helical rebars, because all helical rebars in
+    # circular column are assumed to be visible, not overlapped by any other
+    # rebar type (it makes sense for me). Please create an issue on github
+    # repository if you think its wrong assumption
+    for rebar, rebar_svg_draft in parts["helical_rebars"]:
+        if rebar_svg_draft:
+            helical_rebars_svg.append(ElementTree.fromstring(rebar_svg_draft))
+            visible_rebars.append(rebar)
+
+    custom_rebars_svg = ElementTree.Element("g", attrib={"id": "CustomRebar"})
+    rebars_svg.append(custom_rebars_svg)
+    for rebar_svg_draft in parts["custom_rebars_svg"]:
+        if rebar_svg_draft:
+            custom_rebars_svg.append(ElementTree.fromstring(rebar_svg_draft))
 
-    structure_svg = ElementTree.fromstring(_structure_svg)
+    structure_svg = ElementTree.fromstring(parts["structure_svg"])
     reinforcement_drawing.append(structure_svg)
     reinforcement_drawing.set(
         "transform",
@@ -857,3 +1097,274 @@ def getReinforcementDrawingSVGData(
     svg.set("viewBox", "0 0 {} {}".format(svg_width, svg_height))
 
     return {"svg": svg, "rebars": visible_rebars}
+
+
+@profiled
+def getReinforcementDrawingSVGData(
+    structure,
+    rebars_list,
+    view_direction,
+    rebars_stroke_width,
+    rebars_color_style,
+    structure_stroke_width,
+    structure_fill_style,
+    bounds=None,
+    lod_threshold=0,
+    lod_font_size=DIMENSION_FONT_SIZE,
+):
+    """getReinforcementDrawingSVGData(Structure, RebarsList, ViewDirection,
+    RebarsStrokeWidth, RebarsFillStyle, StructureStrokeWidth,
+    StructureFillStyle, [Bounds, LODThreshold, LODFontSize]):
+    Generates Reinforcement Drawing View.
+
+    view_direction is FreeCAD.Vector() or WorkingPlane.plane() corresponding to
+    direction of view point.
+
+    bounds is the tuple (min_x, min_y, max_x, max_y) of drawing, as returned
+    by getDrawingMinMaxXY(). If not provided, it is computed.
+
+    rebars_color_style can be:
+        - "shape color" to select color of rebar shape
+        - color name or hex value of color
+    structure_fill_style can be:
+        - "shape color" to select color of rebar shape
+        - color name or hex value of color
+        - "none" to not fill structure shape
+
+    If lod_threshold is non zero, regular runs of more than lod_threshold
+    straight, u-shape, l-shape or bent rebars are drawn as their first and last
+    rebars with distribution annotation of lod_font_size.
+
+    Returns dictionary format:
+    {
+        "svg": reinforcement_drawing_svg,
+        "rebars": visible_rebars,
+    }
+    """
+    if isinstance(view_direction, FreeCAD.Vector):
+        if not DraftVecUtils.isNull(view_direction):
+            view_plane = getSVGPlaneFromAxis(view_direction)
+    elif isinstance(view_direction, WorkingPlane.Plane):
+        view_plane = view_direction
+
+    parts = getReinforcementDrawingSVGParts(
+        structure,
+        rebars_list,
+        view_plane,
+        rebars_stroke_width,
+        rebars_color_style,
+        structure_stroke_width,
+        structure_fill_style,
+        bounds,
+        lod_threshold,
+        lod_font_size,
+    )
+    return assembleReinforcementDrawingSVGData(
+        parts, rebars_stroke_width, rebars_color_style
+    )
+
+
+class RebarGeometry:
+    """Plain, picklable geometry of a rebar object.
+
+    It provides the attributes of rebar object required to generate its
+    reinforcement drawing svg (Name, RebarShape, Base.Shape, Base.Placement,
+    PlacementList, Rounding, Diameter, Direction and ViewObject.ShapeColor), so
+    that drawing svg can be generated in worker processes, where document
+    objects are not available. Shapes are pickled as BREP strings and
+    placements as matrices.
+
+    View independent geometry of rebar i.e. its span axis and filleted base
+    wire is computed on first use by getRebarsSpanAxis() and
+    getFilletedBaseWire() and stored in RebarGeometry, so that it is reused by
+    drawings of all views of rebar.
+    """
+
+    def __init__(self, rebar):
+        self.Name = rebar.Name
+        self.RebarShape = rebar.RebarShape
+        self.Base = RebarBaseGeometry(rebar.Base)
+        self.PlacementList = list(rebar.PlacementList)
+        self.Rounding = rebar.Rounding
+        self.Diameter = rebar.Diameter
+        if hasattr(rebar, "Direction"):
+            self.Direction = FreeCAD.Vector(rebar.Direction)
+        self.ViewObject = None
+        if FreeCAD.GuiUp:
+            self.ViewObject = RebarViewGeometry(rebar.ViewObject.ShapeColor)
+        self.SpanAxis = None
+        self.FilletedBaseWire = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["PlacementList"] = [
+            placement.toMatrix().A for placement in self.PlacementList
+        ]
+        state["Diameter"] = self.Diameter.Value
+        if "Direction" in state:
+            state["Direction"] = tuple(self.Direction)
+        if self.SpanAxis is not None:
+            state["SpanAxis"] = tuple(self.SpanAxis)
+        if self.FilletedBaseWire is not None:
+            state["FilletedBaseWire"] = (
+                self.FilletedBaseWire.exportBrepToString()
+            )
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.PlacementList = [
+            FreeCAD.Placement(FreeCAD.Matrix(*matrix))
+            for matrix in state["PlacementList"]
+        ]
+        self.Diameter = FreeCAD.Units.Quantity(
+            state["Diameter"], FreeCAD.Units.Length
+        )
+        if "Direction" in state:
+            self.Direction = FreeCAD.Vector(*state["Direction"])
+        if self.SpanAxis is not None:
+            self.SpanAxis = FreeCAD.Vector(*state["SpanAxis"])
+        if self.FilletedBaseWire is not None:
+            self.FilletedBaseWire = Part.Shape()
+            self.FilletedBaseWire.importBrepFromString(
+                state["FilletedBaseWire"]
+            )
+
+
+class RebarBaseGeometry:
+    """Plain, picklable geometry of base object of rebar."""
+
+    def __init__(self, base):
+        # Draft.getType() reads type of object from its Proxy.Type
+        self.Proxy = self
+        self.Type = Draft.getType(base)
+        self.Shape = base.Shape.copy()
+        self.Placement = FreeCAD.Placement(base.Placement)
+
+    def __getstate__(self):
+        return {
+            "Type": self.Type,
+            "Shape": self.Shape.exportBrepToString(),
+            "Placement": self.Placement.toMatrix().A,
+        }
+
+    def __setstate__(self, state):
+        self.Proxy = self
+        self.Type = state["Type"]
+        self.Shape = Part.Shape()
+        self.Shape.importBrepFromString(state["Shape"])
+        self.Placement = FreeCAD.Placement(FreeCAD.Matrix(*state["Placement"]))
+
+
+class RebarViewGeometry:
+    """Plain, picklable view properties of rebar."""
+
+    def __init__(self, shape_color):
+        self.ShapeColor = shape_color
+
+
+def getRebarGeometry(rebar, rebar_geometries=None):
+    """getRebarGeometry(Rebar, [RebarGeometries]):
+    Returns RebarGeometry of rebar from rebar_geometries dictionary, with rebar
+    name as key. If not found, RebarGeometry is created and added to
+    rebar_geometries.
+    """
+    if rebar_geometries is None:
+        return RebarGeometry(rebar)
+    if rebar.Name not in rebar_geometries:
+        rebar_geometries[rebar.Name] = RebarGeometry(rebar)
+    return rebar_geometries[rebar.Name]
+
+
+def getReinforcementDrawingSVGPayload(
+    structure,
+    rebars_list,
+    view_plane,
+    rebars_stroke_width,
+    rebars_color_style,
+    structure_stroke_width,
+    structure_fill_style,
+    bounds=None,
+    lod_threshold=0,
+    lod_font_size=DIMENSION_FONT_SIZE,
+    rebar_geometries=None,
+):
+    """getReinforcementDrawingSVGPayload(Structure, RebarsList, ViewPlane,
+    RebarsStrokeWidth, RebarsColorStyle, StructureStrokeWidth,
+    StructureFillStyle, [Bounds, LODThreshold, LODFontSize,
+    RebarGeometries]):
+    Returns picklable payload of reinforcement drawing, which can be passed to
+    getReinforcementDrawingSVGDataFromPayload() in a worker process to
+    generate reinforcement drawing svg without document objects.
+
+    rebar_geometries is the dictionary with rebar name as key and its
+    RebarGeometry as value. Pass same dictionary for payloads of all views of
+    structure to share geometry of rebars between them. RebarGeometry of
+    rebars not in dictionary is created and added to it.
+    """
+    parts = getReinforcementDrawingSVGParts(
+        structure,
+        rebars_list,
+        view_plane,
+        rebars_stroke_width,
+        rebars_color_style,
+        structure_stroke_width,
+        structure_fill_style,
+        bounds,
+        lod_threshold,
+        lod_font_size,
+    )
+    for parts_key in (
+        "stirrups",
+        "bent_rebars",
+        "u_rebars",
+        "l_rebars",
+        "straight_rebars",
+    ):
+        parts[parts_key] = [
+            getRebarGeometry(rebar, rebar_geometries)
+            for rebar in parts[parts_key]
+        ]
+    parts["helical_rebars"] = [
+        (rebar.Name, rebar_svg) for rebar, rebar_svg in parts["helical_rebars"]
+    ]
+    parts["view_plane"] = (
+        tuple(view_plane.axis),
+        tuple(view_plane.u),
+        tuple(view_plane.v),
+    )
+    return {
+        "parts": parts,
+        "rebars_stroke_width": rebars_stroke_width,
+        "rebars_color_style": rebars_color_style,
+    }
+
+
+def getReinforcementDrawingSVGDataFromPayload(payload):
+    """getReinforcementDrawingSVGDataFromPayload(Payload):
+    Generates Reinforcement Drawing View from payload returned by
+    getReinforcementDrawingSVGPayload().
+
+    Returns dictionary format:
+    {
+        "svg": reinforcement_drawing_svg_string,
+        "rebars": visible_rebars_names,
+    }
+    """
+    parts = dict(payload["parts"])
+    axis, u, v = parts["view_plane"]
+    view_plane = WorkingPlane.plane()
+    view_plane.axis = FreeCAD.Vector(*axis)
+    view_plane.u = FreeCAD.Vector(*u)
+    view_plane.v = FreeCAD.Vector(*v)
+    parts["view_plane"] = view_plane
+    drawing_data = assembleReinforcementDrawingSVGData(
+        parts, payload["rebars_stroke_width"], payload["rebars_color_style"]
+    )
+    return {
+        "svg": ElementTree.tostring(drawing_data["svg"], encoding="unicode"),
+        "rebars": [
+            rebar if isinstance(rebar, str) else rebar.Name
+            for rebar in drawing_data["rebars"]
+        ],
+    }
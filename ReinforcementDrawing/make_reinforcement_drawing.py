@@ -26,9 +26,16 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import FreeCAD
-import Draft
 
+from BillOfMaterial.BOMfunc import ReinforcementIndex, getReinforcementIndex
+from .ReinforcementDrawingfunc import (
+    getReinforcementDrawingSVGPayload,
+    getReinforcementDrawingSVGDataFromPayload,
+)
 from .ReinforcementDrawingView import makeReinforcementDrawingObject
 from .ReinforcementDimensioning import makeReinforcementDimensioningObject
 
@@ -85,22 +92,23 @@ def getStructureRebarsDict(structure_list=None, rebars_list=None):
     Returns dictionary with structure as key and corresponding rebar objects
     list as value.
     """
+    document_index = getReinforcementIndex()
     if not structure_list:
-        structure_list = FreeCAD.ActiveDocument.Objects
+        structure_set = document_index.objects_set
+    else:
+        structure_set = set(structure_list)
 
     if not rebars_list:
-        rebar_objects = Draft.get_objects_of_type(
-            FreeCAD.ActiveDocument.Objects, "Rebar"
-        )
+        rebar_objects = document_index.getObjectsOfType("Rebar")
     else:
-        rebar_objects = Draft.get_objects_of_type(rebars_list, "Rebar")
+        rebar_objects = ReinforcementIndex(rebars_list).getObjectsOfType(
+            "Rebar"
+        )
 
     struct_rebars_dict = {}
     for rebar in rebar_objects:
-        if rebar.Host in structure_list:
-            if rebar.Host not in struct_rebars_dict:
-                struct_rebars_dict[rebar.Host] = []
-            struct_rebars_dict[rebar.Host].append(rebar)
+        if rebar.Host in structure_set:
+            struct_rebars_dict.setdefault(rebar.Host, []).append(rebar)
 
     return struct_rebars_dict
 
@@ -126,13 +134,15 @@ def makeReinforcementDrawing(
     dimension_right_offset,
     dimension_top_offset,
     dimension_bottom_offset,
+    recompute=True,
+    lod_threshold=0,
 ):
     """makeReinforcementDrawing(Structure, RebarsList, View, RebarsStrokeWidth,
     RebarsColorStyle, RebarsColor, StructureStrokeWidth, StructureColorStyle,
     StructureColor, DrawingLeftOffset, DrawingTopOffset, DrawingMinRightOffset,
     DrawingMinBottomOffset, DrawingMaxWidth, DrawingMaxHeight, TemplateFile,
     DimensionLeftOffset, DimensionRightOffset, DimensionTopOffset,
-    DimensionBottomOffset):
+    DimensionBottomOffset, [Recompute, LODThreshold]):
     Generates Reinforcement Drawing SVG view for structure.
 
     view can be "Front", "Rear", "Left", "Right", "Top" or "Bottom".
@@ -145,6 +155,13 @@ def makeReinforcementDrawing(
     r, g, b must be between 0 to 1 and must be float. Divide r, g, b value of
     color to get values between 0 and 1.
 
+    Set recompute False to only create and setup drawing page without
+    generating drawing svg.
+
+    lod_threshold is the LODThreshold of drawing view. If non zero, regular
+    runs of more than lod_threshold rebars are drawn as first and last rebars
+    with distribution annotation.
+
     Returns reinforcement drawing page of type TechDraw::DrawPage.
     """
 
@@ -174,12 +191,64 @@ def makeReinforcementDrawing(
     drawing_content_obj.DimensionRightOffset = dimension_right_offset
     drawing_content_obj.DimensionTopOffset = dimension_top_offset
     drawing_content_obj.DimensionBottomOffset = dimension_bottom_offset
-    drawing_content_obj.recompute()
-    reinforcement_drawing_page.recompute(True)
+    drawing_content_obj.LODThreshold = lod_threshold
+    if recompute:
+        drawing_content_obj.recompute()
+        reinforcement_drawing_page.recompute(True)
 
     return reinforcement_drawing_page
 
 
+def getReinforcementDrawingsSVGData(payloads, workers=1):
+    """getReinforcementDrawingsSVGData(Payloads, [Workers]):
+    payloads is the list of reinforcement drawing payloads returned by
+    getReinforcementDrawingSVGPayload().
+
+    workers is the number of worker processes to generate reinforcement
+    drawings svg. Worker processes are forked from current process, so they
+    are only used in console mode and where fork is supported, otherwise
+    drawings are generated in current process.
+
+    Returns list of dictionaries, in order of payloads, with format:
+    {
+        "svg": reinforcement_drawing_svg_string,
+        "rebars": visible_rebars_names,
+    }
+    """
+    workers = min(workers, len(payloads))
+    if workers > 1 and FreeCAD.GuiUp:
+        FreeCAD.Console.PrintWarning(
+            "Worker processes are not supported in gui mode. Generating "
+            "reinforcement drawings in current process.\n"
+        )
+        workers = 1
+    elif workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        FreeCAD.Console.PrintWarning(
+            "Worker processes are not supported on this platform. Generating "
+            "reinforcement drawings in current process.\n"
+        )
+        workers = 1
+
+    if workers <= 1:
+        return [
+            getReinforcementDrawingSVGDataFromPayload(payload)
+            for payload in payloads
+        ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        # map() returns results in order of payloads, irrespective of order
+        # in which workers finish
+        return list(
+            executor.map(
+                getReinforcementDrawingSVGDataFromPayload,
+                payloads,
+                chunksize=max(1, len(payloads) // (4 * workers)),
+            )
+        )
+
+
 def makeStructuresReinforcementDrawing(
     structure_list=None,
     rebars_list=None,
@@ -235,6 +304,8 @@ def makeStructuresReinforcementDrawing(
     dimension_multi_rebar_text_position_type=(
         DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE
     ),
+    workers=None,
+    lod_threshold=0,
 ):
     """makeStructuresReinforcementDrawing([StructureList, RebarsList, View,
     RebarsStrokeWidth, RebarsColorStyle, RebarsColor, StructureStrokeWidth,
@@ -251,7 +322,7 @@ def makeStructuresReinforcementDrawing(
     DimensionRightOffsetIncrement, DimensionTopOffsetIncrement,
     DimensionBottomOffsetIncrement, SingleRebar_OuterDimension,
     MultiRebar_OuterDimension, SingleRebar_TextPositionType,
-    MultiRebar_TextPositionType]):
+    MultiRebar_TextPositionType, Workers, LODThreshold]):
     Generates Reinforcement Drawing SVG view for structures.
 
     structure_list is the list of structural objects. If not provided,
@@ -278,9 +349,168 @@ def makeStructuresReinforcementDrawing(
     dimension_rebars_filter_list is the list of rebars to perform dimensioning.
     Set it to None to dimension all visible rebars in drawing.
 
+    Batch mode:
+    set workers to number of worker processes to generate drawings of all
+    structures in batch. Drawing pages are created and laid out in current
+    process, drawings svg are generated from plain geometry of rebars in
+    worker processes and attached to drawing pages in order of structures.
+    Worker processes are only used in console mode (see
+    getReinforcementDrawingsSVGData()). Set it to None to generate drawing of
+    each structure on recompute of its drawing page.
+
+    Level of detail:
+    set lod_threshold to draw regular runs of more than lod_threshold
+    straight, u-shape, l-shape or bent rebars as their first and last rebars
+    with distribution annotation. Set it to 0 to draw all rebars.
+
     Returns dictionary with structure as key and corresponding reinforcement
     drawing page as value.
     """
+    view_drawing_pages_dict = makeStructuresReinforcementDrawings(
+        structure_list,
+        rebars_list,
+        (view,),
+        rebars_stroke_width,
+        rebars_color_style,
+        rebars_color,
+        structure_stroke_width,
+        structure_color_style,
+        structure_color,
+        drawing_left_offset,
+        drawing_top_offset,
+        drawing_min_right_offset,
+        drawing_min_bottom_offset,
+        drawing_max_width,
+        drawing_max_height,
+        template_file,
+        perform_dimensioning,
+        dimension_rebars_filter_list,
+        dimension_label_format,
+        dimension_font_family,
+        dimension_font_size,
+        dimension_stroke_width,
+        dimension_line_style,
+        dimension_line_color,
+        dimension_text_color,
+        dimension_single_rebar_line_start_symbol,
+        dimension_single_rebar_line_end_symbol,
+        dimension_multi_rebar_line_start_symbol,
+        dimension_multi_rebar_line_end_symbol,
+        dimension_line_mid_point_symbol,
+        dimension_left_offset,
+        dimension_right_offset,
+        dimension_top_offset,
+        dimension_bottom_offset,
+        dimension_left_offset_increment,
+        dimension_right_offset_increment,
+        dimension_top_offset_increment,
+        dimension_bottom_offset_increment,
+        dimension_single_rebar_outer_dim,
+        dimension_multi_rebar_outer_dim,
+        dimension_single_rebar_text_position_type,
+        dimension_multi_rebar_text_position_type,
+        workers,
+        lod_threshold,
+    )
+    if not view_drawing_pages_dict:
+        return None
+    return view_drawing_pages_dict[view]
+
+
+def makeStructuresReinforcementDrawings(
+    structure_list=None,
+    rebars_list=None,
+    views=("Front",),
+    rebars_stroke_width=REBARS_STROKE_WIDTH,
+    rebars_color_style=REBARS_COLOR_STYLE,
+    rebars_color=REBARS_COLOR,
+    structure_stroke_width=STRUCTURE_STROKE_WIDTH,
+    structure_color_style=STRUCTURE_COLOR_STYLE,
+    structure_color=STRUCTURE_COLOR,
+    drawing_left_offset=DRAWING_LEFT_OFFSET,
+    drawing_top_offset=DRAWING_TOP_OFFSET,
+    drawing_min_right_offset=DRAWING_MIN_RIGHT_OFFSET,
+    drawing_min_bottom_offset=DRAWING_MIN_BOTTOM_OFFSET,
+    drawing_max_width=DRAWING_MAX_WIDTH,
+    drawing_max_height=DRAWING_MAX_HEIGHT,
+    template_file=TEMPLATE_FILE,
+    perform_dimensioning=False,
+    dimension_rebars_filter_list=None,
+    dimension_label_format=DIMENSION_LABEL_FORMAT,
+    dimension_font_family=DIMENSION_FONT_FAMILY,
+    dimension_font_size=DIMENSION_FONT_SIZE,
+    dimension_stroke_width=DIMENSION_STROKE_WIDTH,
+    dimension_line_style=DIMENSION_LINE_STYLE,
+    dimension_line_color=DIMENSION_LINE_COLOR,
+    dimension_text_color=DIMENSION_TEXT_COLOR,
+    dimension_single_rebar_line_start_symbol=(
+        DIMENSION_SINGLE_REBAR_LINE_START_SYMBOL
+    ),
+    dimension_single_rebar_line_end_symbol=(
+        DIMENSION_SINGLE_REBAR_LINE_END_SYMBOL
+    ),
+    dimension_multi_rebar_line_start_symbol=(
+        DIMENSION_MULTI_REBAR_LINE_START_SYMBOL
+    ),
+    dimension_multi_rebar_line_end_symbol=(
+        DIMENSION_MULTI_REBAR_LINE_END_SYMBOL
+    ),
+    dimension_line_mid_point_symbol=DIMENSION_LINE_MID_POINT_SYMBOL,
+    dimension_left_offset=DIMENSION_LEFT_OFFSET,
+    dimension_right_offset=DIMENSION_RIGHT_OFFSET,
+    dimension_top_offset=DIMENSION_TOP_OFFSET,
+    dimension_bottom_offset=DIMENSION_BOTTOM_OFFSET,
+    dimension_left_offset_increment=DIMENSION_LEFT_OFFSET_INCREMENT,
+    dimension_right_offset_increment=DIMENSION_RIGHT_OFFSET_INCREMENT,
+    dimension_top_offset_increment=DIMENSION_TOP_OFFSET_INCREMENT,
+    dimension_bottom_offset_increment=DIMENSION_BOTTOM_OFFSET_INCREMENT,
+    dimension_single_rebar_outer_dim=DIMENSION_SINGLE_REBAR_OUTER_DIM,
+    dimension_multi_rebar_outer_dim=DIMENSION_MULTI_REBAR_OUTER_DIM,
+    dimension_single_rebar_text_position_type=(
+        DIMENSION_SINGLE_REBAR_TEXT_POSITION_TYPE
+    ),
+    dimension_multi_rebar_text_position_type=(
+        DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE
+    ),
+    workers=1,
+    lod_threshold=0,
+):
+    """makeStructuresReinforcementDrawings([StructureList, RebarsList, Views,
+    RebarsStrokeWidth, RebarsColorStyle, RebarsColor, StructureStrokeWidth,
+    StructureColorStyle, StructureColor, DrawingLeftOffset, DrawingTopOffset,
+    DrawingMinRightOffset, DrawingMinBottomOffset, DrawingMaxWidth,
+    DrawingMaxHeight, TemplateFile, PerformDimensioning,
+    DimensionRebarsFilterList, DimensionLabelFormat, DimensionFontFamily,
+    DimensionFontSize, DimensionStrokeWidth, DimensionLineStyle,
+    DimensionLineColor, DimensionTextColor,
+    SingleRebar_DimensionLineStartSymbol, SingleRebar_DimensionLineEndSymbol,
+    MultiRebar_DimensionLineStartSymbol, MultiRebar_DimensionLineEndSymbol,
+    DimensionLineMidPointSymbol, DimensionLeftOffset, DimensionRightOffset,
+    DimensionTopOffset, DimensionBottomOffset, DimensionLeftOffsetIncrement,
+    DimensionRightOffsetIncrement, DimensionTopOffsetIncrement,
+    DimensionBottomOffsetIncrement, SingleRebar_OuterDimension,
+    MultiRebar_OuterDimension, SingleRebar_TextPositionType,
+    MultiRebar_TextPositionType, Workers, LODThreshold]):
+    Generates Reinforcement Drawing SVG views for structures, for each view in
+    views.
+
+    views is the list of views, each can be "Front", "Rear", "Left", "Right",
+    "Top" or "Bottom".
+
+    Rebars are grouped by structure once for all views. Drawings svg are
+    generated from RebarGeometry of rebars, which is shared by all views, so
+    span axis and filleted base wire of each rebar are computed only once.
+
+    workers is the number of worker processes to generate drawings svg, as
+    in getReinforcementDrawingsSVGData(). Set it to None to generate drawing
+    of each structure on recompute of its drawing page, without sharing
+    geometry of rebars between views.
+
+    Other parameters are same as of makeStructuresReinforcementDrawing().
+
+    Returns dictionary with view as key and dictionary with structure as key
+    and corresponding reinforcement drawing page as value.
+    """
     struct_rebars_dict = getStructureRebarsDict(structure_list, rebars_list)
     if not struct_rebars_dict:
         FreeCAD.Console.PrintWarning(
@@ -288,32 +518,78 @@ def makeStructuresReinforcementDrawing(
             "Returning without drawing svg.\n"
         )
         return None
-    struct_drawing_page_dict = {}
-    for structure in struct_rebars_dict:
-        struct_drawing_page_dict[structure] = makeReinforcementDrawing(
-            structure,
-            struct_rebars_dict[structure],
-            view,
-            rebars_stroke_width,
-            rebars_color_style,
-            rebars_color,
-            structure_stroke_width,
-            structure_color_style,
-            structure_color,
-            drawing_left_offset,
-            drawing_top_offset,
-            drawing_min_right_offset,
-            drawing_min_bottom_offset,
-            drawing_max_width,
-            drawing_max_height,
-            template_file,
-            dimension_left_offset,
-            dimension_right_offset,
-            dimension_top_offset,
-            dimension_bottom_offset,
-        )
+    view_drawing_pages_dict = {}
+    drawing_pages = []
+    payloads = []
+    # RebarGeometry of rebars, shared by drawings of all views
+    rebar_geometries = {}
+    for view in views:
+        view_drawing_pages_dict[view] = {}
+        for structure in struct_rebars_dict:
+            drawing_page = makeReinforcementDrawing(
+                structure,
+                struct_rebars_dict[structure],
+                view,
+                rebars_stroke_width,
+                rebars_color_style,
+                rebars_color,
+                structure_stroke_width,
+                structure_color_style,
+                structure_color,
+                drawing_left_offset,
+                drawing_top_offset,
+                drawing_min_right_offset,
+                drawing_min_bottom_offset,
+                drawing_max_width,
+                drawing_max_height,
+                template_file,
+                dimension_left_offset,
+                dimension_right_offset,
+                dimension_top_offset,
+                dimension_bottom_offset,
+                recompute=workers is None,
+                lod_threshold=lod_threshold,
+            )
+            view_drawing_pages_dict[view][structure] = drawing_page
+            drawing_pages.append(drawing_page)
+            if workers is not None:
+                drawing_view = drawing_page.Views[0]
+                view_plane = drawing_view.Proxy.updateLayout(drawing_view)
+                color_styles = drawing_view.Proxy.getColorStyles(drawing_view)
+                payloads.append(
+                    getReinforcementDrawingSVGPayload(
+                        structure,
+                        drawing_view.Rebars,
+                        view_plane,
+                        drawing_view.RebarsStrokeWidth.Value
+                        / drawing_view.Scale,
+                        color_styles[0],
+                        drawing_view.StructureStrokeWidth.Value
+                        / drawing_view.Scale,
+                        color_styles[1],
+                        drawing_view.DrawingBounds,
+                        drawing_view.LODThreshold,
+                        DIMENSION_FONT_SIZE / drawing_view.Scale,
+                        rebar_geometries,
+                    )
+                )
+
+    if workers is not None:
+        drawings_data = getReinforcementDrawingsSVGData(payloads, workers)
+        for drawing_page, drawing_data in zip(drawing_pages, drawings_data):
+            drawing_view = drawing_page.Views[0]
+            drawing_view.Proxy.setSVGData(
+                drawing_view,
+                drawing_data["svg"],
+                [
+                    drawing_page.Document.getObject(rebar_name)
+                    for rebar_name in drawing_data["rebars"]
+                ],
+            )
+            drawing_page.recompute(True)
+
+    for drawing_page in drawing_pages:
         if perform_dimensioning:
-            drawing_page = struct_drawing_page_dict[structure]
             drawing_view = drawing_page.Views[0]
             rebars = drawing_view.VisibleRebars
             if dimension_rebars_filter_list:
@@ -344,4 +620,4 @@ def makeStructuresReinforcementDrawing(
                     dimension_single_rebar_text_position_type,
                     dimension_multi_rebar_text_position_type,
                 )
-    return struct_drawing_page_dict
+    return view_drawing_pages_dict
@@ -27,11 +27,13 @@ __url__ = "https://www.freecadweb.org"
 
 
 import math
-from typing import Union
+from typing import Iterator, TextIO, Union
 from xml.etree import ElementTree
 
 import FreeCAD
 
+from RebarProfiling import profiled
+
 
 # --------------------------------------------------------------------------
 # Generic functions
@@ -57,6 +59,134 @@ def getSVGRootElement() -> ElementTree.Element:
     return svg
 
 
+XML_DECLARATION = '<?xml version="1.0" ?>'
+
+
+def escapeSVGData(data: str) -> str:
+    """Returns data with xml special characters escaped, as escaped by
+    xml.dom.minidom for text and attribute values."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def iterSVGChunks(
+    element: ElementTree.Element,
+    pretty_print: bool = True,
+    indent: str = "  ",
+    level: int = 0,
+) -> Iterator[str]:
+    """Serialize svg element incrementally.
+
+    The pretty printed output has same document structure and formatting as
+    of minidom.parseString(ElementTree.tostring(element)).toprettyxml(), but
+    element tree is neither converted to whole string nor parsed again. The
+    element tree is expected to have unqualified tag and attribute names, as
+    generated by getSVGRootElement() with namespaces set as attributes.
+
+    Parameters
+    ----------
+    element: ElementTree.Element
+        The svg element to serialize.
+    pretty_print: bool, optional
+        If True, then each element will be written on new line with
+        indentation. Otherwise, svg will be serialized without whitespaces
+        between elements.
+        Default is True.
+    indent: str, optional
+        The indentation string for each level of element.
+        Default is "  ".
+    level: int, optional
+        The indentation level of element.
+        Default is 0.
+
+    Returns
+    -------
+    Iterator[str]
+        The iterator over svg string chunks.
+    """
+    if pretty_print:
+        newline = "\n"
+        element_indent = indent * level
+        child_indent = element_indent + indent
+    else:
+        newline = element_indent = child_indent = ""
+
+    # Namespace declarations are written before other attributes, as by
+    # minidom
+    attributes = sorted(
+        element.attrib.items(),
+        key=lambda item: not (
+            item[0] == "xmlns" or item[0].startswith("xmlns:")
+        ),
+    )
+    start_tag = "{}<{}{}".format(
+        element_indent,
+        element.tag,
+        "".join(
+            ' {}="{}"'.format(name, escapeSVGData(str(value)))
+            for name, value in attributes
+        ),
+    )
+    if len(element) == 0:
+        if element.text:
+            yield "{}>{}</{}>{}".format(
+                start_tag, escapeSVGData(element.text), element.tag, newline
+            )
+        else:
+            yield start_tag + "/>" + newline
+        return
+
+    yield start_tag + ">" + newline
+    if element.text:
+        yield child_indent + escapeSVGData(element.text) + newline
+    for child in element:
+        yield from iterSVGChunks(child, pretty_print, indent, level + 1)
+        if child.tail:
+            yield child_indent + escapeSVGData(child.tail) + newline
+    yield "{}</{}>{}".format(element_indent, element.tag, newline)
+
+
+@profiled
+def getSVGString(
+    svg: ElementTree.Element,
+    pretty_print: bool = True,
+    xml_declaration: bool = True,
+) -> str:
+    """Returns svg string of svg element, see iterSVGChunks().
+
+    If xml_declaration is True, then svg string will start with xml
+    declaration.
+    """
+    chunks = iterSVGChunks(svg, pretty_print)
+    if xml_declaration:
+        return XML_DECLARATION + "\n" + "".join(chunks)
+    return "".join(chunks)
+
+
+@profiled
+def writeSVG(
+    svg: ElementTree.Element,
+    svg_file: TextIO,
+    pretty_print: bool = True,
+    xml_declaration: bool = True,
+):
+    """Stream svg element to svg_file, which is file object opened for writing
+    text, chunk by chunk without creating whole svg string, see
+    iterSVGChunks().
+
+    If xml_declaration is True, then xml declaration will be written before
+    svg.
+    """
+    if xml_declaration:
+        svg_file.write(XML_DECLARATION + "\n")
+    for chunk in iterSVGChunks(svg, pretty_print):
+        svg_file.write(chunk)
+
+
 def getPointSVG(
     point: FreeCAD.Vector, radius: Union[float, str] = 1, fill: str = "black"
 ) -> ElementTree.Element:
@@ -87,6 +217,8 @@ def getPointSVG(
 
 
 def isPointInSVG(point, svg):
+    if isinstance(svg, SVGPrimitivesRegistry):
+        return svg.hasPoint(point)
     if (
         svg.find(
             './/circle[@cx="{}"][@cy="{}"]'.format(
@@ -115,6 +247,8 @@ def getLineSVG(p1, p2, stroke_width=0.35, color="black"):
 
 
 def isLineInSVG(p1, p2, svg):
+    if isinstance(svg, SVGPrimitivesRegistry):
+        return svg.hasLine(p1, p2)
     if (
         svg.find(
             './/line[@x1="{}"][@y1="{}"][@x2="{}"][@y2="{}"]'.format(
@@ -137,6 +271,97 @@ def isLineInSVG(p1, p2, svg):
         return False
 
 
+class SVGPrimitivesRegistry:
+    """A hash-indexed registry of the line, point (circle) and round corner
+    (arc path) svg primitives of a drawing, keyed by their rounded svg
+    coordinates.
+
+    It answers the same questions as isLineInSVG()/isPointInSVG() in O(1)
+    instead of searching the whole svg element tree for every edge. Lines are
+    keyed independent of their direction, points by their centre and round
+    corners by their exact path data (including sweep flag), so a lookup
+    matches exactly what the corresponding XPath search would match.
+    """
+
+    def __init__(self, svg: ElementTree.Element = None):
+        """Create registry, optionally populated from primitives of svg."""
+        self.lines = set()
+        self.points = set()
+        self.round_corners = set()
+        if svg is not None:
+            self.addSVG(svg)
+
+    @staticmethod
+    def getLineKey(x1, y1, x2, y2):
+        p1 = (str(x1), str(y1))
+        p2 = (str(x2), str(y2))
+        return (p1, p2) if p1 <= p2 else (p2, p1)
+
+    @staticmethod
+    def getRoundCornerPathData(p1, p2, radius, flag_sweep):
+        """Returns path data "d" of round corner svg from p1 to p2."""
+        return (
+            "M{x1} {y1} A{radius} {radius} 0 0 {flag_sweep} {x2} {y2}".format(
+                x1=round(p1.x),
+                y1=round(p1.y),
+                x2=round(p2.x),
+                y2=round(p2.y),
+                radius=round(radius),
+                flag_sweep=flag_sweep,
+            )
+        )
+
+    def addLine(self, p1: FreeCAD.Vector, p2: FreeCAD.Vector):
+        self.lines.add(
+            self.getLineKey(round(p1.x), round(p1.y), round(p2.x), round(p2.y))
+        )
+
+    def hasLine(self, p1: FreeCAD.Vector, p2: FreeCAD.Vector) -> bool:
+        return (
+            self.getLineKey(round(p1.x), round(p1.y), round(p2.x), round(p2.y))
+            in self.lines
+        )
+
+    def addPoint(self, point: FreeCAD.Vector):
+        self.points.add((str(round(point.x)), str(round(point.y))))
+
+    def hasPoint(self, point: FreeCAD.Vector) -> bool:
+        return (str(round(point.x)), str(round(point.y))) in self.points
+
+    def addRoundCorner(self, p1, p2, radius, flag_sweep):
+        self.round_corners.add(
+            self.getRoundCornerPathData(p1, p2, radius, flag_sweep)
+        )
+
+    def hasRoundCorner(self, p1, p2, radius, flag_sweep) -> bool:
+        return (
+            self.getRoundCornerPathData(p1, p2, radius, flag_sweep)
+            in self.round_corners
+        )
+
+    def addSVG(self, svg: ElementTree.Element):
+        """Register all line, circle and path primitives present in svg
+        element."""
+        for line in svg.iter("line"):
+            coordinates = [line.get(attr) for attr in ("x1", "y1", "x2", "y2")]
+            if None not in coordinates:
+                self.lines.add(self.getLineKey(*coordinates))
+        for circle in svg.iter("circle"):
+            cx, cy = circle.get("cx"), circle.get("cy")
+            if cx is not None and cy is not None:
+                self.points.add((cx, cy))
+        for path in svg.iter("path"):
+            path_data = path.get("d")
+            if path_data is not None:
+                self.round_corners.add(path_data)
+
+    def update(self, registry: "SVGPrimitivesRegistry"):
+        """Register all primitives of other registry."""
+        self.lines.update(registry.lines)
+        self.points.update(registry.points)
+        self.round_corners.update(registry.round_corners)
+
+
 def getLinePathElement(
     points_list,
     stroke_width=0.35,
@@ -26,8 +26,14 @@ __author__ = "Shiv Charan"
 __url__ = "https://www.freecadweb.org"
 
 import FreeCAD
-from Rebarfunc import showWarning
-from typing import Union, Tuple, Optional
+from Rebarfunc import (
+    batch_recompute,
+    makeReinforcementOfStructures,
+    recompute,
+    showWarning,
+)
+from RebarProfiling import profiled
+from typing import Dict, List, Union, Tuple, Optional
 from SlabReinforcement.SlabReinforcementObject import (
     SlabReinforcementGroup,
     _SlabReinforcementViewProviderGroup,
@@ -37,6 +43,8 @@ if FreeCAD.GuiUp:
     import FreeCADGui
 
 
+@profiled
+@batch_recompute()
 def makeSlabReinforcement(
     parallel_rebar_type: str,
     parallel_front_cover: float,
@@ -321,11 +329,40 @@ def makeSlabReinforcement(
             slabReinforcementGroup.CrossDistributionRebarsSpacing = (
                 cross_distribution_rebars_amount_spacing_value
             )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
 
     return slabReinforcementGroup
 
 
+def makeSlabReinforcements(
+    structure_facename_list: List[Tuple],
+    **config,
+) -> Dict:
+    """Generate Slab Reinforcement of multiple structures at once
+
+    Parameters
+    ----------
+    structure_facename_list: list of tuple
+        List of tuples (structure, facename) to be reinforced. Each structure
+        must appear only once.
+    **config
+        Keyword arguments of makeSlabReinforcement(), except structure and
+        facename, shared by all structures.
+
+    Returns
+    -------
+    dict
+        Dictionary with structure as key and created SlabReinforcementGroup
+        (None on error) as value. Document is recomputed only once, after
+        all structures are reinforced.
+    """
+    return makeReinforcementOfStructures(
+        makeSlabReinforcement, structure_facename_list, config
+    )
+
+
+@profiled
+@batch_recompute()
 def editSlabReinforcement(
     slabReinforcementGroup: SlabReinforcementGroup,
     parallel_rebar_type: str,
@@ -599,5 +636,5 @@ def editSlabReinforcement(
             slabReinforcementGroup.CrossDistributionRebarsSpacing = (
                 cross_distribution_rebars_amount_spacing_value
             )
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return slabReinforcementGroup
@@ -32,6 +32,8 @@ from Rebarfunc import (
     getFacenamesforBeamReinforcement,
     getParametersOfFace,
     get_rebar_amount_from_spacing,
+    batch_recompute,
+    recompute,
 )
 from StraightRebar import makeStraightRebar, editStraightRebar
 from UShapeRebar import makeUShapeRebar, editUShapeRebar
@@ -777,6 +779,7 @@ class SlabReinforcementGroup:
     def execute(self, obj):
         pass
 
+    @batch_recompute()
     def makeOrEditSlabReinforcement(self, obj):
         """Create or update Slab Reinforcement"""
         mesh_cover_along = obj.MeshCoverAlong
@@ -1946,7 +1949,7 @@ class SlabReinforcementGroup:
         obj.addObjects(parallel_distribution_rebars)
         obj.ParallelDistributionRebars = parallel_distribution_rebars
 
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
 
     def set_minimum_seperation_distance(
         self, relative_distance, absolute_distance, min_seperation_distance
@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 import math
 from pathlib import Path
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -46,6 +45,9 @@ from Rebarfunc import (
     extendedTangentLength,
     extendedTangentPartLength,
     get_rebar_amount_from_spacing,
+    recompute,
+    batch_recompute,
+    getStructureExtent,
 )
 
 
@@ -420,11 +422,7 @@ def makeStirrup(
             name="Stirrup",
         )
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             line,
@@ -516,10 +514,11 @@ def makeStirrup(
     else:
         rebar.AmountCheck = False
         rebar.TrueSpacing = amount_spacing_value
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar
 
 
+@batch_recompute()
 def editStirrup(
     Rebar,
     l_cover,
@@ -584,7 +583,6 @@ def editStirrup(
         FaceNormal,
     )
     Rebar.Base.Points = points
-    FreeCAD.ActiveDocument.recompute()
     Rebar.Direction = FaceNormal.negative()
     Rebar.OffsetStart = f_cover + diameter / 2
     Rebar.OffsetEnd = f_cover + diameter / 2
@@ -594,18 +592,12 @@ def editStirrup(
     Rebar.Diameter = diameter
     if amount_spacing_check:
         Rebar.Amount = amount_spacing_value
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = False
     Rebar.FrontCover = f_cover
     Rebar.LeftCover = l_cover
@@ -613,7 +605,7 @@ def editStirrup(
     Rebar.TopCover = t_cover
     Rebar.BottomCover = b_cover
     Rebar.TrueSpacing = amount_spacing_value
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return Rebar
 
 
@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 from pathlib import Path
 from typing import Tuple, List
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -45,6 +44,10 @@ from Rebarfunc import (
     check_selected_face,
     facenormalDirection,
     get_rebar_amount_from_spacing,
+    recompute,
+    batch_recompute,
+    setSketchLinePoints,
+    getStructureExtent,
 )
 
 
@@ -385,7 +388,7 @@ def makeStraightRebar(
         sketch.Support = [(structure, facename)]
     else:
         sketch.AttachmentSupport = [(structure, facename)]
-    FreeCAD.ActiveDocument.recompute()
+    recompute(sketch)
     sketch.addGeometry(Part.LineSegment(points[0], points[1]), False)
     if amount_spacing_check:
         rebar = Arch.makeRebar(
@@ -396,13 +399,9 @@ def makeStraightRebar(
             f_cover + diameter / 2,
             name="StraightRebar",
         )
-        FreeCAD.ActiveDocument.recompute()
+        recompute()
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             sketch,
@@ -483,10 +482,11 @@ def makeStraightRebar(
     else:
         rebar.AmountCheck = False
         rebar.TrueSpacing = amount_spacing_value
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return rebar
 
 
+@batch_recompute()
 def editStraightRebar(
     Rebar,
     f_cover,
@@ -506,7 +506,7 @@ def editStraightRebar(
             sketch.Support = [(structure, facename)]
         else:
             sketch.AttachmentSupport = [(structure, facename)]
-        FreeCAD.ActiveDocument.recompute()
+        recompute(sketch)
     # Check if sketch support is empty.
     if hasattr(sketch, "Support"):
         if not sketch.Support:
@@ -543,26 +543,17 @@ def editStraightRebar(
         diameter,
         facenormalDirection(structure, facename),
     )
-    sketch.movePoint(0, 1, points[0], 0)
-    FreeCAD.ActiveDocument.recompute()
-    sketch.movePoint(0, 2, points[1], 0)
-    FreeCAD.ActiveDocument.recompute()
+    setSketchLinePoints(sketch, points)
     Rebar.OffsetStart = f_cover + diameter / 2
     Rebar.OffsetEnd = f_cover + diameter / 2
     if amount_spacing_check:
         Rebar.Amount = amount_spacing_value
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getStructureExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
-        FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = False
     Rebar.FrontCover = f_cover
     Rebar.RightTopCover = rt_cover
@@ -572,7 +563,7 @@ def editStraightRebar(
     Rebar.TrueSpacing = amount_spacing_value
     Rebar.Diameter = diameter
     Rebar.Orientation = orientation
-    FreeCAD.ActiveDocument.recompute()
+    recompute()
     return Rebar
 
 